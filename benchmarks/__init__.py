@@ -0,0 +1 @@
+"""Offline benchmarks against a local mock cnblogs server (see ``benchmarks/README.md``)."""
@@ -0,0 +1,96 @@
+"""
+Import-time benchmark: how long a short-lived script waits for pycnblogs.
+
+Usage::
+
+    python -m benchmarks.import_time                  # default budget
+    python -m benchmarks.import_time --budget 30 --repeat 20
+
+Each statement runs in a fresh interpreter, so nothing is cached in
+``sys.modules``; only the statement itself is timed, not interpreter
+startup. The exit status is 1 when reaching ``pycnblogs.CnblogsClient``
+(what ``pycnblogs login`` and cron scripts do first) exceeds the budget.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# What cron scripts and the command line typically do before the first request
+STATEMENTS = [
+    "import pycnblogs",
+    "import pycnblogs; pycnblogs.CnblogsClient.login",
+    "import pycnblogs; pycnblogs.CnblogsClient(pat='x').__enter__()",
+]
+
+# Modules that should only be loaded once a client actually sends requests
+HEAVY_MODULES = ("requests", "urllib3", "httpx", "asyncio")
+
+# Statement held to the budget: importing the client module without sending requests
+BUDGETED = STATEMENTS[1]
+
+# Median milliseconds allowed for ``BUDGETED``
+DEFAULT_BUDGET = 60.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<statement>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in sys.argv[2:] if m in sys.modules]]))
+"""
+
+
+@dataclass
+class ImportTiming:
+    """Median time of a statement in a fresh interpreter and the heavy modules it loaded."""
+    statement: str
+    median_ms: float
+    heavy_modules: List[str]
+
+
+def probe(statement: str) -> Tuple[float, List[str]]:
+    """Run ``statement`` once in a new interpreter: (seconds, heavy modules loaded)."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, statement, *HEAVY_MODULES],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    elapsed, modules = json.loads(output)
+    return elapsed, modules
+
+
+def measure(statement: str, repeat: int = 10) -> ImportTiming:
+    """Median of ``repeat`` fresh-interpreter runs of ``statement``."""
+    runs = [probe(statement) for _ in range(max(repeat, 1))]
+    return ImportTiming(statement, statistics.median(t for t, _ in runs) * 1000, runs[-1][1])
+
+
+def format_results(results: List[ImportTiming]) -> str:
+    width = max(len(r.statement) for r in results)
+    lines = [f"{'statement':<{width}}  {'ms':>7}  heavy modules loaded"]
+    for r in results:
+        lines.append(f"{r.statement:<{width}}  {r.median_ms:>7.1f}  {', '.join(r.heavy_modules) or '-'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure how long importing pycnblogs takes.")
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per statement")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="milliseconds allowed for reaching pycnblogs.CnblogsClient")
+    args = parser.parse_args(argv)
+    
+    results = [measure(statement, args.repeat) for statement in STATEMENTS]
+    print(format_results(results))
+    budgeted = results[STATEMENTS.index(BUDGETED)]
+    if budgeted.median_ms > args.budget:
+        print(f"\n`{budgeted.statement}` took {budgeted.median_ms:.1f} ms, over the {args.budget:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
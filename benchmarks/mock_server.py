@@ -0,0 +1,276 @@
+"""Local stand-in for the cnblogs APIs used by the benchmarks."""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+_POST = re.compile(r"^/blog/posts/(\d+)$")
+_ING_LIST = re.compile(r"^/openapi/statuses/@(\d+)$")
+_ING_COMMENTS = re.compile(r"^/openapi/statuses/(\d+)/comments$")
+
+
+class MockCnblogsServer:
+    """
+    Threaded HTTP server emulating the blog backend and open API.
+    
+    ``i.cnblogs.com/api`` is served under ``/blog`` and ``api.cnblogs.com/api``
+    under ``/openapi``; pass :attr:`client_options` to the client. Every request
+    is delayed by ``latency`` seconds (a ``(low, high)`` tuple draws
+    uniformly) and fails with 503 with probability ``error_rate``.
+    
+    Args:
+        posts: Number of posts in the fake blog
+        body_size: Size in characters of each post body
+        latency: Seconds added to every response
+        error_rate: Fraction of requests answered with 503
+        seed: Seed of the latency and error draws
+        port: Port to listen on (0 picks a free one)
+    """
+    
+    def __init__(
+        self,
+        posts: int = 1000,
+        body_size: int = 4096,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        port: int = 0,
+    ):
+        self.posts: Dict[int, Dict[str, Any]] = {
+            post_id: _make_post(post_id, body_size) for post_id in range(1, posts + 1)
+        }
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests: Counter = Counter()
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = posts + 1
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def _reply(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"null")
+                status, body = server.handle(self.command, self.path, payload)
+                data = json.dumps(body, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                with server._lock:
+                    server.bytes_sent += len(data)
+            
+            do_GET = do_POST = do_DELETE = _reply
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self) -> "MockCnblogsServer":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def stats(self, reset: bool = False) -> Dict[str, Any]:
+        """Requests per endpoint and bytes sent; ``reset`` zeroes the counters.
+        
+        Also served as ``GET /__stats`` (``DELETE /__stats`` resets).
+        """
+        with self._lock:
+            stats = {"requests": dict(self.requests), "bytes_sent": self.bytes_sent}
+            if reset:
+                self.requests.clear()
+                self.bytes_sent = 0
+        return stats
+    
+    @property
+    def client_options(self) -> Dict[str, str]:
+        """Base URL arguments pointing a ``CnblogsClient`` at this server."""
+        return {"blog_backend": f"{self.url}/blog", "openapi": f"{self.url}/openapi"}
+    
+    def handle(self, method: str, path: str, payload: Any) -> Tuple[int, Any]:
+        """Answer one request: ``(status, JSON body)``."""
+        parts = urlsplit(path)
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        if parts.path == "/__stats":
+            return 200, self.stats(reset=method == "DELETE")
+        endpoint = f"{method} {_endpoint(parts.path)}"
+        
+        with self._lock:
+            self.requests[endpoint] += 1
+            delay = self.latency if isinstance(self.latency, (int, float)) else self._random.uniform(*self.latency)
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return 503, {"message": "Service Unavailable"}
+        
+        return self._dispatch(method, parts.path, query, payload)
+    
+    def _dispatch(self, method: str, path: str, query: Dict[str, str], payload: Any) -> Tuple[int, Any]:
+        if method == "GET" and path == "/blog/posts/list":
+            page, size = int(query.get("p", 1)), int(query.get("s", 10))
+            with self._lock:
+                ids = sorted(self.posts, reverse=True)[(page - 1) * size:page * size]
+                listed = [{k: v for k, v in self.posts[i].items() if k not in ("postBody", "tags")} for i in ids]
+                return 200, {"postList": listed, "postsCount": len(self.posts)}
+        
+        match = _POST.match(path)
+        if match:
+            with self._lock:
+                post = self.posts.get(int(match.group(1)))
+                if post is None:
+                    return 404, {"message": "Not Found"}
+                if method == "DELETE":
+                    del self.posts[post["id"]]
+                    return 200, {}
+                return 200, {"blogPost": dict(post)}
+        
+        if method == "POST" and path == "/blog/posts":
+            with self._lock:
+                post_id = payload.get("id")
+                if post_id is None:
+                    post_id = self._next_id
+                    self._next_id += 1
+                    self.posts[post_id] = _make_post(post_id, 0)
+                elif post_id not in self.posts:
+                    return 404, {"message": "Not Found"}
+                post = self.posts[post_id]
+                post.update(title=payload["title"], postBody=payload["postBody"], isPublished=payload["isPublished"])
+                post["dateUpdated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            return 200, {"id": post_id}
+        
+        if method == "GET" and path == "/openapi/users":
+            return 200, _USER
+        
+        match = _ING_LIST.match(path)
+        if match:
+            return 200, [_make_ing(i) for i in _page_ids(query)]
+        if method == "POST" and (path == "/openapi/statuses" or _ING_COMMENTS.match(path)):
+            return 200, {}
+        if path == "/openapi/newsitems/@sitehome":
+            return 200, [_make_news(i) for i in _page_ids(query)]
+        if path == "/openapi/wz":
+            return 200, [_make_fav(i) for i in _page_ids(query)]
+        return 404, {"message": "Not Found"}
+
+
+def _endpoint(path: str) -> str:
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+def _page_ids(query: Dict[str, str]) -> range:
+    page, size = int(query.get("pageIndex", 1)), int(query.get("pageSize", 10))
+    return range((page - 1) * size + 1, page * size + 1)
+
+
+def _make_post(post_id: int, body_size: int) -> Dict[str, Any]:
+    return {
+        "id": post_id,
+        "title": f"Benchmark post {post_id}",
+        "url": f"//www.cnblogs.com/bench/p/{post_id}",
+        "datePublished": "2024-01-01T08:00:00",
+        "dateUpdated": "2024-01-01T08:00:00",
+        "isDraft": False,
+        "isPinned": False,
+        "isPublished": True,
+        "feedBackCount": post_id % 7,
+        "postBody": ("正文 lorem ipsum " * (body_size // 16 + 1))[:body_size],
+        "tags": ["bench"],
+    }
+
+
+def _make_ing(ing_id: int) -> Dict[str, Any]:
+    return {
+        "Id": ing_id,
+        "Content": f"闪存 {ing_id}",
+        "UserAlias": f"user{ing_id % 50}",
+        "UserDisplayName": f"User {ing_id % 50}",
+        "DateAdded": "2024-01-01T08:00:00",
+        "CommentCount": ing_id % 3,
+        "LuckyCount": 0,
+    }
+
+
+def _make_news(news_id: int) -> Dict[str, Any]:
+    return {
+        "Id": news_id,
+        "Title": f"News {news_id}",
+        "Summary": "summary " * 20,
+        "Url": f"https://news.cnblogs.com/n/{news_id}/",
+        "ViewCount": news_id * 3,
+        "CommentCount": news_id % 5,
+        "DiggCount": news_id % 11,
+        "DateAdded": "2024-01-01T08:00:00",
+    }
+
+
+def _make_fav(fav_id: int) -> Dict[str, Any]:
+    return {
+        "Id": fav_id,
+        "Title": f"Favorite {fav_id}",
+        "Url": f"https://www.cnblogs.com/bench/p/{fav_id}",
+        "DateAdded": "2024-01-01T08:00:00",
+    }
+
+
+_USER = {
+    "UserId": "00000000-0000-0000-0000-000000000000",
+    "SpaceUserID": 1,
+    "BlogId": 1,
+    "DisplayName": "bench",
+    "Face": "",
+    "Avatar": "",
+    "Seniority": "1年",
+    "BlogApp": "bench",
+    "FollowingCount": 0,
+    "FollowerCount": 0,
+    "IsVip": False,
+    "Joined": "2024-01-01T08:00:00",
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a fake cnblogs API for benchmarks.")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--body-size", type=int, default=4096)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    server = MockCnblogsServer(args.posts, args.body_size, args.latency, args.error_rate, args.seed, args.port)
+    print(server.url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
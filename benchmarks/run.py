@@ -0,0 +1,220 @@
+"""
+Offline benchmarks of the client against the local mock server.
+
+Usage::
+
+    python -m benchmarks.run                          # all scenarios
+    python -m benchmarks.run list bulk_fetch --latency 0.02 --error-rate 0.01
+    python -m benchmarks.run --json before.json       # save for comparison
+
+The mock server runs in a child process so it does not compete with the
+client for the GIL or show up in the client's memory measurements.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from pycnblogs import CnblogsClient, PostOperation, RequestHooks, RetryPolicy
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one scenario (times in seconds, memory in bytes)."""
+    scenario: str
+    items: int
+    elapsed: float
+    requests: int
+    requests_per_sec: float
+    p50: Optional[float]
+    p99: Optional[float]
+    peak_memory: Optional[int] = None
+    server_requests: Dict[str, int] = field(default_factory=dict)
+    server_bytes: int = 0
+
+
+def bench_list(client: CnblogsClient, args: argparse.Namespace) -> int:
+    """Page through every post (titles and metadata only)."""
+    return sum(1 for _ in client.post.iter_all(limit=args.posts))
+
+
+def bench_list_ings(client: CnblogsClient, args: argparse.Namespace) -> int:
+    """Page through ``--posts`` ings as compact records."""
+    return sum(1 for _ in client.ing.iter_all(limit=args.posts, compact=True))
+
+
+def bench_bulk_fetch(client: CnblogsClient, args: argparse.Namespace) -> int:
+    """Fetch ``--fetch`` full posts concurrently."""
+    ids = range(1, min(args.fetch, args.posts) + 1)
+    return sum(1 for _, result in client.post.get_many(ids, args.concurrency) if result.is_ok())
+
+
+def bench_update(client: CnblogsClient, args: argparse.Namespace) -> int:
+    """Rewrite ``--fetch`` posts through ``PostAPI.bulk`` (one request each)."""
+    body = "更新 " * (args.body_size // 3)
+    operations = [
+        PostOperation.update(post_id, title=f"Updated {post_id}", body=body, publish=True)
+        for post_id in range(1, min(args.fetch, args.posts) + 1)
+    ]
+    return len(client.post.bulk(operations, args.concurrency).succeeded)
+
+
+SCENARIOS: Dict[str, Callable[[CnblogsClient, argparse.Namespace], int]] = {
+    "list": bench_list,
+    "list_ings": bench_list_ings,
+    "bulk_fetch": bench_bulk_fetch,
+    "update": bench_update,
+}
+
+
+def run_scenario(name: str, url: str, args: argparse.Namespace, measure_memory: bool = False) -> BenchmarkResult:
+    """Run one scenario against the mock server at ``url``."""
+    latencies: List[float] = []
+    hooks = RequestHooks()
+    hooks.add("after_response", lambda info: latencies.append(info.elapsed))
+    
+    retry = RetryPolicy(backoff_factor=args.backoff) if args.backoff is not None else RetryPolicy()
+    with CnblogsClient(
+        pat="benchmark",
+        hooks=hooks,
+        retry=retry,
+        stream_json=args.stream_json,
+        blog_backend=f"{url}/blog",
+        openapi=f"{url}/openapi",
+    ) as client:
+        requests.delete(f"{url}/__stats")
+        if measure_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        items = SCENARIOS[name](client, args)
+        elapsed = time.perf_counter() - started
+        peak = None
+        if measure_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    stats = requests.get(f"{url}/__stats").json()
+    
+    return BenchmarkResult(
+        scenario=name,
+        items=items,
+        elapsed=elapsed,
+        requests=len(latencies),
+        requests_per_sec=len(latencies) / elapsed if elapsed else 0.0,
+        p50=_percentile(latencies, 50),
+        p99=_percentile(latencies, 99),
+        peak_memory=peak,
+        server_requests=stats["requests"],
+        server_bytes=stats["bytes_sent"],
+    )
+
+
+def run(names: List[str], url: str, args: argparse.Namespace) -> List[BenchmarkResult]:
+    """
+    Run each scenario ``--repeat`` times and keep the fastest run.
+    
+    Peak memory comes from one extra run under :mod:`tracemalloc`, which
+    slows the client down too much to be timed.
+    """
+    results = []
+    for name in names:
+        runs = [run_scenario(name, url, args) for _ in range(args.repeat)]
+        best = min(runs, key=lambda result: result.elapsed)
+        if args.memory:
+            best.peak_memory = run_scenario(name, url, args, measure_memory=True).peak_memory
+        results.append(best)
+    return results
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Results as a text table."""
+    header = f"{'scenario':<12}{'items':>8}{'requests':>10}{'time (s)':>10}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'peak (MB)':>11}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.scenario:<12}{result.items:>8}{result.requests:>10}{result.elapsed:>10.3f}"
+            f"{result.requests_per_sec:>10.1f}{_ms(result.p50):>10}{_ms(result.p99):>10}"
+            f"{_mb(result.peak_memory):>11}"
+        )
+    return "\n".join(lines)
+
+
+def start_server(args: argparse.Namespace) -> subprocess.Popen:
+    """Start ``benchmarks.mock_server`` in a child process; its URL is the first line of stdout."""
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.mock_server",
+            "--posts", str(args.posts),
+            "--body-size", str(args.body_size),
+            "--latency", str(args.latency),
+            "--error-rate", str(args.error_rate),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+def _mb(size: Optional[int]) -> str:
+    return "-" if size is None else f"{size / 1024 / 1024:.2f}"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark pycnblogs against a local mock server.")
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--posts", type=int, default=2000, help="posts (and ings) served by the mock")
+    parser.add_argument("--fetch", type=int, default=200, help="posts fetched/updated by bulk_fetch and update")
+    parser.add_argument("--body-size", type=int, default=8192, help="post body size in characters")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=None, help="retry backoff factor (default: client default)")
+    parser.add_argument("--stream-json", action="store_true", help="enable streaming JSON decoding")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc run")
+    parser.add_argument("--url", help="use an already running mock server")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+    
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    process = None
+    url = args.url
+    if url is None:
+        process = start_server(args)
+        url = process.stdout.readline().strip()
+    try:
+        results = run(names, url, args)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
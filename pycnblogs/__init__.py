@@ -4,39 +4,174 @@ pycnblogs - Python SDK for Cnblogs API
 A Python module for interacting with Cnblogs (博客园) API.
 """
 
-# 主客户端
-from .client import CnblogsClient
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# 数据模型
-from .models import PostEntry, UserInfo, IngEntry, NewsEntry, FavEntry
+# 公开名称 -> 所在模块；首次访问时才导入（PEP 562），
+# 这样 `import pycnblogs` 不会加载 requests/httpx，命令行工具启动更快
+_LAZY = {
+    # 主客户端
+    "CnblogsClient": ".client",
+    "AsyncCnblogsClient": ".async_client",
+    # 数据模型
+    "PostEntry": ".models",
+    "UserInfo": ".models",
+    "IngEntry": ".models",
+    "NewsEntry": ".models",
+    "FavEntry": ".models",
+    "PostRecord": ".models",
+    "IngRecord": ".models",
+    "NewsRecord": ".models",
+    "FavRecord": ".models",
+    "PostTable": ".table",
+    "IngTable": ".table",
+    "NewsTable": ".table",
+    "FavTable": ".table",
+    # 批量操作
+    "PostOperation": ".bulk",
+    "BulkReport": ".bulk",
+    "BulkItem": ".bulk",
+    # 闪存轮询与批量发布
+    "IngPoller": ".poller",
+    "AsyncIngPoller": ".poller",
+    "IngPublishQueue": ".publisher",
+    "PublishReport": ".publisher",
+    "PublishItem": ".publisher",
+    # 异常
+    "CnblogsError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "APIError": ".exceptions",
+    "ResponseTooLargeError": ".exceptions",
+    # Result类型
+    "Ok": ".result",
+    "Err": ".result",
+    "Result": ".result",
+    # 重试、限流与连接池
+    "RetryPolicy": ".retry",
+    "RateLimiter": ".ratelimit",
+    "TokenBucket": ".ratelimit",
+    "PoolConfig": ".pool",
+    # 缓存
+    "MemoryCache": ".cache",
+    "SQLiteCache": ".cache",
+    "ModelCache": ".cache",
+    # 监控
+    "RequestHooks": ".metrics",
+    "RequestInfo": ".metrics",
+    "Metrics": ".metrics",
+    "Tracer": ".tracing",
+    "OpenTelemetryTracer": ".tracing",
+    # 辅助函数
+    "format_error": ".utils",
+    "print_error": ".utils",
+}
+
+if TYPE_CHECKING:
+    # 主客户端
+    from .client import CnblogsClient
+    from .async_client import AsyncCnblogsClient
+    
+    # 数据模型
+    from .models import PostEntry, UserInfo, IngEntry, NewsEntry, FavEntry
+    from .models import PostRecord, IngRecord, NewsRecord, FavRecord
+    from .table import PostTable, IngTable, NewsTable, FavTable
+    
+    # 批量操作
+    from .bulk import PostOperation, BulkReport, BulkItem
+    
+    # 闪存轮询与批量发布
+    from .poller import IngPoller, AsyncIngPoller
+    from .publisher import IngPublishQueue, PublishReport, PublishItem
+    
+    # 异常
+    from .exceptions import CnblogsError, AuthenticationError, APIError, ResponseTooLargeError
+    
+    # Result类型
+    from .result import Ok, Err, Result
+    
+    # 重试、限流与连接池
+    from .retry import RetryPolicy
+    from .ratelimit import RateLimiter, TokenBucket
+    from .pool import PoolConfig
+    
+    # 缓存
+    from .cache import MemoryCache, SQLiteCache, ModelCache
+    
+    # 监控
+    from .metrics import RequestHooks, RequestInfo, Metrics
+    from .tracing import Tracer, OpenTelemetryTracer
+    
+    # 辅助函数
+    from .utils import format_error, print_error
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 缓存到模块字典，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
 
-# 异常
-from .exceptions import CnblogsError, AuthenticationError, APIError
 
-# Result类型
-from .result import Ok, Err, Result
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# 辅助函数
-from .utils import format_error, print_error
 
 __version__ = "0.2.0"
 __all__ = [
     # 客户端
     "CnblogsClient",
+    "AsyncCnblogsClient",
     # 数据模型
     "PostEntry",
     "UserInfo",
     "IngEntry",
     "NewsEntry",
     "FavEntry",
+    "PostRecord",
+    "IngRecord",
+    "NewsRecord",
+    "FavRecord",
+    "PostTable",
+    "IngTable",
+    "NewsTable",
+    "FavTable",
+    # 批量操作
+    "PostOperation",
+    "BulkReport",
+    "BulkItem",
+    # 闪存轮询与批量发布
+    "IngPoller",
+    "AsyncIngPoller",
+    "IngPublishQueue",
+    "PublishReport",
+    "PublishItem",
     # 异常
     "CnblogsError",
     "AuthenticationError",
     "APIError",
+    "ResponseTooLargeError",
     # Result类型
     "Ok",
     "Err",
     "Result",
+    # 重试、限流与连接池
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "PoolConfig",
+    # 缓存
+    "MemoryCache",
+    "SQLiteCache",
+    "ModelCache",
+    # 监控
+    "RequestHooks",
+    "RequestInfo",
+    "Metrics",
+    "Tracer",
+    "OpenTelemetryTracer",
     # 辅助函数
     "format_error",
     "print_error",
@@ -0,0 +1,218 @@
+"""同步与异步API共用的逻辑（请求地址与参数、模型缓存键、结果处理、更新文章的字段合并）"""
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple, Union
+from .result import Ok, Err, Result
+from .constants import BLOG_BACKEND, OPENAPI
+
+# 与 client.py 相同，模型和缓存模块在用到时才导入
+if TYPE_CHECKING:
+    from .models import PostEntry
+    from .cache import ModelCache
+
+
+def to_ok(result: Union[Dict[str, Any], Result]) -> Result:
+    """只关心成败的写接口：响应转为 Ok(None)，错误原样返回"""
+    if isinstance(result, Err):
+        return result
+    return Ok(None)
+
+
+class PostAPIBase:
+    """
+    PostAPI 与 AsyncPostAPI 的公共部分
+    
+    只负责构造请求、读写模型缓存和处理结果，发送请求由子类（同步或异步）实现。
+    """
+    
+    # 文章列表接口单页最多返回的条数
+    MAX_PAGE_SIZE = 100
+    
+    def __init__(self, client: Any, model_cache: Optional["ModelCache"] = None, base_url: str = BLOG_BACKEND):
+        self.client = client
+        self.model_cache = model_cache
+        self.base_url = base_url
+    
+    def _list_request(self, page: int, page_size: int) -> Tuple[str, Dict[str, Any]]:
+        """文章列表一页的请求地址和参数"""
+        return f"{self.base_url}/posts/list", {"t": 1, "p": page, "s": page_size}
+    
+    def _post_url(self, post_id: int) -> str:
+        return f"{self.base_url}/posts/{post_id}"
+    
+    def _cached(self, kind: str, key: Hashable) -> Optional[Any]:
+        """模型缓存中的值（未配置模型缓存时为None）"""
+        if self.model_cache is None:
+            return None
+        return self.model_cache.get(kind, key)
+    
+    def _store(self, kind: str, key: Hashable, value: Any):
+        if self.model_cache is not None:
+            self.model_cache.set(kind, key, value)
+    
+    def _post_key(self, post_id: int) -> str:
+        """单篇文章的模型缓存键：与用户信息一样按PAT和地址区分，多个账号的客户端可共享同一个模型缓存"""
+        from .cache import cache_key
+        
+        return cache_key(self.client.pat, self._post_url(post_id))
+    
+    def _list_key(self, skip: int, take: int) -> str:
+        """文章列表的模型缓存键"""
+        from .cache import cache_key
+        
+        return cache_key(self.client.pat, f"{self.base_url}/posts/list", {"skip": skip, "take": take})
+    
+    @staticmethod
+    def _parse_one(data: Dict[str, Any]) -> "PostEntry":
+        """解析单篇文章接口的响应"""
+        from .models import parse_post
+        
+        return parse_post(data["blogPost"] if "blogPost" in data else data)
+    
+    @staticmethod
+    def _create_payload(title: str, body: str, publish: bool) -> Dict[str, Any]:
+        return {
+            "postType": 1,
+            "title": title,
+            "postBody": body,
+            "isPublished": publish,
+            "displayOnHomePage": True,
+        }
+    
+    @staticmethod
+    def _created_id(result: Union[Dict[str, Any], Result]) -> Union[int, Result]:
+        if isinstance(result, Err):
+            return result
+        return result.get("id", 0)
+    
+    @staticmethod
+    def _base_is_incomplete(base: Optional["PostEntry"], body: Optional[str]) -> bool:
+        """更新时 base 是否补不齐未提供的字段（没有 base，或需要正文而 base 未加载正文）"""
+        # is_body_loaded 不会触发列表文章的正文懒加载
+        return base is None or (body is None and not base.is_body_loaded)
+    
+    @staticmethod
+    def _check_version(post_id: int, current: "PostEntry", expected_modify_time: str) -> Optional[Err]:
+        """乐观并发检查，文章已被修改时返回409"""
+        if current.modify_time != expected_modify_time:
+            return Err(
+                f"Post {post_id} was modified at {current.modify_time}, expected {expected_modify_time}",
+                status_code=409,
+            )
+        return None
+    
+    @staticmethod
+    def _update_payload(
+        post_id: int,
+        title: Optional[str],
+        body: Optional[str],
+        publish: Optional[bool],
+        current: Optional["PostEntry"],
+    ) -> Dict[str, Any]:
+        """更新请求的内容，未提供的字段取自 current"""
+        return {
+            "id": post_id,
+            "postType": 1,
+            "title": title if title is not None else current.title,
+            "postBody": body if body is not None else current.body,
+            "isPublished": publish if publish is not None else current.is_published,
+            "displayOnHomePage": True,
+        }
+    
+    @staticmethod
+    def _updated_id(result: Union[Dict[str, Any], Result], post_id: int) -> Union[int, Result]:
+        if isinstance(result, Err):
+            return result
+        if isinstance(result, dict) and "id" in result:
+            return result["id"]
+        return post_id
+    
+    def _invalidate(self, post_id: Optional[int] = None):
+        """文章变更后清除相关的模型缓存"""
+        if self.model_cache is None:
+            return
+        if post_id is not None:
+            self.model_cache.invalidate("post", self._post_key(post_id))
+        self.model_cache.invalidate("post_list")
+
+
+class UserAPIBase:
+    """UserAPI 与 AsyncUserAPI 的公共部分"""
+    
+    def __init__(self, client: Any, model_cache: Optional["ModelCache"] = None, base_url: str = OPENAPI):
+        self.client = client
+        self.model_cache = model_cache
+        self.base_url = base_url
+    
+    def _user_url(self) -> str:
+        return f"{self.base_url}/users"
+    
+    def _user_key(self) -> str:
+        """用户信息的模型缓存键：按PAT区分，同一个模型缓存可由多个账号的客户端共享"""
+        from .cache import cache_key
+        
+        return cache_key(self.client.pat, self._user_url())
+
+
+class IngAPIBase:
+    """IngAPI 与 AsyncIngAPI 的公共部分"""
+    
+    # iter_all 默认每页请求的条数
+    PAGE_SIZE = 50
+    
+    # 服务器拒绝重复内容时返回的错误信息
+    DUPLICATE_MESSAGE = "相同闪存已发布"
+    
+    def __init__(self, client: Any, base_url: str = OPENAPI):
+        self.client = client
+        self.base_url = base_url
+    
+    def _publish_request(self, content: str, is_private: bool) -> Tuple[str, Dict[str, Any]]:
+        return f"{self.base_url}/statuses", {"content": content, "isPrivate": is_private, "clientType": 13}
+    
+    def _published(self, result: Union[Dict[str, Any], Result], ignore_duplicate: bool) -> Result:
+        if isinstance(result, Err):
+            if ignore_duplicate and self.DUPLICATE_MESSAGE in result.error:
+                return Ok(None)
+            return result
+        return Ok(None)
+    
+    def _page_url(self, page_index: int, page_size: int, ing_type: int) -> str:
+        return f"{self.base_url}/statuses/@{ing_type}?pageIndex={page_index}&pageSize={page_size}"
+    
+    def _comment_request(self, ing_id: int, content: str) -> Tuple[str, Dict[str, Any]]:
+        return f"{self.base_url}/statuses/{ing_id}/comments", {"content": content}
+
+
+class NewsAPIBase:
+    """NewsAPI 与 AsyncNewsAPI 的公共部分"""
+    
+    # iter_all 默认每页请求的条数
+    PAGE_SIZE = 50
+    
+    def __init__(self, client: Any, model_cache: Optional["ModelCache"] = None, base_url: str = OPENAPI):
+        self.client = client
+        self.model_cache = model_cache
+        self.base_url = base_url
+    
+    def _page_url(self, page_index: int, page_size: int) -> str:
+        return f"{self.base_url}/newsitems/@sitehome?pageIndex={page_index}&pageSize={page_size}"
+    
+    def _list_key(self, skip: int, take: int) -> str:
+        """新闻列表的模型缓存键（包含根地址，指向不同服务器的客户端不会共用）"""
+        from .cache import cache_key
+        
+        return cache_key(self.client.pat, self._page_url(skip // take + 1, take))
+
+
+class FavAPIBase:
+    """FavAPI 与 AsyncFavAPI 的公共部分"""
+    
+    # iter_all 默认每页请求的条数
+    PAGE_SIZE = 50
+    
+    def __init__(self, client: Any, base_url: str = OPENAPI):
+        self.client = client
+        self.base_url = base_url
+    
+    def _page_url(self, page_index: int, page_size: int) -> str:
+        return f"{self.base_url}/wz?pageIndex={page_index}&pageSize={page_size}"
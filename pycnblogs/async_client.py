@@ -0,0 +1,441 @@
+"""博客园异步客户端（需安装 pycnblogs[async]）"""
+
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Union, AsyncIterator, Iterable
+from .models import (
+    PostEntry, UserInfo, IngEntry, NewsEntry, FavEntry,
+    PostRecord, IngRecord, NewsRecord, FavRecord,
+    parse_post, parse_user, parse_ing, parse_news, parse_fav,
+    parse_post_record, parse_ing_record, parse_news_record, parse_fav_record,
+)
+from .result import Err, Result
+from .session import load_pat
+from .constants import BLOG_BACKEND, OPENAPI
+from .api_base import PostAPIBase, UserAPIBase, IngAPIBase, NewsAPIBase, FavAPIBase, to_ok
+from .paging import PageWindow, aiter_pages, fit_page_size
+from .concurrency import amap_bounded
+from .retry import RetryPolicy, RetryStats
+from .ratelimit import RateLimiter
+from .cache import CacheBackend, ModelCache
+from .metrics import RequestHooks
+from .tracing import Tracer, traced
+from .lazy import aload_bodies
+from .poller import AsyncIngPoller
+
+if TYPE_CHECKING:
+    import httpx
+    from .async_http_client import AsyncHTTPClient
+
+
+class AsyncPostAPI(PostAPIBase):
+    """文章API（异步）"""
+    
+    @traced("post.get_count")
+    async def get_count(self) -> int:
+        """获取文章总数"""
+        data = await self.client.get_with_params(*self._list_request(1, 1))
+        return data.get("postsCount", 0)
+    
+    @traced("post.get_one")
+    async def get_one(self, post_id: int) -> PostEntry:
+        """获取单篇文章"""
+        key = self._post_key(post_id)
+        cached = self._cached("post", key)
+        if cached is not None:
+            return cached
+        
+        post = await self._fetch_one(post_id)
+        self._store("post", key, post)
+        return post
+    
+    async def _fetch_one(self, post_id: int) -> PostEntry:
+        """从服务器获取单篇文章（不经过模型缓存）"""
+        return self._parse_one(await self.client.get(self._post_url(post_id)))
+    
+    @traced("post.get_many", iterates=True)
+    def get_many(
+        self,
+        post_ids: Iterable[int],
+        concurrency: int = 16,
+        ordered: bool = True,
+    ) -> AsyncIterator[Tuple[int, Result]]:
+        """并发获取多篇文章，逐个产出 (文章ID, Ok(PostEntry) 或 Err)"""
+        return amap_bounded(self.get_one, post_ids, concurrency, ordered)
+    
+    async def _fetch_page(self, page: int, page_size: int, compact: bool = False) -> Tuple[List[PostEntry], int]:
+        """获取一页文章（不含正文）及文章总数；compact 为 True 时返回 PostRecord"""
+        url, params = self._list_request(page, page_size)
+        extra = {}
+        items = self.client.get_items(url, params, key="postList", extra=extra)
+        if compact:
+            posts = [parse_post_record(item) async for item in items]
+        else:
+            posts = [parse_post(item, with_body=False) async for item in items]
+        return posts, extra.get("postsCount", 0)
+    
+    @traced("post.get_list")
+    async def get_list(self, skip: int = 0, take: int = 10) -> Tuple[List[PostEntry], int]:
+        """获取文章列表"""
+        if take <= 0:
+            return [], await self.get_count()
+        
+        key = self._list_key(skip, take)
+        cached = self._cached("post_list", key)
+        if cached is not None:
+            return cached
+        
+        window = PageWindow(skip, take, self.MAX_PAGE_SIZE)
+        for page in window.pages:
+            if not window.add(page, *await self._fetch_page(page, window.page_size)):
+                break
+        
+        posts, total = window.result()
+        self._store("post_list", key, (posts, total))
+        return posts, total
+    
+    @traced("post.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = PostAPIBase.MAX_PAGE_SIZE,
+        compact: bool = False,
+    ) -> AsyncIterator[Union[PostEntry, PostRecord]]:
+        """逐页遍历所有文章（不含正文），compact 为 True 时产出 PostRecord"""
+        page_size = fit_page_size(page_size, limit)
+        
+        async def fetch(page: int) -> List[PostEntry]:
+            return (await self._fetch_page(page, page_size, compact))[0]
+        
+        return aiter_pages(fetch, page_size, limit)
+    
+    @traced("post.load_bodies")
+    async def load_bodies(self, posts: Iterable[PostEntry], concurrency: int = 16) -> Dict[int, Err]:
+        """并发加载列表文章中尚未加载的正文（异步客户端不会在读取 body 时自动加载），返回加载失败的 {文章ID: Err}"""
+        return await aload_bodies(self, posts, concurrency)
+    
+    @traced("post.create")
+    async def create(self, title: str, body: str, publish: bool = False) -> Union[int, Result]:
+        """创建文章"""
+        url = f"{self.base_url}/posts"
+        result = await self.client.post(url, self._create_payload(title, body, publish), raise_on_error=False)
+        self._invalidate()
+        return self._created_id(result)
+    
+    @traced("post.update")
+    async def update(
+        self,
+        post_id: int,
+        title: Optional[str] = None,
+        body: Optional[str] = None,
+        publish: Optional[bool] = None,
+        base: Optional[PostEntry] = None,
+        expected_modify_time: Optional[str] = None,
+    ) -> Union[int, Result]:
+        """
+        更新文章
+        
+        title、body、publish 全部提供时只发送一次请求；否则未提供的字段依次取自
+        base、模型缓存，最后才会读取文章。
+        
+        Args:
+            post_id: 文章ID
+            title: 新标题，None表示不变
+            body: 新正文，None表示不变
+            publish: 是否发布，None表示不变
+            base: 调用方已持有的文章当前状态（缺正文时仍会读取文章）
+            expected_modify_time: 乐观并发检查：先读取文章（多一次GET，此时不使用 base），
+                服务器上的 modify_time 与此不同时放弃更新并返回409
+        """
+        current = base
+        if expected_modify_time is not None:
+            # 版本只能与服务器上的文章比较（不经过模型缓存），读到的文章同时补齐未提供的字段
+            current = await self._fetch_one(post_id)
+            conflict = self._check_version(post_id, current, expected_modify_time)
+            if conflict is not None:
+                return conflict
+        elif (title is None or body is None or publish is None) and self._base_is_incomplete(base, body):
+            current = await self.get_one(post_id)
+        
+        url = f"{self.base_url}/posts"
+        payload = self._update_payload(post_id, title, body, publish, current)
+        result = await self.client.post(url, payload, raise_on_error=False)
+        self._invalidate(post_id)
+        return self._updated_id(result, post_id)
+    
+    @traced("post.delete")
+    async def delete(self, post_id: int) -> Result:
+        """删除文章"""
+        result = await self.client.delete(self._post_url(post_id), raise_on_error=False)
+        self._invalidate(post_id)
+        return to_ok(result)
+
+
+class AsyncUserAPI(UserAPIBase):
+    """用户API（异步）"""
+    
+    @traced("user.get_info")
+    async def get_info(self) -> UserInfo:
+        """获取用户信息"""
+        key = self._user_key()
+        if self.model_cache is not None:
+            cached = self.model_cache.get("user", key)
+            if cached is not None:
+                return cached
+        
+        user = parse_user(await self.client.get(self._user_url()))
+        if self.model_cache is not None:
+            self.model_cache.set("user", key, user)
+        return user
+
+
+class AsyncIngAPI(IngAPIBase):
+    """闪存API（异步）"""
+    
+    @traced("ing.publish")
+    async def publish(self, content: str, is_private: bool = False, ignore_duplicate: bool = True) -> Result:
+        """发布闪存"""
+        url, payload = self._publish_request(content, is_private)
+        result = await self.client.post(url, payload, raise_on_error=False)
+        return self._published(result, ignore_duplicate)
+    
+    async def _fetch_page(self, page_index: int, page_size: int, ing_type: int, compact: bool = False) -> List[IngEntry]:
+        """获取一页闪存；compact 为 True 时返回 IngRecord"""
+        parse = parse_ing_record if compact else parse_ing
+        return [parse(item) async for item in self.client.get_items(self._page_url(page_index, page_size, ing_type))]
+    
+    @traced("ing.get_page")
+    async def get_page(self, page_index: int = 1, page_size: int = IngAPIBase.PAGE_SIZE, ing_type: int = 1) -> List[IngEntry]:
+        """获取一页闪存（从最新一条开始，page_index 从1开始）"""
+        return await self._fetch_page(page_index, page_size, ing_type)
+    
+    @traced("ing.get_list")
+    async def get_list(self, skip: int = 0, take: int = 10, ing_type: int = 1) -> List[IngEntry]:
+        """获取闪存列表"""
+        return await self._fetch_page(skip // take + 1, take, ing_type)
+    
+    @traced("ing.iter_all", iterates=True)
+    def iter_all(
+        self,
+        ing_type: int = 1,
+        limit: Optional[int] = None,
+        page_size: int = IngAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> AsyncIterator[Union[IngEntry, IngRecord]]:
+        """逐页遍历所有闪存，compact 为 True 时产出 IngRecord"""
+        page_size = fit_page_size(page_size, limit)
+        return aiter_pages(lambda page: self._fetch_page(page, page_size, ing_type, compact), page_size, limit)
+    
+    def poller(self, ing_type: int = 1, since_id: Optional[int] = None, **options) -> AsyncIngPoller:
+        """轮询新发布的闪存（async for 逐条产出，参数同 IngAPI.poller）"""
+        options.setdefault("tracer", self.client.tracer)
+        return AsyncIngPoller(self, ing_type, since_id, **options)
+    
+    @traced("ing.comment")
+    async def comment(self, ing_id: int, content: str) -> Result:
+        """评论闪存"""
+        url, payload = self._comment_request(ing_id, content)
+        return to_ok(await self.client.post(url, payload, raise_on_error=False))
+
+
+class AsyncNewsAPI(NewsAPIBase):
+    """新闻API（异步）"""
+    
+    async def _fetch_page(self, page_index: int, page_size: int, compact: bool = False) -> List[NewsEntry]:
+        """获取一页新闻；compact 为 True 时返回 NewsRecord"""
+        parse = parse_news_record if compact else parse_news
+        return [parse(item) async for item in self.client.get_items(self._page_url(page_index, page_size))]
+    
+    @traced("news.get_list")
+    async def get_list(self, skip: int = 0, take: int = 10) -> List[NewsEntry]:
+        """获取新闻列表"""
+        key = self._list_key(skip, take)
+        if self.model_cache is not None:
+            cached = self.model_cache.get("news", key)
+            if cached is not None:
+                return cached
+        
+        news_list = await self._fetch_page(skip // take + 1, take)
+        if self.model_cache is not None:
+            self.model_cache.set("news", key, news_list)
+        return news_list
+    
+    @traced("news.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = NewsAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> AsyncIterator[Union[NewsEntry, NewsRecord]]:
+        """逐页遍历所有新闻，compact 为 True 时产出 NewsRecord"""
+        page_size = fit_page_size(page_size, limit)
+        return aiter_pages(lambda page: self._fetch_page(page, page_size, compact), page_size, limit)
+
+
+class AsyncFavAPI(FavAPIBase):
+    """收藏API（异步）"""
+    
+    async def _fetch_page(self, page_index: int, page_size: int, compact: bool = False) -> List[FavEntry]:
+        """获取一页收藏；compact 为 True 时返回 FavRecord"""
+        parse = parse_fav_record if compact else parse_fav
+        return [parse(item) async for item in self.client.get_items(self._page_url(page_index, page_size))]
+    
+    @traced("fav.get_list")
+    async def get_list(self, skip: int = 0, take: int = 10) -> List[FavEntry]:
+        """获取收藏列表"""
+        return await self._fetch_page(skip // take + 1, take)
+    
+    @traced("fav.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = FavAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> AsyncIterator[Union[FavEntry, FavRecord]]:
+        """逐页遍历所有收藏，compact 为 True 时产出 FavRecord"""
+        page_size = fit_page_size(page_size, limit)
+        return aiter_pages(lambda page: self._fetch_page(page, page_size, compact), page_size, limit)
+
+
+class AsyncCnblogsClient:
+    """博客园异步客户端"""
+    
+    def __init__(
+        self,
+        pat: Optional[str] = None,
+        timeout: float = 30.0,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        model_cache: Optional[ModelCache] = None,
+        max_response_size: Optional[int] = None,
+        stream_json: bool = False,
+        hooks: Optional[RequestHooks] = None,
+        tracer: Optional[Tracer] = None,
+        blog_backend: str = BLOG_BACKEND,
+        openapi: str = OPENAPI,
+        session: Optional["httpx.AsyncClient"] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ):
+        """
+        初始化客户端
+        
+        Args:
+            pat: Personal Access Token（可选，不提供则从~/.cnbrc加载）
+            timeout: 请求超时时间（秒）
+            http2: 是否启用HTTP/2（需安装h2，未安装时自动退回HTTP/1.1）
+            max_connections: 连接池最大连接数
+            max_keepalive_connections: 连接池保持的空闲连接数
+            retry: 重试策略（默认对幂等请求重试3次），None表示不重试
+            rate_limiter: 客户端限流器（令牌桶），同一实例可在多个客户端间共享
+            cache: HTTP缓存后端（MemoryCache/SQLiteCache），读接口发送条件请求并复用304响应
+            model_cache: 模型缓存（按类型TTL + LRU），文章的增删改会自动失效对应缓存
+            max_response_size: 响应体最大字节数，超出时抛出 ResponseTooLargeError，None表示不限制
+            stream_json: 列表接口边接收边解码（未配置 cache 时生效），降低大页的峰值内存
+            hooks: 请求事件钩子（RequestHooks），传入 Metrics 即可统计各接口的请求数与延迟
+            tracer: 追踪器（Tracer/OpenTelemetryTracer），每次接口调用生成一个span，其中每个HTTP请求为子span
+            blog_backend: 文章接口的根地址（默认 https://i.cnblogs.com/api），可指向缓存代理或本地模拟服务器
+            openapi: 用户、闪存、新闻、收藏接口的根地址（默认 https://api.cnblogs.com/api）
+            session: 自定义的 httpx.AsyncClient（连接池、代理、证书等），由调用方负责关闭
+            proxies: 代理，如 {"https": "http://127.0.0.1:8080"}
+        """
+        if pat is None:
+            pat = load_pat()
+        
+        self.pat = pat
+        self.timeout = timeout
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.model_cache = model_cache
+        self.max_response_size = max_response_size
+        self.stream_json = stream_json
+        self.hooks = hooks
+        self.tracer = tracer
+        self.blog_backend = blog_backend.rstrip("/")
+        self.openapi = openapi.rstrip("/")
+        self.session = session
+        self.proxies = proxies
+        self._http_client: Optional["AsyncHTTPClient"] = None
+        self._post: Optional[AsyncPostAPI] = None
+        self._user: Optional[AsyncUserAPI] = None
+        self._ing: Optional[AsyncIngAPI] = None
+        self._news: Optional[AsyncNewsAPI] = None
+        self._fav: Optional[AsyncFavAPI] = None
+    
+    async def __aenter__(self):
+        # 延迟导入：httpx 只在真正进入异步客户端时加载
+        from .async_http_client import AsyncHTTPClient
+        
+        self._http_client = AsyncHTTPClient(
+            self.pat,
+            self.timeout,
+            http2=self.http2,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            max_response_size=self.max_response_size,
+            stream_json=self.stream_json,
+            hooks=self.hooks,
+            tracer=self.tracer,
+            session=self.session,
+            proxies=self.proxies,
+        )
+        self._post = AsyncPostAPI(self._http_client, self.model_cache, self.blog_backend)
+        self._user = AsyncUserAPI(self._http_client, self.model_cache, self.openapi)
+        self._ing = AsyncIngAPI(self._http_client, self.openapi)
+        self._news = AsyncNewsAPI(self._http_client, self.model_cache, self.openapi)
+        self._fav = AsyncFavAPI(self._http_client, self.openapi)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._http_client:
+            await self._http_client.close()
+    
+    @property
+    def retry_stats(self) -> RetryStats:
+        """重试统计"""
+        if self._http_client is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._http_client.retry_stats
+    
+    @property
+    def post(self) -> AsyncPostAPI:
+        """文章API"""
+        if self._post is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._post
+    
+    @property
+    def user(self) -> AsyncUserAPI:
+        """用户API"""
+        if self._user is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._user
+    
+    @property
+    def ing(self) -> AsyncIngAPI:
+        """闪存API"""
+        if self._ing is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._ing
+    
+    @property
+    def news(self) -> AsyncNewsAPI:
+        """新闻API"""
+        if self._news is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._news
+    
+    @property
+    def fav(self) -> AsyncFavAPI:
+        """收藏API"""
+        if self._fav is None:
+            raise RuntimeError("Client must be used as async context manager")
+        return self._fav
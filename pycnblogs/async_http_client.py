@@ -0,0 +1,262 @@
+"""异步HTTP客户端（基于 httpx，需安装 pycnblogs[async]）"""
+
+import asyncio
+import importlib.util
+from typing import Dict, Any, AsyncIterator, Optional, Union
+from .result import Result
+from .retry import RetryPolicy, RetryStats
+from .ratelimit import RateLimiter
+from .cache import CacheBackend
+from .metrics import RequestHooks, RequestInfo
+from .tracing import Span, Tracer
+from .streaming import CHUNK_SIZE, aiter_json_array, check_size, select_items
+from .http_base import HTTPClientBase, annotate, content_length, http_attributes
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - 可选依赖
+    httpx = None
+
+
+def _build_session(
+    http2: bool,
+    timeout: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    proxies: Optional[Dict[str, str]],
+) -> "httpx.AsyncClient":
+    """创建客户端自有的 httpx 会话"""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    mounts = None
+    if proxies:
+        # 与 requests 相同的写法：{"http": 代理地址, "https": 代理地址}
+        mounts = {
+            (key if "://" in key else f"{key}://"): httpx.AsyncHTTPTransport(http2=http2, limits=limits, proxy=proxy)
+            for key, proxy in proxies.items()
+        }
+    return httpx.AsyncClient(http2=http2, timeout=timeout, limits=limits, mounts=mounts)
+
+
+class AsyncHTTPClient(HTTPClientBase):
+    """异步HTTP客户端，所有请求共享同一个连接池"""
+    
+    def __init__(
+        self,
+        pat: str,
+        timeout: float = 30.0,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        max_response_size: Optional[int] = None,
+        stream_json: bool = False,
+        hooks: Optional[RequestHooks] = None,
+        tracer: Optional[Tracer] = None,
+        session: Optional["httpx.AsyncClient"] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ):
+        if httpx is None:
+            raise ImportError("AsyncHTTPClient requires httpx: pip install 'pycnblogs[async]'")
+        
+        # 未安装 h2 时退回 HTTP/1.1
+        if http2 and importlib.util.find_spec("h2") is None:
+            http2 = False
+        
+        self.pat = pat
+        self.timeout = timeout
+        self.http2 = http2
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.max_response_size = max_response_size
+        self.stream_json = stream_json
+        self.hooks = hooks
+        self.tracer = tracer
+        self.proxies = proxies
+        # 传入的会话由调用方配置和关闭，http2/连接池/代理参数不再生效
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = _build_session(http2, timeout, max_connections, max_keepalive_connections, proxies)
+    
+    async def close(self):
+        """关闭会话（传入的会话由调用方关闭）"""
+        if self._owns_session:
+            await self.session.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def get(self, url: str, raise_on_error: bool = True) -> Union[Dict[str, Any], Result]:
+        """发送GET请求"""
+        return await self._request("GET", url, raise_on_error)
+    
+    async def get_with_params(self, url: str, params: Dict[str, Any], raise_on_error: bool = True) -> Union[Dict[str, Any], Result]:
+        """发送带参数的GET请求"""
+        return await self._request("GET", url, raise_on_error, params=params)
+    
+    async def post(self, url: str, json: Dict[str, Any], raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
+        """发送POST请求"""
+        return await self._request("POST", url, raise_on_error, json=json)
+    
+    async def put(self, url: str, json: Dict[str, Any], raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
+        """发送PUT请求"""
+        return await self._request("PUT", url, raise_on_error, json=json)
+    
+    async def delete(self, url: str, raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
+        """发送DELETE请求"""
+        return await self._request("DELETE", url, raise_on_error)
+    
+    async def get_items(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """获取JSON数组（或顶层对象中 key 对应的数组）的元素，参见 HTTPClient.get_items"""
+        if not self.stream_json or self.cache is not None:
+            data = await self._request("GET", url, True, params=params)
+            for item in select_items(data, key, extra):
+                yield item
+            return
+        
+        # 流式读取跨越多次 yield，span 不设为当前span，由这里显式结束
+        span = self.tracer.start_span("HTTP GET", http_attributes("GET", url)) if self.tracer is not None else None
+        response = None
+        try:
+            response = await self._send("GET", url, span=span, params=params)
+            if response.status_code != 200:
+                await self._read_body(response)
+                for item in select_items(self._handle_response(response, raise_on_error=True), key, extra):
+                    yield item
+                return
+            async for item in aiter_json_array(self._iter_body(response), key, extra):
+                yield item
+        except Exception as e:
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            if response is not None:
+                await response.aclose()
+            if span is not None:
+                span.end()
+    
+    async def _iter_body(self, response: "httpx.Response") -> AsyncIterator[bytes]:
+        """逐块读取响应体，超过 max_response_size 时抛出异常"""
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            check_size(int(length), self.max_response_size, response.status_code)
+        size = 0
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            size += len(chunk)
+            check_size(size, self.max_response_size, response.status_code)
+            yield chunk
+    
+    async def _read_body(self, response: "httpx.Response"):
+        """读取完整响应体（按 max_response_size 限制）"""
+        if self.max_response_size is None:
+            await response.aread()
+            return
+        body = b"".join([chunk async for chunk in self._iter_body(response)])
+        # 与 httpx 自身 aread() 的方式一致，之后 .content/.json() 直接使用这份数据
+        response._content = body
+        await response.aclose()
+    
+    async def _request(self, method: str, url: str, raise_on_error: bool, **kwargs) -> Union[Dict[str, Any], Result]:
+        """发送请求；配置了追踪器时包裹在一个HTTP span中"""
+        if self.tracer is None:
+            return await self._perform(method, url, raise_on_error, None, **kwargs)
+        with self.tracer.span(f"HTTP {method}", http_attributes(method, url)) as span:
+            return await self._perform(method, url, raise_on_error, span, **kwargs)
+    
+    async def _perform(
+        self,
+        method: str,
+        url: str,
+        raise_on_error: bool,
+        span: Optional[Span],
+        **kwargs,
+    ) -> Union[Dict[str, Any], Result]:
+        """发送请求；配置了缓存时GET请求走条件请求"""
+        key, cached, extra_headers = self._cache_lookup(method, url, kwargs.get("params"))
+        response = await self._send(method, url, extra_headers=extra_headers, span=span, **kwargs)
+        await self._read_body(response)
+        return self._complete(response, raise_on_error, span, key, cached)
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+        span: Optional[Span] = None,
+        **kwargs,
+    ) -> "httpx.Response":
+        """发送请求，按重试策略重试暂时性失败，返回最终响应（响应体尚未读取）"""
+        headers = self._get_headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        policy = self.retry
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            info = None
+            if self.hooks is not None:
+                info = RequestInfo(method, url, attempt)
+                self.hooks.before_request(info)
+            try:
+                request = self.session.build_request(method, url, headers=headers, **kwargs)
+                response = await self.session.send(request, stream=True)
+            except httpx.TransportError as e:
+                if info is not None:
+                    info.finish(error=e)
+                    self.hooks.on_error(info)
+                # 连接未建立时请求必然未送达，任何方法都可以安全重试
+                connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if policy is None or not policy.should_retry_error(method, attempt, connect_failed):
+                    if policy is not None and attempt > 1:
+                        self.retry_stats.record_exhausted()
+                    if span is not None:
+                        span.set_attribute("http.retry_count", attempt - 1)
+                    raise
+                reason = type(e).__name__
+                delay = policy.get_backoff(attempt)
+            except BaseException as e:
+                # 其他异常（如 httpx.InvalidURL、httpx.DecodingError）不重试，但同样结束这次尝试，
+                # 保证每个 before_request 都有对应的 on_error（指标的 in_flight 不会一直偏高）
+                if info is not None:
+                    info.finish(error=e)
+                    self.hooks.on_error(info)
+                raise
+            else:
+                if info is not None:
+                    info.finish(response.status_code, content_length(response))
+                    self.hooks.after_response(info)
+                if policy is None or not policy.should_retry_status(method, response.status_code, attempt):
+                    if policy is not None and attempt > 1 and policy.is_retryable_status(method, response.status_code):
+                        self.retry_stats.record_exhausted()
+                    if span is not None:
+                        annotate(span, response, attempt)
+                    return response
+                reason = str(response.status_code)
+                delay = policy.get_backoff(attempt, response.headers.get("Retry-After"))
+                await response.aclose()
+            
+            self.retry_stats.record_retry(reason)
+            await asyncio.sleep(delay)
+            attempt += 1
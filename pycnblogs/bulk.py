@@ -0,0 +1,163 @@
+"""Bulk post mutations with per-item reporting."""
+
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .concurrency import map_bounded, to_result
+from .models import PostEntry
+from .result import Err, Result
+
+if TYPE_CHECKING:
+    from .client import PostAPI
+
+
+@dataclass
+class PostOperation:
+    """A single create/update/delete to run through ``PostAPI.bulk``."""
+    action: str
+    post_id: Optional[int] = None
+    title: Optional[str] = None
+    body: Optional[str] = None
+    publish: Optional[bool] = None
+    base: Optional[PostEntry] = None
+    
+    @classmethod
+    def create(cls, title: str, body: str, publish: bool = False) -> "PostOperation":
+        """Operation creating a new post."""
+        return cls("create", title=title, body=body, publish=publish)
+    
+    @classmethod
+    def update(
+        cls,
+        post_id: int,
+        title: Optional[str] = None,
+        body: Optional[str] = None,
+        publish: Optional[bool] = None,
+        base: Optional[PostEntry] = None,
+    ) -> "PostOperation":
+        """Operation updating an existing post (see ``PostAPI.update``)."""
+        return cls("update", post_id=post_id, title=title, body=body, publish=publish, base=base)
+    
+    @classmethod
+    def delete(cls, post_id: int) -> "PostOperation":
+        """Operation deleting a post."""
+        return cls("delete", post_id=post_id)
+
+
+@dataclass
+class BulkItem:
+    """Outcome of one operation."""
+    index: int
+    operation: PostOperation
+    result: Result
+    elapsed: float
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.result.is_ok()
+
+
+@dataclass
+class BulkReport:
+    """Per-operation results of a bulk run, in input order."""
+    items: List[BulkItem] = field(default_factory=list)
+    elapsed: float = 0.0
+    
+    @property
+    def succeeded(self) -> List[BulkItem]:
+        """Items whose operation succeeded."""
+        return [item for item in self.items if item.ok]
+    
+    @property
+    def failed(self) -> List[BulkItem]:
+        """Items whose operation failed or was skipped."""
+        return [item for item in self.items if not item.ok]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary suitable for logging or JSON output."""
+        return {
+            "total": len(self.items),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "elapsed": self.elapsed,
+            "items": [
+                {
+                    "index": item.index,
+                    "action": item.operation.action,
+                    "post_id": item.operation.post_id,
+                    "ok": item.ok,
+                    "value": item.result.value if item.ok else None,
+                    "error": None if item.ok else item.result.get_message(),
+                    "status_code": None if item.ok else item.result.status_code,
+                    "elapsed": item.elapsed,
+                }
+                for item in self.items
+            ],
+        }
+
+
+def run_operations(
+    posts: "PostAPI",
+    operations: Sequence[PostOperation],
+    concurrency: int = 8,
+    skip_after_failure: bool = True,
+) -> BulkReport:
+    """
+    Run post mutations concurrently.
+    
+    Operations on the same post id run one after another in input order;
+    operations on different ids (and every create) run in parallel.
+    
+    Args:
+        posts: PostAPI used to execute the operations
+        operations: Operations to run
+        concurrency: Maximum number of requests in flight
+        skip_after_failure: Skip later operations on a post once one of its operations failed
+    """
+    groups: Dict[Hashable, List[Tuple[int, PostOperation]]] = {}
+    for index, operation in enumerate(operations):
+        if operation.action not in ("create", "update", "delete"):
+            raise ValueError(f"Unknown post operation: {operation.action!r}")
+        if operation.action != "create" and operation.post_id is None:
+            raise ValueError(f"{operation.action} operation requires post_id")
+        key = ("new", index) if operation.action == "create" else operation.post_id
+        groups.setdefault(key, []).append((index, operation))
+    
+    def run_group(group: List[Tuple[int, PostOperation]]) -> List[BulkItem]:
+        items = []
+        failed = False
+        for index, operation in group:
+            if failed and skip_after_failure:
+                result = Err(f"Skipped: an earlier operation on post {operation.post_id} failed")
+                items.append(BulkItem(index, operation, result, 0.0))
+                continue
+            start = time.perf_counter()
+            result = to_result(partial(_execute, posts), operation)
+            items.append(BulkItem(index, operation, result, time.perf_counter() - start))
+            failed = failed or result.is_err()
+        return items
+    
+    start = time.perf_counter()
+    items: List[BulkItem] = []
+    for _, group_result in map_bounded(run_group, groups.values(), concurrency, ordered=False):
+        # run_group never raises, so the result is always Ok
+        items.extend(group_result.unwrap())
+    items.sort(key=lambda item: item.index)
+    return BulkReport(items=items, elapsed=time.perf_counter() - start)
+
+
+def _execute(posts: "PostAPI", operation: PostOperation) -> Any:
+    if operation.action == "create":
+        return posts.create(operation.title, operation.body, publish=bool(operation.publish))
+    if operation.action == "update":
+        return posts.update(
+            operation.post_id,
+            title=operation.title,
+            body=operation.body,
+            publish=operation.publish,
+            base=operation.base,
+        )
+    return posts.delete(operation.post_id)
@@ -0,0 +1,252 @@
+"""Caches: HTTP responses for conditional GET requests and decoded models."""
+
+import copy
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the server to answer 304 if the body is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(pat: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Cache key for a GET request.
+    
+    Includes a digest of the PAT so that clients of different users can
+    share a backend without seeing each other's responses.
+    """
+    owner = hashlib.sha256(pat.encode("utf-8")).hexdigest()[:16]
+    if params:
+        query = urlencode(sorted(params.items()))
+        url = f"{url}{'&' if '?' in url else '?'}{query}"
+    return f"{owner} {url}"
+
+
+class CacheBackend:
+    """Interface of HTTP cache storage backends."""
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``key``, or None."""
+        raise NotImplementedError
+    
+    def set(self, key: str, entry: CachedResponse):
+        """Store ``entry`` under ``key``."""
+        raise NotImplementedError
+    
+    def delete(self, key: str):
+        """Drop ``key`` from the cache."""
+        raise NotImplementedError
+    
+    def clear(self):
+        """Drop every entry."""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe in-memory LRU cache.
+    
+    Args:
+        maxsize: Maximum number of cached responses
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    On-disk cache in a SQLite database, shared across processes and runs.
+    
+    Args:
+        path: Database file path
+        maxsize: Maximum number of cached responses (least recently stored are evicted)
+    """
+    
+    def __init__(self, path: Union[str, Path], maxsize: int = 10000):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY,"
+                " body BLOB NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " stored_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS http_cache_stored_at ON http_cache (stored_at)")
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(body=bytes(row[0]), etag=row[1], last_modified=row[2], stored_at=row[3])
+    
+    def set(self, key: str, entry: CachedResponse):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, body, etag, last_modified, stored_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, entry.body, entry.etag, entry.last_modified, entry.stored_at or time.time()),
+            )
+            # Evict only once the table outgrows maxsize, and then just the excess
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()
+            if count > self.maxsize:
+                self._conn.execute(
+                    "DELETE FROM http_cache WHERE key IN"
+                    " (SELECT key FROM http_cache ORDER BY stored_at LIMIT ?)",
+                    (count - self.maxsize,),
+                )
+    
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+    
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM http_cache")
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ModelCache:
+    """
+    Thread-safe TTL + LRU cache of decoded model objects.
+    
+    Entries are grouped by kind (``"post"``, ``"post_list"``, ``"user"``,
+    ``"news"``), each with its own time to live; all kinds share one size
+    bound with least-recently-used eviction. Values are stored and returned
+    as shallow copies, so callers may modify what they get back.
+    
+    Args:
+        maxsize: Maximum number of cached values
+        ttls: Per kind time to live in seconds, merged over ``DEFAULT_TTLS``
+    """
+    
+    DEFAULT_TTLS: Dict[str, float] = {
+        "post": 60.0,
+        "post_list": 30.0,
+        "user": 300.0,
+        "news": 60.0,
+    }
+    
+    def __init__(self, maxsize: int = 1024, ttls: Optional[Dict[str, float]] = None):
+        self.maxsize = maxsize
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, kind: str, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached value, or None if missing or expired."""
+        with self._lock:
+            item = self._entries.get((kind, key))
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._entries[(kind, key)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((kind, key))
+            self.hits += 1
+            return _copy_value(item[1])
+    
+    def set(self, kind: str, key: Hashable, value: Any):
+        """Cache ``value``; kinds with a TTL of 0 are not cached."""
+        ttl = self.ttls.get(kind, 0.0)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(kind, key)] = (time.monotonic() + ttl, _copy_value(value))
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, kind: str, key: Optional[Hashable] = None):
+        """Drop one entry, or every entry of ``kind`` when ``key`` is None."""
+        with self._lock:
+            if key is not None:
+                self._entries.pop((kind, key), None)
+                return
+            for entry_key in [k for k in self._entries if k[0] == kind]:
+                del self._entries[entry_key]
+    
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _copy_value(value: Any) -> Any:
+    """Shallow-copy a model, or the models inside a list/tuple."""
+    if isinstance(value, list):
+        return [copy.copy(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_value(item) for item in value)
+    if isinstance(value, (int, float, str, type(None))):
+        return value
+    return copy.copy(value)
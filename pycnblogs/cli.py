@@ -0,0 +1,277 @@
+"""
+Command-line interface (``pycnblogs`` console script, ``python -m pycnblogs``).
+
+Examples::
+
+    pycnblogs login <PAT>
+    pycnblogs post list --take 20
+    pycnblogs post create --title "Hello" --file hello.md --publish
+    pycnblogs ing publish "闪存内容"
+    pycnblogs --json news
+
+Commands are sent to the background daemon (``pycnblogs daemon start``)
+when one is running, otherwise they run in this process. Only this module
+and :mod:`pycnblogs.daemon` are imported on the daemon path, so a command
+costs one interpreter start and a socket round trip.
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from . import daemon
+from .constants import BLOG_BACKEND, OPENAPI
+from .exceptions import CnblogsError
+from .result import Err
+from .session import remove_pat, save_pat
+from .utils import format_error
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pycnblogs", description="博客园命令行工具")
+    parser.add_argument("--json", action="store_true", help="以JSON格式输出")
+    parser.add_argument("--no-daemon", action="store_true", help="不使用后台进程，直接在本进程中执行")
+    parser.add_argument("--blog-backend", default=BLOG_BACKEND, help=argparse.SUPPRESS)
+    parser.add_argument("--openapi", default=OPENAPI, help=argparse.SUPPRESS)
+    parser.set_defaults(command=None)
+    commands = parser.add_subparsers(metavar="<command>")
+    
+    login = commands.add_parser("login", help="保存PAT到 ~/.cnbrc")
+    login.add_argument("pat")
+    login.set_defaults(command="login")
+    commands.add_parser("logout", help="删除保存的PAT").set_defaults(command="logout")
+    commands.add_parser("user", help="当前用户信息").set_defaults(command="user")
+    
+    post = commands.add_parser("post", help="文章").add_subparsers(metavar="<action>", required=True)
+    post_list = post.add_parser("list", help="列出文章")
+    _add_paging(post_list)
+    post_list.set_defaults(command="post list")
+    post_show = post.add_parser("show", help="显示文章")
+    post_show.add_argument("id", type=int)
+    post_show.set_defaults(command="post show")
+    post_create = post.add_parser("create", help="创建文章")
+    post_create.add_argument("--title", required=True)
+    _add_body(post_create)
+    post_create.add_argument("--publish", action="store_true", help="立即发布（默认为草稿）")
+    post_create.set_defaults(command="post create")
+    post_update = post.add_parser("update", help="更新文章，未指定的字段保持不变")
+    post_update.add_argument("id", type=int)
+    post_update.add_argument("--title")
+    _add_body(post_update)
+    post_update.add_argument("--publish", dest="publish", action="store_const", const=True, default=None, help="发布")
+    post_update.add_argument("--draft", dest="publish", action="store_const", const=False, help="转为草稿")
+    post_update.set_defaults(command="post update")
+    post_delete = post.add_parser("delete", help="删除文章")
+    post_delete.add_argument("id", type=int)
+    post_delete.set_defaults(command="post delete")
+    
+    ing = commands.add_parser("ing", help="闪存").add_subparsers(metavar="<action>", required=True)
+    ing_publish = ing.add_parser("publish", help="发布闪存")
+    ing_publish.add_argument("content")
+    ing_publish.add_argument("--private", action="store_true", help="仅自己可见")
+    ing_publish.set_defaults(command="ing publish")
+    ing_list = ing.add_parser("list", help="列出闪存")
+    _add_paging(ing_list)
+    ing_list.add_argument("--type", dest="ing_type", type=int, default=1, help="闪存类型（默认1：全站）")
+    ing_list.set_defaults(command="ing list")
+    
+    news = commands.add_parser("news", help="新闻")
+    _add_paging(news)
+    news.set_defaults(command="news")
+    fav = commands.add_parser("fav", help="收藏")
+    _add_paging(fav)
+    fav.set_defaults(command="fav")
+    
+    background = commands.add_parser("daemon", help="后台进程（复用连接和缓存）").add_subparsers(metavar="<action>", required=True)
+    background_start = background.add_parser("start", help="启动后台进程")
+    background_start.add_argument("--idle", type=float, default=daemon.DEFAULT_IDLE_TIMEOUT, help="空闲多少秒后自动退出")
+    background_start.set_defaults(command="daemon start")
+    background.add_parser("stop", help="停止后台进程").set_defaults(command="daemon stop")
+    background.add_parser("status", help="后台进程状态").set_defaults(command="daemon status")
+    return parser
+
+
+def _add_paging(parser: argparse.ArgumentParser):
+    parser.add_argument("--skip", type=int, default=0)
+    parser.add_argument("--take", type=int, default=10)
+
+
+def _add_body(parser: argparse.ArgumentParser):
+    body = parser.add_mutually_exclusive_group()
+    body.add_argument("--body", help="正文")
+    body.add_argument("--file", help="从文件读取正文（- 表示标准输入）")
+
+
+def _as_dict(entry: Any) -> Dict[str, Any]:
+    """Model as a dict, leaving out a post body that was never loaded."""
+    skip_body = not getattr(entry, "is_body_loaded", True)
+    return {f.name: getattr(entry, f.name) for f in fields(entry) if not (skip_body and f.name == "body")}
+
+
+def _dump(out: TextIO, value: Any):
+    out.write(json.dumps(value, ensure_ascii=False, indent=2) + "\n")
+
+
+def _user(client, args, out):
+    user = client.user.get_info()
+    if args.json:
+        return _dump(out, _as_dict(user))
+    out.write(f"{user.display_name}（{user.blog_app}）\n粉丝 {user.followers_count}，关注 {user.following_count}\n")
+
+
+def _post_list(client, args, out):
+    posts, total = client.post.get_list(args.skip, args.take)
+    if args.json:
+        return _dump(out, {"total": total, "posts": [_as_dict(post) for post in posts]})
+    for post in posts:
+        state = "" if post.is_published else "[草稿] "
+        out.write(f"{post.id}\t{post.create_time[:10]}\t{state}{post.title}\n")
+    out.write(f"共 {total} 篇\n")
+
+
+def _post_show(client, args, out):
+    post = client.post.get_one(args.id)
+    if args.json:
+        return _dump(out, _as_dict(post))
+    out.write(f"{post.title}\n{post.full_url}\n创建 {post.create_time}，修改 {post.modify_time}\n\n{post.body or ''}\n")
+
+
+def _post_create(client, args, out):
+    result = client.post.create(args.title, args.body or "", args.publish)
+    if isinstance(result, Err):
+        return result
+    out.write(f"{result}\n")
+
+
+def _post_update(client, args, out):
+    if args.title is None and args.body is None and args.publish is None:
+        return Err("Nothing to update: give --title, --body/--file, --publish or --draft")
+    result = client.post.update(args.id, title=args.title, body=args.body, publish=args.publish)
+    if isinstance(result, Err):
+        return result
+    out.write(f"{result}\n")
+
+
+def _post_delete(client, args, out):
+    return client.post.delete(args.id)
+
+
+def _ing_publish(client, args, out):
+    return client.ing.publish(args.content, is_private=args.private)
+
+
+def _ing_list(client, args, out):
+    ings = client.ing.get_list(args.skip, args.take, args.ing_type)
+    if args.json:
+        return _dump(out, [_as_dict(ing) for ing in ings])
+    for ing in ings:
+        out.write(f"{ing.id}\t{ing.user_display_name}：{ing.content}\n")
+
+
+def _news(client, args, out):
+    items = client.news.get_list(args.skip, args.take)
+    if args.json:
+        return _dump(out, [_as_dict(item) for item in items])
+    for item in items:
+        out.write(f"{item.id}\t{item.title}\t{item.full_url}\n")
+
+
+def _fav(client, args, out):
+    items = client.fav.get_list(args.skip, args.take)
+    if args.json:
+        return _dump(out, [_as_dict(item) for item in items])
+    for item in items:
+        out.write(f"{item.title}\t{item.full_url}\n")
+
+
+# Commands that need a client; they run in this process or in the daemon
+COMMANDS: Dict[str, Callable[[Any, argparse.Namespace, TextIO], Optional[Err]]] = {
+    "user": _user,
+    "post list": _post_list,
+    "post show": _post_show,
+    "post create": _post_create,
+    "post update": _post_update,
+    "post delete": _post_delete,
+    "ing publish": _ing_publish,
+    "ing list": _ing_list,
+    "news": _news,
+    "fav": _fav,
+}
+
+
+def execute(client, args: argparse.Namespace, out: TextIO, err: TextIO) -> int:
+    """
+    Run a client command and return its exit status.
+    
+    Output goes to ``out`` and errors to ``err``, so the daemon can send
+    both back to the invoking process.
+    """
+    try:
+        result = COMMANDS[args.command](client, args, out)
+    except CnblogsError as e:
+        err.write(f"错误: {e}\n")
+        return 1
+    if isinstance(result, Err):
+        err.write(format_error(result) + "\n")
+        return 1
+    return 0
+
+
+def _read_body(path: str) -> str:
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _run_local(command: str, args: argparse.Namespace) -> int:
+    if command == "login":
+        daemon.stop()
+        print(f"PAT已保存到 {save_pat(args.pat)}")
+    elif command == "logout":
+        daemon.stop()
+        print(f"PAT已从 {remove_pat()} 删除")
+    elif command == "daemon start":
+        state = daemon.ping()
+        pid = state["pid"] if state else daemon.start(
+            blog_backend=args.blog_backend, openapi=args.openapi, idle_timeout=args.idle,
+        )
+        print(f"后台进程运行中（pid {pid}）")
+    elif command == "daemon stop":
+        print("后台进程已停止" if daemon.stop() else "后台进程未运行")
+    elif command == "daemon status":
+        state = daemon.ping()
+        if state is None:
+            print("后台进程未运行")
+            return 1
+        print(f"后台进程运行中（pid {state['pid']}，已执行 {state['served']} 条命令）")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    try:
+        if args.command not in COMMANDS:
+            return _run_local(args.command, args)
+        if getattr(args, "file", None):
+            args.body = _read_body(args.file)
+        if not args.no_daemon:
+            reply = daemon.request({"command": "run", "args": vars(args)})
+            if reply is not None and not reply.get("mismatch"):
+                sys.stdout.write(reply["stdout"])
+                sys.stderr.write(reply["stderr"])
+                return reply["code"]
+        
+        from .client import CnblogsClient
+        
+        with CnblogsClient(blog_backend=args.blog_backend, openapi=args.openapi) as client:
+            return execute(client, args, sys.stdout, sys.stderr)
+    except (CnblogsError, OSError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
@@ -1,288 +1,497 @@
 """博客园客户端"""
 
-from typing import Optional, List, Tuple, Union
-from .http_client import HTTPClient
-from .models import PostEntry, UserInfo, IngEntry, NewsEntry, FavEntry
-from .result import Ok, Err, Result
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Union, Iterator, Iterable, Sequence
+from .result import Err, Result
 from .session import save_pat, load_pat, remove_pat
 from .constants import BLOG_BACKEND, OPENAPI
+from .api_base import PostAPIBase, UserAPIBase, IngAPIBase, NewsAPIBase, FavAPIBase, to_ok
+from .retry import RetryPolicy, RetryStats
+from .tracing import traced
 
+# 模型、缓存、分页等模块在用到它们的方法中导入，
+# 这样只调用 CnblogsClient.login() 等方法的脚本不必加载它们
+if TYPE_CHECKING:
+    import requests
+    from .models import (
+        PostEntry, UserInfo, IngEntry, NewsEntry, FavEntry,
+        PostRecord, IngRecord, NewsRecord, FavRecord,
+    )
+    from .ratelimit import RateLimiter
+    from .cache import CacheBackend, ModelCache
+    from .metrics import RequestHooks
+    from .tracing import Tracer
+    from .bulk import PostOperation, BulkReport
+    from .poller import IngPoller
+    from .publisher import IngPublishQueue
+    from .http_client import HTTPClient
+    from .pool import PoolConfig
 
-class PostAPI:
+
+class PostAPI(PostAPIBase):
     """文章API"""
     
-    def __init__(self, client: HTTPClient):
-        self.client = client
+    def __init__(
+        self,
+        client: "HTTPClient",
+        model_cache: Optional["ModelCache"] = None,
+        lazy_body: bool = True,
+        base_url: str = BLOG_BACKEND,
+    ):
+        super().__init__(client, model_cache, base_url)
+        self.lazy_body = lazy_body
     
+    @traced("post.get_count")
     def get_count(self) -> int:
         """获取文章总数"""
-        url = f"{BLOG_BACKEND}/posts/list"
-        params = {"t": 1, "p": 1, "s": 1}
-        data = self.client.get_with_params(url, params)
+        data = self.client.get_with_params(*self._list_request(1, 1))
         return data.get("postsCount", 0)
     
-    def get_one(self, post_id: int) -> PostEntry:
+    @traced("post.get_one")
+    def get_one(self, post_id: int) -> "PostEntry":
         """获取单篇文章"""
-        url = f"{BLOG_BACKEND}/posts/{post_id}"
-        data = self.client.get(url)
+        key = self._post_key(post_id)
+        cached = self._cached("post", key)
+        if cached is not None:
+            return cached
+        
+        post = self._fetch_one(post_id)
+        self._store("post", key, post)
+        return post
+    
+    def _fetch_one(self, post_id: int) -> "PostEntry":
+        """从服务器获取单篇文章（不经过模型缓存）"""
+        return self._parse_one(self.client.get(self._post_url(post_id)))
+    
+    @traced("post.get_many", iterates=True)
+    def get_many(
+        self,
+        post_ids: Iterable[int],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[int, Result]]:
+        """
+        并发获取多篇文章
         
-        if "blogPost" in data:
-            post_data = data["blogPost"]
+        所有请求共享同一个会话的连接池；单篇失败以 Err 返回，不会中断整批。
+        
+        Args:
+            post_ids: 文章ID列表
+            concurrency: 最大并发请求数
+            ordered: True按输入顺序返回，False按完成顺序返回
+        
+        Returns:
+            (文章ID, Ok(PostEntry) 或 Err) 的迭代器
+        """
+        from .concurrency import map_bounded
+        
+        return map_bounded(self.get_one, post_ids, concurrency, ordered)
+    
+    def _fetch_page(self, page: int, page_size: int, compact: bool = False) -> Tuple[List["PostEntry"], int]:
+        """获取一页文章（不含正文）及文章总数；compact 为 True 时返回 PostRecord"""
+        from .models import parse_post, parse_post_record
+        from .lazy import BodyLoader
+        
+        url, params = self._list_request(page, page_size)
+        extra = {}
+        items = self.client.get_items(url, params, key="postList", extra=extra)
+        if compact:
+            posts = [parse_post_record(item) for item in items]
         else:
-            post_data = data
-        
-        return PostEntry(
-            id=post_data["id"],
-            title=post_data["title"],
-            url=post_data["url"],
-            create_time=post_data["datePublished"],
-            modify_time=post_data["dateUpdated"],
-            is_draft=post_data["isDraft"],
-            is_pinned=post_data["isPinned"],
-            is_published=post_data["isPublished"],
-            comment_count=post_data.get("feedBackCount"),
-            body=post_data.get("postBody"),
-            tags=post_data.get("tags"),
-        )
+            posts = [parse_post(item, with_body=False) for item in items]
+            if self.lazy_body:
+                BodyLoader(self).attach(posts)
+        return posts, extra.get("postsCount", 0)
     
-    def get_list(self, skip: int = 0, take: int = 10) -> Tuple[List[PostEntry], int]:
+    @traced("post.get_list")
+    def get_list(self, skip: int = 0, take: int = 10) -> Tuple[List["PostEntry"], int]:
         """获取文章列表"""
-        url = f"{BLOG_BACKEND}/posts/list"
-        params = {"t": 1, "p": 1, "s": 1}
-        data = self.client.get_with_params(url, params)
-        total = data.get("postsCount", 0)
-        
-        if total == 0:
-            return [], 0
-        
-        posts = []
-        start_page = skip + 1
-        end_page = min(skip + take, total)
-        
-        for page in range(start_page, end_page + 1):
-            params = {"t": 1, "p": page, "s": 1}
-            data = self.client.get_with_params(url, params)
-            
-            post_list = data.get("postList", [])
-            if post_list:
-                item = post_list[0]
-                posts.append(PostEntry(
-                    id=item["id"],
-                    title=item["title"],
-                    url=item["url"],
-                    create_time=item["datePublished"],
-                    modify_time=item["dateUpdated"],
-                    is_draft=item["isDraft"],
-                    is_pinned=item["isPinned"],
-                    is_published=item["isPublished"],
-                    comment_count=item.get("feedBackCount"),
-                ))
+        from .paging import PageWindow
+        
+        if take <= 0:
+            return [], self.get_count()
         
+        key = self._list_key(skip, take)
+        cached = self._cached("post_list", key)
+        if cached is not None:
+            return cached
+        
+        window = PageWindow(skip, take, self.MAX_PAGE_SIZE)
+        for page in window.pages:
+            if not window.add(page, *self._fetch_page(page, window.page_size)):
+                break
+        
+        posts, total = window.result()
+        self._store("post_list", key, (posts, total))
         return posts, total
     
+    @traced("post.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = PostAPIBase.MAX_PAGE_SIZE,
+        compact: bool = False,
+    ) -> Iterator[Union["PostEntry", "PostRecord"]]:
+        """
+        逐页遍历所有文章（不含正文）
+        
+        Args:
+            limit: 最多返回的文章数（None表示不限）
+            page_size: 每页请求的文章数
+            compact: 产出不可变的紧凑记录 PostRecord（可放入 PostTable），适合大量数据
+        """
+        from .paging import fit_page_size, iter_pages
+        
+        page_size = fit_page_size(page_size, limit)
+        return iter_pages(lambda page: self._fetch_page(page, page_size, compact)[0], page_size, limit)
+    
+    @traced("post.load_bodies")
+    def load_bodies(self, posts: Iterable["PostEntry"], concurrency: int = 8) -> Dict[int, Err]:
+        """
+        并发加载列表文章中尚未加载的正文
+        
+        Returns:
+            加载失败的 {文章ID: Err}
+        """
+        from .lazy import load_bodies
+        
+        return load_bodies(self, posts, concurrency)
+    
+    @traced("post.create")
     def create(self, title: str, body: str, publish: bool = False) -> Union[int, Result]:
         """创建文章"""
-        url = f"{BLOG_BACKEND}/posts"
-        payload = {
-            "postType": 1,
-            "title": title,
-            "postBody": body,
-            "isPublished": publish,
-            "displayOnHomePage": True,
-        }
-        result = self.client.post(url, payload, raise_on_error=False)
-        
-        if isinstance(result, Err):
-            return result
-        return result.get("id", 0)
+        url = f"{self.base_url}/posts"
+        result = self.client.post(url, self._create_payload(title, body, publish), raise_on_error=False)
+        self._invalidate()
+        return self._created_id(result)
     
+    @traced("post.update")
     def update(
         self,
         post_id: int,
         title: Optional[str] = None,
         body: Optional[str] = None,
         publish: Optional[bool] = None,
+        base: Optional["PostEntry"] = None,
+        expected_modify_time: Optional[str] = None,
     ) -> Union[int, Result]:
-        """更新文章"""
-        current = self.get_one(post_id)
-        
-        url = f"{BLOG_BACKEND}/posts"
-        payload = {
-            "id": post_id,
-            "postType": 1,
-            "title": title if title is not None else current.title,
-            "postBody": body if body is not None else current.body,
-            "isPublished": publish if publish is not None else current.is_published,
-            "displayOnHomePage": True,
-        }
+        """
+        更新文章
         
-        result = self.client.post(url, payload, raise_on_error=False)
+        title、body、publish 全部提供时只发送一次请求；否则未提供的字段依次取自
+        base、模型缓存，最后才会读取文章。
         
-        if isinstance(result, Err):
-            return result
+        Args:
+            post_id: 文章ID
+            title: 新标题，None表示不变
+            body: 新正文，None表示不变
+            publish: 是否发布，None表示不变
+            base: 调用方已持有的文章当前状态（缺正文时仍会读取文章）
+            expected_modify_time: 乐观并发检查：先读取文章（多一次GET，此时不使用 base），
+                服务器上的 modify_time 与此不同时放弃更新并返回409
+        """
+        current = base
+        if expected_modify_time is not None:
+            # 版本只能与服务器上的文章比较（不经过模型缓存），读到的文章同时补齐未提供的字段
+            current = self._fetch_one(post_id)
+            conflict = self._check_version(post_id, current, expected_modify_time)
+            if conflict is not None:
+                return conflict
+        elif (title is None or body is None or publish is None) and self._base_is_incomplete(base, body):
+            current = self.get_one(post_id)
         
-        if isinstance(result, dict) and "id" in result:
-            return result["id"]
-        return post_id
+        url = f"{self.base_url}/posts"
+        payload = self._update_payload(post_id, title, body, publish, current)
+        result = self.client.post(url, payload, raise_on_error=False)
+        self._invalidate(post_id)
+        return self._updated_id(result, post_id)
     
+    @traced("post.delete")
     def delete(self, post_id: int) -> Result:
         """删除文章"""
-        url = f"{BLOG_BACKEND}/posts/{post_id}"
-        result = self.client.delete(url, raise_on_error=False)
+        result = self.client.delete(self._post_url(post_id), raise_on_error=False)
+        self._invalidate(post_id)
+        return to_ok(result)
+    
+    @traced("post.bulk")
+    def bulk(
+        self,
+        operations: Sequence["PostOperation"],
+        concurrency: int = 8,
+        skip_after_failure: bool = True,
+    ) -> "BulkReport":
+        """
+        批量执行文章的创建、更新和删除
+        
+        不同文章的操作在共享连接池上并发执行；同一篇文章的多个操作按输入顺序依次执行。
+        
+        Args:
+            operations: PostOperation 列表
+            concurrency: 最大并发请求数
+            skip_after_failure: 同一篇文章的某个操作失败后，跳过它后续的操作
         
-        if isinstance(result, Err):
-            return result
-        return Ok(None)
+        Returns:
+            BulkReport，按输入顺序包含每个操作的 Ok/Err 结果和耗时
+        """
+        from .bulk import run_operations
+        
+        return run_operations(self, operations, concurrency, skip_after_failure)
 
 
-class UserAPI:
+class UserAPI(UserAPIBase):
     """用户API"""
     
-    def __init__(self, client: HTTPClient):
-        self.client = client
-    
-    def get_info(self) -> UserInfo:
+    @traced("user.get_info")
+    def get_info(self) -> "UserInfo":
         """获取用户信息"""
-        url = f"{OPENAPI}/users"
-        data = self.client.get(url)
-        
-        return UserInfo(
-            user_id=data["UserId"],
-            space_user_id=data["SpaceUserID"],
-            blog_id=data["BlogId"],
-            display_name=data["DisplayName"],
-            face=data["Face"],
-            avatar=data["Avatar"],
-            seniority=data["Seniority"],
-            blog_app=data["BlogApp"],
-            following_count=data["FollowingCount"],
-            followers_count=data["FollowerCount"],
-            is_vip=data["IsVip"],
-            joined=data["Joined"],
-        )
+        from .models import parse_user
+        
+        key = self._user_key()
+        if self.model_cache is not None:
+            cached = self.model_cache.get("user", key)
+            if cached is not None:
+                return cached
+        
+        user = parse_user(self.client.get(self._user_url()))
+        if self.model_cache is not None:
+            self.model_cache.set("user", key, user)
+        return user
 
 
-class IngAPI:
+class IngAPI(IngAPIBase):
     """闪存API"""
     
-    def __init__(self, client: HTTPClient):
-        self.client = client
-    
+    @traced("ing.publish")
     def publish(self, content: str, is_private: bool = False, ignore_duplicate: bool = True) -> Result:
         """发布闪存"""
-        url = f"{OPENAPI}/statuses"
-        payload = {
-            "content": content,
-            "isPrivate": is_private,
-            "clientType": 13,
-        }
+        url, payload = self._publish_request(content, is_private)
         result = self.client.post(url, payload, raise_on_error=False)
+        return self._published(result, ignore_duplicate)
+    
+    def _fetch_page(self, page_index: int, page_size: int, ing_type: int, compact: bool = False) -> List["IngEntry"]:
+        """获取一页闪存；compact 为 True 时返回 IngRecord"""
+        from .models import parse_ing, parse_ing_record
         
-        if isinstance(result, Err):
-            if ignore_duplicate and "相同闪存已发布" in result.error:
-                return Ok(None)
-            return result
-        return Ok(None)
+        parse = parse_ing_record if compact else parse_ing
+        return [parse(item) for item in self.client.get_items(self._page_url(page_index, page_size, ing_type))]
+    
+    @traced("ing.get_page")
+    def get_page(self, page_index: int = 1, page_size: int = IngAPIBase.PAGE_SIZE, ing_type: int = 1) -> List["IngEntry"]:
+        """获取一页闪存（从最新一条开始，page_index 从1开始）"""
+        return self._fetch_page(page_index, page_size, ing_type)
     
-    def get_list(self, skip: int = 0, take: int = 10, ing_type: int = 1) -> List[IngEntry]:
+    @traced("ing.get_list")
+    def get_list(self, skip: int = 0, take: int = 10, ing_type: int = 1) -> List["IngEntry"]:
         """获取闪存列表"""
-        url = f"{OPENAPI}/statuses/@{ing_type}?pageIndex={skip // take + 1}&pageSize={take}"
-        data = self.client.get(url)
-        
-        ings = []
-        for item in data:
-            ings.append(IngEntry(
-                id=item["Id"],
-                content=item["Content"],
-                user_alias=item["UserAlias"],
-                user_display_name=item["UserDisplayName"],
-                create_time=item["DateAdded"],
-                comment_count=item["CommentCount"],
-                lucky_count=item.get("LuckyCount", 0),
-            ))
-        
-        return ings
+        return self._fetch_page(skip // take + 1, take, ing_type)
+    
+    @traced("ing.iter_all", iterates=True)
+    def iter_all(
+        self,
+        ing_type: int = 1,
+        limit: Optional[int] = None,
+        page_size: int = IngAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> Iterator[Union["IngEntry", "IngRecord"]]:
+        """
+        逐页遍历所有闪存
+        
+        Args:
+            ing_type: 闪存类型
+            limit: 最多返回的闪存数（None表示不限）
+            page_size: 每页请求的闪存数
+            compact: 产出不可变的紧凑记录 IngRecord（可放入 IngTable），适合大量数据
+        """
+        from .paging import fit_page_size, iter_pages
+        
+        page_size = fit_page_size(page_size, limit)
+        return iter_pages(lambda page: self._fetch_page(page, page_size, ing_type, compact), page_size, limit)
+    
+    def poller(self, ing_type: int = 1, since_id: Optional[int] = None, **options) -> "IngPoller":
+        """
+        轮询新发布的闪存
+        
+        每次轮询从最新一条读到已见过的ID为止（不重复返回），轮询间隔随发布速度自适应。
+        
+        Args:
+            ing_type: 闪存类型
+            since_id: 只返回ID更大的闪存，None表示从当前最新一条开始
+            options: 其他 IngPoller 参数（page_size、min_interval、max_interval、backfill 等）
+        """
+        from .poller import IngPoller
+        
+        options.setdefault("tracer", self.client.tracer)
+        return IngPoller(self, ing_type, since_id, **options)
+    
+    def publish_queue(self, concurrency: int = 4, dedupe_window: float = 3600.0, **options) -> "IngPublishQueue":
+        """
+        批量发布闪存的队列
+        
+        dedupe_window 秒内发布过（或同一批中重复）的内容直接报告为重复，不发送请求；
+        并发发布，5xx失败时按重试策略重试（429和连接失败由客户端重试），flush() 返回每一条的状态。
+        
+        Args:
+            concurrency: 最大并发请求数（1表示按入队顺序发布）
+            dedupe_window: 本地记住已发布内容的秒数
+            options: 其他 IngPublishQueue 参数（retry 等）
+        """
+        from .publisher import IngPublishQueue
+        
+        return IngPublishQueue(self, concurrency, dedupe_window, **options)
     
+    @traced("ing.comment")
     def comment(self, ing_id: int, content: str) -> Result:
         """评论闪存"""
-        url = f"{OPENAPI}/statuses/{ing_id}/comments"
-        payload = {"content": content}
-        result = self.client.post(url, payload, raise_on_error=False)
-        
-        if isinstance(result, Err):
-            return result
-        return Ok(None)
+        url, payload = self._comment_request(ing_id, content)
+        return to_ok(self.client.post(url, payload, raise_on_error=False))
 
 
-class NewsAPI:
+class NewsAPI(NewsAPIBase):
     """新闻API"""
     
-    def __init__(self, client: HTTPClient):
-        self.client = client
+    def _fetch_page(self, page_index: int, page_size: int, compact: bool = False) -> List["NewsEntry"]:
+        """获取一页新闻；compact 为 True 时返回 NewsRecord"""
+        from .models import parse_news, parse_news_record
+        
+        parse = parse_news_record if compact else parse_news
+        return [parse(item) for item in self.client.get_items(self._page_url(page_index, page_size))]
     
-    def get_list(self, skip: int = 0, take: int = 10) -> List[NewsEntry]:
+    @traced("news.get_list")
+    def get_list(self, skip: int = 0, take: int = 10) -> List["NewsEntry"]:
         """获取新闻列表"""
-        page_index = skip // take + 1
-        url = f"{OPENAPI}/newsitems/@sitehome?pageIndex={page_index}&pageSize={take}"
-        data = self.client.get(url)
-        
-        news_list = []
-        for item in data:
-            news_list.append(NewsEntry(
-                id=item["Id"],
-                title=item["Title"],
-                summary=item["Summary"],
-                url=item["Url"],
-                view_count=item["ViewCount"],
-                comment_count=item["CommentCount"],
-                digg_count=item["DiggCount"],
-                create_time=item["DateAdded"],
-            ))
+        key = self._list_key(skip, take)
+        if self.model_cache is not None:
+            cached = self.model_cache.get("news", key)
+            if cached is not None:
+                return cached
         
+        news_list = self._fetch_page(skip // take + 1, take)
+        if self.model_cache is not None:
+            self.model_cache.set("news", key, news_list)
         return news_list
+    
+    @traced("news.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = NewsAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> Iterator[Union["NewsEntry", "NewsRecord"]]:
+        """
+        逐页遍历所有新闻
+        
+        Args:
+            limit: 最多返回的新闻数（None表示不限）
+            page_size: 每页请求的新闻数
+            compact: 产出不可变的紧凑记录 NewsRecord（可放入 NewsTable），适合大量数据
+        """
+        from .paging import fit_page_size, iter_pages
+        
+        page_size = fit_page_size(page_size, limit)
+        return iter_pages(lambda page: self._fetch_page(page, page_size, compact), page_size, limit)
 
 
-class FavAPI:
+class FavAPI(FavAPIBase):
     """收藏API"""
     
-    def __init__(self, client: HTTPClient):
-        self.client = client
+    def _fetch_page(self, page_index: int, page_size: int, compact: bool = False) -> List["FavEntry"]:
+        """获取一页收藏；compact 为 True 时返回 FavRecord"""
+        from .models import parse_fav, parse_fav_record
+        
+        parse = parse_fav_record if compact else parse_fav
+        return [parse(item) for item in self.client.get_items(self._page_url(page_index, page_size))]
     
-    def get_list(self, skip: int = 0, take: int = 10) -> List[FavEntry]:
+    @traced("fav.get_list")
+    def get_list(self, skip: int = 0, take: int = 10) -> List["FavEntry"]:
         """获取收藏列表"""
-        page_index = skip // take + 1
-        url = f"{OPENAPI}/wz?pageIndex={page_index}&pageSize={take}"
-        data = self.client.get(url)
-        
-        favs = []
-        for item in data:
-            favs.append(FavEntry(
-                id=item["Id"],
-                title=item["Title"],
-                url=item["Url"],
-                create_time=item["DateAdded"],
-            ))
-        
-        return favs
+        return self._fetch_page(skip // take + 1, take)
+    
+    @traced("fav.iter_all", iterates=True)
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = FavAPIBase.PAGE_SIZE,
+        compact: bool = False,
+    ) -> Iterator[Union["FavEntry", "FavRecord"]]:
+        """
+        逐页遍历所有收藏
+        
+        Args:
+            limit: 最多返回的收藏数（None表示不限）
+            page_size: 每页请求的收藏数
+            compact: 产出不可变的紧凑记录 FavRecord（可放入 FavTable），适合大量数据
+        """
+        from .paging import fit_page_size, iter_pages
+        
+        page_size = fit_page_size(page_size, limit)
+        return iter_pages(lambda page: self._fetch_page(page, page_size, compact), page_size, limit)
 
 
 class CnblogsClient:
     """博客园客户端"""
     
-    def __init__(self, pat: Optional[str] = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        pat: Optional[str] = None,
+        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional["RateLimiter"] = None,
+        cache: Optional["CacheBackend"] = None,
+        model_cache: Optional["ModelCache"] = None,
+        max_response_size: Optional[int] = None,
+        stream_json: bool = False,
+        lazy_body: bool = True,
+        hooks: Optional["RequestHooks"] = None,
+        tracer: Optional["Tracer"] = None,
+        blog_backend: str = BLOG_BACKEND,
+        openapi: str = OPENAPI,
+        session: Optional["requests.Session"] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        pool: Optional["PoolConfig"] = None,
+        share_session: bool = False,
+    ):
         """
         初始化客户端
         
         Args:
             pat: Personal Access Token（可选，不提供则从~/.cnbrc加载）
             timeout: 请求超时时间（秒）
+            retry: 重试策略（默认对幂等请求重试3次），None表示不重试
+            rate_limiter: 客户端限流器（令牌桶），同一实例可在多个客户端间共享
+            cache: HTTP缓存后端（MemoryCache/SQLiteCache），读接口发送条件请求并复用304响应
+            model_cache: 模型缓存（按类型TTL + LRU），文章的增删改会自动失效对应缓存
+            max_response_size: 响应体最大字节数，超出时抛出 ResponseTooLargeError，None表示不限制
+            stream_json: 列表接口边接收边解码（未配置 cache 时生效），降低大页的峰值内存
+            lazy_body: 文章列表项首次读取 body 时自动（分批并发）下载正文
+            hooks: 请求事件钩子（RequestHooks），传入 Metrics 即可统计各接口的请求数与延迟
+            tracer: 追踪器（Tracer/OpenTelemetryTracer），每次接口调用生成一个span，其中每个HTTP请求为子span
+            blog_backend: 文章接口的根地址（默认 https://i.cnblogs.com/api），可指向缓存代理或本地模拟服务器
+            openapi: 用户、闪存、新闻、收藏接口的根地址（默认 https://api.cnblogs.com/api）
+            session: 自定义的 requests 会话（连接池、代理、证书等），由调用方负责关闭
+            proxies: 代理，如 {"https": "http://127.0.0.1:8080"}
+            pool: 连接池设置（PoolConfig：每个主机的连接数、是否阻塞等待、TCP keep-alive），并发数较高时调大 maxsize
+            share_session: 与同一进程中相同PAT的其他客户端共享会话，短生命周期的客户端可复用已建立的TLS连接
         """
         if pat is None:
             pat = load_pat()
         
         self.pat = pat
         self.timeout = timeout
-        self._http_client: Optional[HTTPClient] = None
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.model_cache = model_cache
+        self.max_response_size = max_response_size
+        self.stream_json = stream_json
+        self.lazy_body = lazy_body
+        self.hooks = hooks
+        self.tracer = tracer
+        self.blog_backend = blog_backend.rstrip("/")
+        self.openapi = openapi.rstrip("/")
+        self.session = session
+        self.proxies = proxies
+        self.pool = pool
+        self.share_session = share_session
+        self._http_client: Optional["HTTPClient"] = None
         self._post: Optional[PostAPI] = None
         self._user: Optional[UserAPI] = None
         self._ing: Optional[IngAPI] = None
@@ -290,18 +499,42 @@ class CnblogsClient:
         self._fav: Optional[FavAPI] = None
     
     def __enter__(self):
-        self._http_client = HTTPClient(self.pat, self.timeout)
-        self._post = PostAPI(self._http_client)
-        self._user = UserAPI(self._http_client)
-        self._ing = IngAPI(self._http_client)
-        self._news = NewsAPI(self._http_client)
-        self._fav = FavAPI(self._http_client)
+        # 延迟导入：login/logout 等不发请求的用法无需加载 requests
+        from .http_client import HTTPClient
+        
+        self._http_client = HTTPClient(
+            self.pat,
+            self.timeout,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            max_response_size=self.max_response_size,
+            stream_json=self.stream_json,
+            hooks=self.hooks,
+            tracer=self.tracer,
+            session=self.session,
+            proxies=self.proxies,
+            pool=self.pool,
+            share_session=self.share_session,
+        )
+        self._post = PostAPI(self._http_client, self.model_cache, self.lazy_body, self.blog_backend)
+        self._user = UserAPI(self._http_client, self.model_cache, self.openapi)
+        self._ing = IngAPI(self._http_client, self.openapi)
+        self._news = NewsAPI(self._http_client, self.model_cache, self.openapi)
+        self._fav = FavAPI(self._http_client, self.openapi)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._http_client:
             self._http_client.close()
     
+    @property
+    def retry_stats(self) -> RetryStats:
+        """重试统计"""
+        if self._http_client is None:
+            raise RuntimeError("Client must be used as context manager")
+        return self._http_client.retry_stats
+    
     @property
     def post(self) -> PostAPI:
         """文章API"""
@@ -0,0 +1,151 @@
+"""Bounded-parallelism helpers shared by the bulk APIs."""
+
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, Set, Tuple, TypeVar
+
+from .exceptions import CnblogsError, APIError, AuthenticationError
+from .result import Ok, Err, Result
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def error_to_err(error: Exception) -> Err:
+    """Convert an exception raised by an API call into an Err."""
+    if isinstance(error, AuthenticationError):
+        return Err(str(error), status_code=401)
+    if isinstance(error, APIError):
+        return Err(error.message, status_code=error.status_code)
+    if isinstance(error, CnblogsError):
+        return Err(str(error))
+    return Err(f"{type(error).__name__}: {error}")
+
+
+def to_result(fn: Callable[[T], R], item: T) -> Result:
+    """
+    Call ``fn(item)`` and wrap the outcome in a Result.
+    
+    Exceptions never escape: API errors keep their status code, anything
+    else (network errors, malformed payloads) becomes a plain Err.
+    """
+    try:
+        value = fn(item)
+    except Exception as e:
+        return error_to_err(e)
+    if isinstance(value, (Ok, Err)):
+        return value
+    return Ok(value)
+
+
+def submit_in_context(executor: ThreadPoolExecutor, fn: Callable[..., R], *args) -> "Future[R]":
+    """Submit ``fn(*args)`` to run in a copy of the caller's context (keeps the current tracing span)."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def map_bounded(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> Iterator[Tuple[T, Result]]:
+    """
+    Run ``fn`` over ``items`` on a thread pool with at most ``concurrency``
+    calls in flight.
+    
+    Items are submitted lazily, so arbitrarily long inputs do not pile up
+    futures. Each result is yielded as ``(item, Ok(value) | Err)``, either
+    in input order or as soon as it completes. When the consumer stops
+    early, no further items are submitted and queued calls are cancelled;
+    calls already running finish before the generator closes.
+    """
+    concurrency = max(concurrency, 1)
+    iterator = iter(items)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if ordered:
+            queue: Deque[Tuple[T, Future]] = deque()
+            try:
+                for item in iterator:
+                    queue.append((item, submit_in_context(executor, to_result, fn, item)))
+                    if len(queue) >= concurrency:
+                        break
+                while queue:
+                    item, future = queue.popleft()
+                    result = future.result()
+                    for next_item in iterator:
+                        queue.append((next_item, submit_in_context(executor, to_result, fn, next_item)))
+                        break
+                    yield item, result
+            finally:
+                # The consumer stopped early (break, exception, close): drop calls not started yet
+                for _, future in queue:
+                    future.cancel()
+        else:
+            pending: Set[Future] = set()
+            owners: Dict[Future, T] = {}
+            try:
+                for item in iterator:
+                    future = submit_in_context(executor, to_result, fn, item)
+                    owners[future] = item
+                    pending.add(future)
+                    if len(pending) >= concurrency:
+                        break
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for next_item in iterator:
+                            next_future = submit_in_context(executor, to_result, fn, next_item)
+                            owners[next_future] = next_item
+                            pending.add(next_future)
+                            break
+                        yield owners.pop(future), future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+async def amap_bounded(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int = 16,
+    ordered: bool = True,
+) -> AsyncIterator[Tuple[T, Result]]:
+    """Async counterpart of :func:`map_bounded` using tasks on the running loop."""
+    import asyncio
+    
+    concurrency = max(concurrency, 1)
+    iterator = iter(items)
+    
+    async def run(item: T) -> Result:
+        try:
+            value = await fn(item)
+        except Exception as e:
+            return error_to_err(e)
+        return value if isinstance(value, (Ok, Err)) else Ok(value)
+    
+    tasks: Deque[Tuple[T, asyncio.Task]] = deque()
+    try:
+        for item in iterator:
+            tasks.append((item, asyncio.ensure_future(run(item))))
+            if len(tasks) >= concurrency:
+                break
+        
+        while tasks:
+            if ordered:
+                item, task = tasks.popleft()
+                await task
+            else:
+                await asyncio.wait([t for _, t in tasks], return_when=asyncio.FIRST_COMPLETED)
+                index = next(i for i, (_, t) in enumerate(tasks) if t.done())
+                item, task = tasks[index]
+                del tasks[index]
+            for next_item in iterator:
+                tasks.append((next_item, asyncio.ensure_future(run(next_item))))
+                break
+            yield item, task.result()
+    finally:
+        for _, task in tasks:
+            task.cancel()
+
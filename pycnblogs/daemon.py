@@ -0,0 +1,245 @@
+"""
+Background daemon keeping a warm client for the command-line tool.
+
+Every ``pycnblogs`` invocation normally starts Python, imports requests and
+opens new TLS connections. With ``pycnblogs daemon start`` a background
+process holds one :class:`~pycnblogs.client.CnblogsClient` (connection
+pool and HTTP cache included) and runs commands sent over a Unix socket,
+so the invoking process only parses its arguments and prints the reply.
+
+Protocol: one JSON object per line in each direction, one request per
+connection. ``{"command": "run", "args": {...}}`` runs a CLI command,
+``ping`` reports the daemon state and ``stop`` shuts it down.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .constants import BLOG_BACKEND, OPENAPI
+from .exceptions import CnblogsError
+from .session import get_config_path, load_pat
+
+# Seconds without a request after which the daemon exits
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+def get_socket_path() -> Path:
+    """Socket of the daemon: ``$PYCNBLOGS_SOCKET``, or next to ``~/.cnbrc``."""
+    path = os.environ.get("PYCNBLOGS_SOCKET")
+    return Path(path) if path else get_config_path().with_name(".cnbrc.sock")
+
+
+def request(message: Dict[str, Any], path: Optional[Path] = None, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send ``message`` to the daemon and return its reply.
+    
+    Returns None when no daemon is listening (or the platform has no Unix
+    sockets), so callers can fall back to running the command themselves.
+    Once the message is sent the daemon may already be running it, so a
+    missing reply raises instead of inviting the caller to run it again.
+    
+    Raises:
+        CnblogsError: The daemon accepted the message but did not reply
+    """
+    path = path or get_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Stale socket file: nothing received the message
+            return None
+        try:
+            sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except OSError as e:
+            raise CnblogsError(f"No reply from the daemon on {path}: {e}") from e
+    if not line:
+        raise CnblogsError(f"The daemon on {path} closed the connection without replying")
+    return json.loads(line)
+
+
+def ping(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """State of the running daemon, or None."""
+    return request({"command": "ping"}, path, timeout=2.0)
+
+
+def stop(path: Optional[Path] = None) -> bool:
+    """Ask the daemon to exit; False when none was running."""
+    return request({"command": "stop"}, path, timeout=2.0) is not None
+
+
+class Daemon:
+    """
+    Unix socket server running CLI commands with one long-lived client.
+    
+    Args:
+        path: Socket path (default :func:`get_socket_path`)
+        blog_backend: Base URL of the post API
+        openapi: Base URL of the other APIs
+        idle_timeout: Exit after this many seconds without a request
+        pat: PAT to use (default: loaded from ``~/.cnbrc``)
+    """
+    
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        blog_backend: str = BLOG_BACKEND,
+        openapi: str = OPENAPI,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        pat: Optional[str] = None,
+    ):
+        self.path = Path(path) if path else get_socket_path()
+        self.options = {"blog_backend": blog_backend.rstrip("/"), "openapi": openapi.rstrip("/")}
+        self.idle_timeout = idle_timeout
+        self.pat = pat if pat is not None else load_pat()
+        self.started = time.time()
+        self.served = 0
+        self._last_request = time.monotonic()
+        self._stopped = threading.Event()
+        self._client = None
+    
+    def serve_forever(self):
+        """Listen on the socket until stopped or idle for ``idle_timeout``."""
+        import socketserver
+        from .cache import MemoryCache
+        from .client import CnblogsClient
+        
+        daemon = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                if line:
+                    reply = daemon.handle(json.loads(line))
+                    self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        
+        if ping(self.path) is not None:
+            raise CnblogsError(f"A daemon is already listening on {self.path}")
+        if self.path.exists():
+            self.path.unlink()
+        # The socket grants the daemon's PAT to whoever can connect: owner only
+        umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(self.path), Handler)
+        finally:
+            os.umask(umask)
+        server.daemon_threads = True
+        server.timeout = 0.5
+        
+        with CnblogsClient(self.pat, cache=MemoryCache(), **self.options) as self._client:
+            try:
+                while not self._stopped.is_set():
+                    server.handle_request()
+                    if time.monotonic() - self._last_request > self.idle_timeout:
+                        break
+            finally:
+                server.server_close()
+                if self.path.exists():
+                    self.path.unlink()
+    
+    def shutdown(self):
+        """Stop serving (from any thread)."""
+        self._stopped.set()
+    
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Reply to one protocol message; an unexpected error is reported as a failed command."""
+        self._last_request = time.monotonic()
+        try:
+            return self._dispatch(message)
+        except Exception as e:
+            return {"code": 1, "stdout": "", "stderr": f"错误: {type(e).__name__}: {e}\n"}
+    
+    def _dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        command = message.get("command")
+        if command == "ping":
+            return {"pid": os.getpid(), "started": self.started, "served": self.served, **self.options}
+        if command == "stop":
+            self.shutdown()
+            return {"stopped": True}
+        if command != "run":
+            return {"error": f"unknown command {command!r}"}
+        
+        from .cli import execute
+        
+        args = argparse.Namespace(**message["args"])
+        if {key: getattr(args, key, None) for key in self.options} != self.options:
+            # Started for other base URLs: the caller runs the command itself
+            return {"mismatch": True}
+        out, err = StringIO(), StringIO()
+        code = execute(self._client, args, out, err)
+        self.served += 1
+        return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def start(
+    path: Optional[Path] = None,
+    blog_backend: str = BLOG_BACKEND,
+    openapi: str = OPENAPI,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    wait: float = 10.0,
+) -> int:
+    """
+    Start a daemon in a detached process and wait until it answers.
+    
+    Returns:
+        Process ID of the daemon
+    
+    Raises:
+        AuthenticationError: No PAT has been saved
+        CnblogsError: The daemon did not come up within ``wait`` seconds
+    """
+    import subprocess
+    
+    path = path or get_socket_path()
+    load_pat()
+    command: List[str] = [
+        sys.executable, "-m", "pycnblogs.daemon", "--socket", str(path),
+        "--blog-backend", blog_backend, "--openapi", openapi, "--idle", str(idle_timeout),
+    ]
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CnblogsError(f"Daemon exited with status {process.returncode}")
+        if ping(path) is not None:
+            return process.pid
+        time.sleep(0.05)
+    process.terminate()
+    raise CnblogsError(f"Daemon did not start listening on {path} within {wait:g}s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pycnblogs.daemon", description="Run the pycnblogs daemon in the foreground.")
+    parser.add_argument("--socket", type=Path, help="socket path (default: ~/.cnbrc.sock or $PYCNBLOGS_SOCKET)")
+    parser.add_argument("--blog-backend", default=BLOG_BACKEND)
+    parser.add_argument("--openapi", default=OPENAPI)
+    parser.add_argument("--idle", type=float, default=DEFAULT_IDLE_TIMEOUT, help="exit after this many idle seconds")
+    args = parser.parse_args(argv)
+    try:
+        Daemon(args.socket, args.blog_backend, args.openapi, args.idle).serve_forever()
+    except CnblogsError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Schema-driven model decoding, pluggable JSON backend and lazy timestamps."""
+
+import json
+import os
+import re
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _select_backend(preferred: Optional[str] = None) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+    """The fastest available JSON decoder, or ``preferred`` when installed."""
+    candidates = [preferred] if preferred else ["orjson", "msgspec", "json"]
+    for name in candidates:
+        if name == "orjson":
+            try:
+                import orjson
+            except ImportError:
+                continue
+            return name, orjson.loads
+        if name == "msgspec":
+            try:
+                import msgspec
+            except ImportError:
+                continue
+            return name, msgspec.json.Decoder().decode
+        if name == "json":
+            return name, _stdlib_loads
+    raise ValueError(f"JSON backend {preferred!r} is not available")
+
+
+# PYCNBLOGS_JSON=json|orjson|msgspec forces a backend (e.g. to compare them)
+JSON_BACKEND, _loads = _select_backend(os.environ.get("PYCNBLOGS_JSON") or None)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with :data:`JSON_BACKEND` (orjson or msgspec when installed)."""
+    return _loads(data)
+
+
+REQUIRED = object()
+
+
+class Field(NamedTuple):
+    """How one model attribute is read from a payload."""
+    name: str
+    # JSON key, or None for an attribute that is always ``default``
+    key: Optional[str]
+    default: Any = REQUIRED
+
+
+def camel_case(name: str) -> str:
+    """``is_draft`` -> ``isDraft`` (BLOG_BACKEND payloads)."""
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def pascal_case(name: str) -> str:
+    """``user_alias`` -> ``UserAlias`` (OPENAPI payloads)."""
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def schema(
+    model: type,
+    case: Callable[[str], str],
+    renames: Optional[Mapping[str, str]] = None,
+    defaults: Optional[Mapping[str, Any]] = None,
+    constants: Optional[Mapping[str, Any]] = None,
+) -> Tuple[Field, ...]:
+    """
+    Field mapping of ``model`` (a dataclass or NamedTuple).
+    
+    Keys are derived from the attribute names with ``case``; ``renames``
+    overrides keys that do not follow the convention, ``defaults`` makes
+    keys optional and ``constants`` fixes attributes not read at all.
+    """
+    renames = renames or {}
+    defaults = defaults or {}
+    constants = constants or {}
+    names = [f.name for f in fields(model)] if is_dataclass(model) else list(model._fields)
+    result = []
+    for name in names:
+        if name in constants:
+            result.append(Field(name, None, constants[name]))
+        else:
+            result.append(Field(name, renames.get(name) or case(name), defaults.get(name, REQUIRED)))
+    return tuple(result)
+
+
+def compile_decoder(model: type, spec: Tuple[Field, ...], doc: Optional[str] = None) -> Callable[[Mapping[str, Any]], Any]:
+    """
+    Build a function turning a payload dict into ``model``.
+    
+    The function is generated once per schema, so decoding costs one
+    subscript (or ``get``) per field and a single constructor call, with no
+    per-field dispatch at runtime. Missing required keys raise KeyError.
+    """
+    values = []
+    namespace: Dict[str, Any] = {"model": model}
+    for i, field in enumerate(spec):
+        if field.key is None:
+            namespace[f"c{i}"] = field.default
+            values.append(f"c{i}")
+        elif field.default is REQUIRED:
+            values.append(f"d[{field.key!r}]")
+        else:
+            namespace[f"c{i}"] = field.default
+            values.append(f"d.get({field.key!r}, c{i})")
+    source = f"def decode(d):\n    return model({', '.join(values)})\n"
+    exec(compile(source, f"<decoder {model.__name__}>", "exec"), namespace)
+    decode = namespace["decode"]
+    decode.__doc__ = doc or f"Build a {model.__name__} from an API payload."
+    decode.fields = spec
+    return decode
+
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an API timestamp (``2024-01-01T08:00:00.123+08:00``, ``...Z``).
+    
+    Cached, since list pages repeat timestamps; returns None for empty or
+    unparseable values rather than failing the whole page.
+    """
+    if not value:
+        return None
+    text = value.strip().replace(" ", "T", 1)
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    # fromisoformat before 3.11 only accepts 3 or 6 fractional digits
+    text = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), text, count=1)
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
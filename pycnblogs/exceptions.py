@@ -18,3 +18,12 @@ class APIError(CnblogsError):
         super().__init__(message)
         self.status_code = status_code
         self.message = message
+
+
+class ResponseTooLargeError(APIError):
+    """Raised when a response body exceeds the client's max_response_size."""
+    
+    def __init__(self, size: int, limit: int, status_code: int = None):
+        super().__init__(f"Response body of {size}+ bytes exceeds the {limit} byte limit", status_code)
+        self.size = size
+        self.limit = limit
@@ -0,0 +1,123 @@
+"""同步与异步HTTP客户端共用的逻辑（请求头、条件请求缓存、响应处理、span属性）"""
+
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from .exceptions import APIError, AuthenticationError
+from .result import Err, Result
+from .cache import CacheBackend, CachedResponse, cache_key
+from .metrics import endpoint_template
+from .tracing import Span
+from .decoding import loads
+
+
+def http_attributes(method: str, url: str) -> Dict[str, Any]:
+    """HTTP span 的初始属性"""
+    return {"http.method": method, "http.url": url, "http.route": endpoint_template(url)}
+
+
+def content_length(response: Any) -> Optional[int]:
+    """响应头中的 Content-Length（未知时为None）"""
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def annotate(span: Span, response: Any, attempt: int):
+    """把最终响应的信息记录到span"""
+    span.set_attribute("http.status_code", response.status_code)
+    span.set_attribute("http.retry_count", attempt - 1)
+    span.set_attribute("http.response_content_length", content_length(response))
+
+
+class HTTPClientBase:
+    """
+    HTTPClient 与 AsyncHTTPClient 的公共部分
+    
+    只使用两种响应对象都有的 status_code/headers/text/content，
+    发送请求、读取响应体和重试由子类实现。
+    """
+    
+    pat: str
+    cache: Optional[CacheBackend]
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """获取请求头"""
+        return {
+            "Authorization": f"Bearer {self.pat}",
+            "Authorization-Type": "pat",
+            "Content-Type": "application/json",
+        }
+    
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[str], Optional[CachedResponse], Optional[Dict[str, str]]]:
+        """
+        查找条件请求的缓存
+        
+        Returns:
+            (缓存键, 缓存的响应, 条件请求头)；未配置缓存或不是GET请求时缓存键为None
+        """
+        if method != "GET" or self.cache is None:
+            return None, None, None
+        key = cache_key(self.pat, url, params)
+        cached = self.cache.get(key)
+        return key, cached, cached.conditional_headers() if cached is not None else None
+    
+    def _complete(
+        self,
+        response: Any,
+        raise_on_error: bool,
+        span: Optional[Span] = None,
+        key: Optional[str] = None,
+        cached: Optional[CachedResponse] = None,
+    ) -> Union[Dict[str, Any], Result]:
+        """处理已读取响应体的最终响应；走缓存时304复用缓存的响应体，200按验证器更新缓存"""
+        if response.status_code == 304 and cached is None:
+            # 没有发送验证器（请求前缓存中就没有这一项）却收到304，没有可用的响应体，不能当作空响应返回
+            if span is not None and key is not None:
+                span.set_attribute("cache.hit", False)
+            error_text = "HTTP 304 Not Modified without a cached response"
+            if raise_on_error:
+                raise APIError(f"API request failed: {error_text}", status_code=304)
+            return Err(error_text, status_code=304)
+        if key is not None:
+            hit = response.status_code == 304 and cached is not None
+            if span is not None:
+                span.set_attribute("cache.hit", hit)
+            # 304：内容未变化，直接使用缓存的响应体
+            if hit:
+                return loads(cached.body) if cached.body else {}
+            if response.status_code == 200:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self.cache.set(key, CachedResponse(
+                        body=response.content,
+                        etag=etag,
+                        last_modified=last_modified,
+                        stored_at=time.time(),
+                    ))
+        return self._handle_response(response, raise_on_error)
+    
+    def _handle_response(self, response: Any, raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
+        """处理响应"""
+        if response.status_code == 401:
+            if raise_on_error:
+                raise AuthenticationError("Invalid PAT token")
+            return Err("Invalid PAT token", status_code=401)
+        
+        if response.status_code >= 400:
+            error_text = response.text if response.text else f"HTTP {response.status_code}"
+            if raise_on_error:
+                raise APIError(f"API request failed: {error_text}", status_code=response.status_code)
+            return Err(error_text, status_code=response.status_code)
+        
+        if response.status_code == 204:
+            return {}
+        
+        try:
+            return loads(response.content)
+        except Exception:
+            return {}
@@ -1,22 +1,89 @@
 """同步HTTP客户端"""
 
+import time
 import requests
-from typing import Dict, Any, Union
-from .exceptions import APIError, AuthenticationError
-from .result import Ok, Err, Result
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from typing import Dict, Any, Iterator, Optional, Union
+from .result import Result
+from .retry import RetryPolicy, RetryStats
+from .ratelimit import RateLimiter
+from .cache import CacheBackend
+from .metrics import RequestHooks, RequestInfo
+from .tracing import Span, Tracer
+from .pool import SESSIONS, PoolConfig, build_session
+from .streaming import CHUNK_SIZE, check_size, iter_json_array, select_items
+from .http_base import HTTPClientBase, annotate, content_length, http_attributes
 
 
-class HTTPClient:
+def _is_connect_error(error: requests.RequestException) -> bool:
+    """判断网络错误是否发生在建立连接阶段（请求尚未发出）"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+class HTTPClient(HTTPClientBase):
     """HTTP客户端"""
     
-    def __init__(self, pat: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        pat: str,
+        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        max_response_size: Optional[int] = None,
+        stream_json: bool = False,
+        hooks: Optional[RequestHooks] = None,
+        tracer: Optional[Tracer] = None,
+        session: Optional[requests.Session] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        pool: Optional[PoolConfig] = None,
+        share_session: bool = False,
+    ):
+        """
+        Args:
+            pat: Personal Access Token
+            timeout: 请求超时时间（秒）
+            retry: 重试策略，None表示不重试
+            rate_limiter: 客户端限流器，可在多个客户端间共享
+            cache: HTTP缓存后端（ETag/Last-Modified条件请求），None表示不缓存
+            max_response_size: 响应体最大字节数，超出时抛出 ResponseTooLargeError，None表示不限制
+            stream_json: 列表接口边接收边解码数组元素，不缓冲整个响应体
+            hooks: 请求事件钩子（RequestHooks/Metrics），每次尝试（含重试）都会触发
+            tracer: 追踪器，每个请求生成一个子span（状态码、字节数、重试次数、缓存命中）
+            session: 使用已有的 requests 会话（自定义适配器、代理、证书），关闭客户端时不会关闭它
+            proxies: 每个请求使用的代理，如 {"https": "http://127.0.0.1:8080"}
+            pool: 连接池大小与TCP keep-alive设置（默认每个主机保持32个连接）
+            share_session: 使用进程内按PAT共享的会话，复用之前的客户端建立的连接
+        """
         self.pat = pat
         self.timeout = timeout
-        self.session = requests.Session()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.max_response_size = max_response_size
+        self.stream_json = stream_json
+        self.hooks = hooks
+        self.tracer = tracer
+        self.retry_stats = RetryStats()
+        self.proxies = proxies
+        self.pool = pool if pool is not None else PoolConfig()
+        # 传入的会话和共享会话都不随客户端关闭
+        self._owns_session = session is None and not share_session
+        if session is not None:
+            self.session = session
+        elif share_session:
+            self.session = SESSIONS.get(pat, self.pool)
+        else:
+            self.session = build_session(self.pool)
     
     def close(self):
-        """关闭会话"""
-        self.session.close()
+        """关闭会话（传入的会话由调用方关闭）"""
+        if self._owns_session:
+            self.session.close()
     
     def __enter__(self):
         return self
@@ -24,56 +91,171 @@ class HTTPClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
     
-    def _get_headers(self) -> Dict[str, str]:
-        """获取请求头"""
-        return {
-            "Authorization": f"Bearer {self.pat}",
-            "Authorization-Type": "pat",
-            "Content-Type": "application/json",
-        }
-    
     def get(self, url: str, raise_on_error: bool = True) -> Union[Dict[str, Any], Result]:
         """发送GET请求"""
-        response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
-        return self._handle_response(response, raise_on_error)
+        return self._request("GET", url, raise_on_error)
     
     def get_with_params(self, url: str, params: Dict[str, Any], raise_on_error: bool = True) -> Union[Dict[str, Any], Result]:
         """发送带参数的GET请求"""
-        response = self.session.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
-        return self._handle_response(response, raise_on_error)
+        return self._request("GET", url, raise_on_error, params=params)
     
     def post(self, url: str, json: Dict[str, Any], raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
         """发送POST请求"""
-        response = self.session.post(url, json=json, headers=self._get_headers(), timeout=self.timeout)
-        return self._handle_response(response, raise_on_error)
+        return self._request("POST", url, raise_on_error, json=json)
     
     def put(self, url: str, json: Dict[str, Any], raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
         """发送PUT请求"""
-        response = self.session.put(url, json=json, headers=self._get_headers(), timeout=self.timeout)
-        return self._handle_response(response, raise_on_error)
+        return self._request("PUT", url, raise_on_error, json=json)
     
     def delete(self, url: str, raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
         """发送DELETE请求"""
-        response = self.session.delete(url, headers=self._get_headers(), timeout=self.timeout)
-        return self._handle_response(response, raise_on_error)
+        return self._request("DELETE", url, raise_on_error)
     
-    def _handle_response(self, response: requests.Response, raise_on_error: bool = False) -> Union[Dict[str, Any], Result]:
-        """处理响应"""
-        if response.status_code == 401:
-            if raise_on_error:
-                raise AuthenticationError("Invalid PAT token")
-            return Err("Invalid PAT token", status_code=401)
+    def get_items(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        获取JSON数组（或顶层对象中 key 对应的数组）的元素
         
-        if response.status_code >= 400:
-            error_text = response.text if response.text else f"HTTP {response.status_code}"
-            if raise_on_error:
-                raise APIError(f"API request failed: {error_text}", status_code=response.status_code)
-            return Err(error_text, status_code=response.status_code)
-        
-        if response.status_code == 204:
-            return {}
+        开启 stream_json 且未配置缓存时边接收边解码，峰值内存只有一个元素；
+        extra 在遍历结束后填入顶层对象的其他字段（如 postsCount）。
+        """
+        if not self.stream_json or self.cache is not None:
+            data = self._request("GET", url, True, params=params)
+            yield from select_items(data, key, extra)
+            return
         
+        # 流式读取跨越多次 yield，span 不设为当前span，由这里显式结束
+        span = self.tracer.start_span("HTTP GET", http_attributes("GET", url)) if self.tracer is not None else None
+        response = None
         try:
-            return response.json()
-        except Exception:
-            return {}
+            response = self._send("GET", url, stream=True, span=span, params=params)
+            if response.status_code != 200:
+                self._read_body(response)
+                yield from select_items(self._handle_response(response, raise_on_error=True), key, extra)
+                return
+            yield from iter_json_array(self._iter_body(response), key, extra)
+        except Exception as e:
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            if span is not None:
+                span.end()
+    
+    def _iter_body(self, response: requests.Response) -> Iterator[bytes]:
+        """逐块读取响应体，超过 max_response_size 时抛出异常"""
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            check_size(int(length), self.max_response_size, response.status_code)
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            size += len(chunk)
+            check_size(size, self.max_response_size, response.status_code)
+            yield chunk
+    
+    def _read_body(self, response: requests.Response):
+        """按 max_response_size 读取完整响应体"""
+        if self.max_response_size is None:
+            return
+        # 与 requests 自身读取 content 的方式一致，之后 .content/.json() 直接使用这份数据
+        response._content = b"".join(self._iter_body(response))
+    
+    def _request(self, method: str, url: str, raise_on_error: bool, **kwargs) -> Union[Dict[str, Any], Result]:
+        """发送请求；配置了追踪器时包裹在一个HTTP span中"""
+        if self.tracer is None:
+            return self._perform(method, url, raise_on_error, None, **kwargs)
+        with self.tracer.span(f"HTTP {method}", http_attributes(method, url)) as span:
+            return self._perform(method, url, raise_on_error, span, **kwargs)
+    
+    def _perform(
+        self,
+        method: str,
+        url: str,
+        raise_on_error: bool,
+        span: Optional[Span],
+        **kwargs,
+    ) -> Union[Dict[str, Any], Result]:
+        """发送请求；配置了缓存时GET请求走条件请求"""
+        key, cached, extra_headers = self._cache_lookup(method, url, kwargs.get("params"))
+        response = self._send(method, url, extra_headers=extra_headers, span=span, **kwargs)
+        self._read_body(response)
+        return self._complete(response, raise_on_error, span, key, cached)
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+        span: Optional[Span] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        发送请求，按重试策略重试暂时性失败，返回最终响应
+        
+        限制了响应大小或 stream=True 时不预先读取响应体
+        """
+        headers = self._get_headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        deferred = stream or self.max_response_size is not None
+        policy = self.retry
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            info = None
+            if self.hooks is not None:
+                info = RequestInfo(method, url, attempt)
+                self.hooks.before_request(info)
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, timeout=self.timeout, stream=deferred, proxies=self.proxies, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if info is not None:
+                    info.finish(error=e)
+                    self.hooks.on_error(info)
+                # 连接未建立时请求必然未送达，任何方法都可以安全重试
+                connect_failed = _is_connect_error(e)
+                if policy is None or not policy.should_retry_error(method, attempt, connect_failed):
+                    if policy is not None and attempt > 1:
+                        self.retry_stats.record_exhausted()
+                    if span is not None:
+                        span.set_attribute("http.retry_count", attempt - 1)
+                    raise
+                reason = type(e).__name__
+                delay = policy.get_backoff(attempt)
+            except BaseException as e:
+                # 其他异常（如 InvalidURL、ChunkedEncodingError）不重试，但同样结束这次尝试，
+                # 保证每个 before_request 都有对应的 on_error（指标的 in_flight 不会一直偏高）
+                if info is not None:
+                    info.finish(error=e)
+                    self.hooks.on_error(info)
+                raise
+            else:
+                if info is not None:
+                    size = content_length(response) if deferred else len(response.content)
+                    info.finish(response.status_code, size)
+                    self.hooks.after_response(info)
+                if policy is None or not policy.should_retry_status(method, response.status_code, attempt):
+                    if policy is not None and attempt > 1 and policy.is_retryable_status(method, response.status_code):
+                        self.retry_stats.record_exhausted()
+                    if span is not None:
+                        annotate(span, response, attempt)
+                    return response
+                reason = str(response.status_code)
+                delay = policy.get_backoff(attempt, response.headers.get("Retry-After"))
+                response.close()
+            
+            self.retry_stats.record_retry(reason)
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,116 @@
+"""Deferred loading of post bodies for listed posts."""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from .concurrency import amap_bounded
+from .exceptions import APIError, AuthenticationError
+from .models import PostEntry
+from .result import Err
+
+if TYPE_CHECKING:
+    from .client import PostAPI
+    from .async_client import AsyncPostAPI
+
+
+class BodyLoader:
+    """
+    Loads the bodies of one listing's posts on first access, in batches.
+    
+    Reading an unloaded body also fetches the bodies of the next
+    ``batch_size - 1`` unloaded entries of the same listing concurrently,
+    so a loop that reads every body costs a few rounds of parallel requests
+    rather than one round trip per post.
+    
+    Args:
+        posts: PostAPI used to fetch the bodies
+        batch_size: Entries loaded together
+        concurrency: Maximum concurrent requests per batch
+    """
+    
+    def __init__(self, posts: "PostAPI", batch_size: int = 16, concurrency: int = 8):
+        self.posts = posts
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self._entries: List[PostEntry] = []
+        self._positions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+    
+    def attach(self, entries: Iterable[PostEntry]):
+        """Make the unloaded bodies of ``entries`` load through this loader."""
+        for entry in entries:
+            if entry.is_body_loaded:
+                continue
+            entry._body_loader = self
+            self._positions[id(entry)] = len(self._entries)
+            self._entries.append(entry)
+    
+    def load(self, entry: PostEntry):
+        """Load ``entry``'s body along with a batch of its successors."""
+        with self._lock:
+            if entry.is_body_loaded:
+                return
+            batch = [entry]
+            # Copies of an entry (e.g. from the model cache) are not in the listing
+            start = self._positions.get(id(entry))
+            if start is not None:
+                for other in self._entries[start + 1:]:
+                    if len(batch) >= self.batch_size:
+                        break
+                    if not other.is_body_loaded:
+                        batch.append(other)
+            failed = load_bodies(self.posts, batch, self.concurrency)
+        
+        if entry.id in failed:
+            raise _as_exception(failed[entry.id])
+
+
+def load_bodies(posts: "PostAPI", entries: Iterable[PostEntry], concurrency: int = 8) -> Dict[int, Err]:
+    """
+    Fetch the missing bodies (and tags) of ``entries`` concurrently.
+    
+    Returns:
+        ``{post_id: Err}`` for the posts that could not be fetched
+    """
+    by_id = _group_unloaded(entries)
+    failed = {}
+    for post_id, result in posts.get_many(list(by_id), concurrency, ordered=False):
+        if result.is_err():
+            failed[post_id] = result
+            continue
+        _fill(by_id[post_id], result.unwrap())
+    return failed
+
+
+async def aload_bodies(posts: "AsyncPostAPI", entries: Iterable[PostEntry], concurrency: int = 16) -> Dict[int, Err]:
+    """Async version of :func:`load_bodies`."""
+    by_id = _group_unloaded(entries)
+    failed = {}
+    async for post_id, result in amap_bounded(posts.get_one, list(by_id), concurrency, ordered=False):
+        if result.is_err():
+            failed[post_id] = result
+            continue
+        _fill(by_id[post_id], result.unwrap())
+    return failed
+
+
+def _group_unloaded(entries: Iterable[PostEntry]) -> Dict[int, List[PostEntry]]:
+    by_id: Dict[int, List[PostEntry]] = {}
+    for entry in entries:
+        if not entry.is_body_loaded:
+            by_id.setdefault(entry.id, []).append(entry)
+    return by_id
+
+
+def _fill(entries: List[PostEntry], full: PostEntry):
+    for entry in entries:
+        entry.body = full.body
+        if entry.tags is None:
+            entry.tags = full.tags
+        entry.__dict__.pop("_body_loader", None)
+
+
+def _as_exception(error: Err) -> Exception:
+    if error.status_code == 401:
+        return AuthenticationError(error.get_message())
+    return APIError(error.get_message(), status_code=error.status_code)
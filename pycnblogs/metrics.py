@@ -0,0 +1,281 @@
+"""Request event hooks and built-in request metrics."""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Path segments that identify a resource rather than an endpoint
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+EVENTS = ("before_request", "after_response", "on_error")
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Endpoint of ``url`` with ids replaced by placeholders.
+    
+    ``https://i.cnblogs.com/api/posts/123?x=1`` becomes
+    ``i.cnblogs.com/api/posts/{id}``, so metrics aggregate per endpoint
+    rather than per resource.
+    """
+    parts = urlsplit(url)
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in parts.path.split("/")]
+    return parts.netloc + "/".join(segments)
+
+
+@dataclass
+class RequestInfo:
+    """One HTTP attempt, passed to every hook (retries are separate attempts)."""
+    method: str
+    url: str
+    attempt: int = 1
+    endpoint: str = ""
+    started: float = field(default_factory=time.perf_counter)
+    status_code: Optional[int] = None
+    elapsed: Optional[float] = None
+    response_bytes: Optional[int] = None
+    error: Optional[BaseException] = None
+    
+    def __post_init__(self):
+        if not self.endpoint:
+            self.endpoint = endpoint_template(self.url)
+    
+    def finish(self, status_code: Optional[int] = None, response_bytes: Optional[int] = None, error: Optional[BaseException] = None):
+        """Record the outcome of the attempt."""
+        self.elapsed = time.perf_counter() - self.started
+        self.status_code = status_code
+        self.response_bytes = response_bytes
+        self.error = error
+
+
+class RequestHooks:
+    """
+    Event hooks called around every HTTP attempt.
+    
+    ``before_request`` runs before the request is sent, ``after_response``
+    when response headers arrive (whatever the status), and ``on_error``
+    when the attempt fails without a response (connection errors,
+    timeouts, or any other exception raised while sending). Every
+    ``before_request`` is followed by exactly one of the other two.
+    Exceptions raised by callbacks propagate to the caller.
+    
+    Example::
+    
+        hooks = RequestHooks()
+        hooks.add("after_response", lambda info: print(info.endpoint, info.elapsed))
+    """
+    
+    def __init__(self):
+        self._callbacks: Dict[str, List[Callable[[RequestInfo], Any]]] = {event: [] for event in EVENTS}
+    
+    def add(self, event: str, callback: Callable[[RequestInfo], Any]) -> Callable[[RequestInfo], Any]:
+        """Register ``callback`` for ``event`` and return it."""
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown event {event!r}, expected one of {', '.join(EVENTS)}")
+        self._callbacks[event].append(callback)
+        return callback
+    
+    def remove(self, event: str, callback: Callable[[RequestInfo], Any]):
+        """Unregister ``callback``."""
+        self._callbacks[event].remove(callback)
+    
+    def before_request(self, info: RequestInfo):
+        for callback in self._callbacks["before_request"]:
+            callback(info)
+    
+    def after_response(self, info: RequestInfo):
+        for callback in self._callbacks["after_response"]:
+            callback(info)
+    
+    def on_error(self, info: RequestInfo):
+        for callback in self._callbacks["on_error"]:
+            callback(info)
+
+
+class Histogram:
+    """
+    Cumulative latency histogram with fixed bucket bounds (seconds).
+    
+    Args:
+        buckets: Sorted upper bounds; an implicit ``+Inf`` bucket follows
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate of the ``q`` quantile: the upper bound of the bucket holding it."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = []
+        seen = 0
+        for count in self.counts:
+            seen += count
+            cumulative.append(seen)
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): cumulative[i] for i, bound in enumerate(self.bounds)},
+                "+Inf": cumulative[-1],
+            },
+        }
+
+
+class Metrics(RequestHooks):
+    """
+    Request counters and latency histograms per method and endpoint template.
+    
+    Pass an instance as the client's ``hooks``; callbacks can still be
+    added to it with :meth:`add`. Thread-safe.
+    
+    Args:
+        buckets: Latency histogram bucket bounds in seconds
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__()
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Drop all recorded values."""
+        with self._lock:
+            self.requests: DefaultDict[Tuple[str, str, str], int] = defaultdict(int)
+            self.errors: DefaultDict[Tuple[str, str, str], int] = defaultdict(int)
+            self.retries: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+            self.response_bytes: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+            self.latency: Dict[Tuple[str, str], Histogram] = {}
+            self.in_flight = 0
+    
+    def before_request(self, info: RequestInfo):
+        with self._lock:
+            self.in_flight += 1
+            if info.attempt > 1:
+                self.retries[(info.method, info.endpoint)] += 1
+        super().before_request(info)
+    
+    def after_response(self, info: RequestInfo):
+        key = (info.method, info.endpoint)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[key + (str(info.status_code),)] += 1
+            if info.response_bytes:
+                self.response_bytes[key] += info.response_bytes
+            self._histogram(key).observe(info.elapsed)
+        super().after_response(info)
+    
+    def on_error(self, info: RequestInfo):
+        key = (info.method, info.endpoint)
+        with self._lock:
+            self.in_flight -= 1
+            self.errors[key + (type(info.error).__name__,)] += 1
+            self._histogram(key).observe(info.elapsed)
+        super().on_error(info)
+    
+    def _histogram(self, key: Tuple[str, str]) -> Histogram:
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram(self.buckets)
+        return histogram
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot grouped by ``"METHOD endpoint"``."""
+        with self._lock:
+            endpoints: Dict[str, Dict[str, Any]] = {}
+            
+            def entry(method: str, endpoint: str) -> Dict[str, Any]:
+                return endpoints.setdefault(f"{method} {endpoint}", {
+                    "requests": {}, "errors": {}, "retries": 0, "response_bytes": 0, "latency": None,
+                })
+            
+            for (method, endpoint, status), count in self.requests.items():
+                entry(method, endpoint)["requests"][status] = count
+            for (method, endpoint, error), count in self.errors.items():
+                entry(method, endpoint)["errors"][error] = count
+            for (method, endpoint), count in self.retries.items():
+                entry(method, endpoint)["retries"] = count
+            for (method, endpoint), size in self.response_bytes.items():
+                entry(method, endpoint)["response_bytes"] = size
+            for (method, endpoint), histogram in self.latency.items():
+                entry(method, endpoint)["latency"] = histogram.to_dict()
+            return {"in_flight": self.in_flight, "endpoints": endpoints}
+    
+    def to_prometheus(self, prefix: str = "pycnblogs") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            lines += _family(f"{prefix}_requests_total", "counter", "HTTP responses by status code.", [
+                ({"method": m, "endpoint": e, "status": s}, n) for (m, e, s), n in sorted(self.requests.items())
+            ])
+            lines += _family(f"{prefix}_request_errors_total", "counter", "HTTP attempts failed without a response.", [
+                ({"method": m, "endpoint": e, "error": x}, n) for (m, e, x), n in sorted(self.errors.items())
+            ])
+            lines += _family(f"{prefix}_request_retries_total", "counter", "HTTP attempts that were retries.", [
+                ({"method": m, "endpoint": e}, n) for (m, e), n in sorted(self.retries.items())
+            ])
+            lines += _family(f"{prefix}_response_bytes_total", "counter", "Response bytes by Content-Length.", [
+                ({"method": m, "endpoint": e}, n) for (m, e), n in sorted(self.response_bytes.items())
+            ])
+            lines += _family(f"{prefix}_requests_in_flight", "gauge", "HTTP attempts in progress.", [
+                ({}, self.in_flight),
+            ])
+            
+            name = f"{prefix}_request_duration_seconds"
+            lines.append(f"# HELP {name} HTTP attempt latency.")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, endpoint), histogram in sorted(self.latency.items()):
+                labels = {"method": method, "endpoint": endpoint}
+                seen = 0
+                for bound, count in zip(histogram.bounds + (float("inf"),), histogram.counts):
+                    seen += count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f"{name}_bucket{_labels({**labels, 'le': le})} {seen}")
+                lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+                lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _family(name: str, kind: str, help_text: str, samples: List[Tuple[Dict[str, str], float]]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_labels(labels)} {value}" for labels, value in samples]
+    return lines
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,13 +1,58 @@
 """Data models for Cnblogs API responses."""
 
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, fields
+from typing import Optional, List, Dict, Any, NamedTuple
 from datetime import datetime
 
+from .decoding import camel_case, compile_decoder, parse_datetime, pascal_case, schema
 
-@dataclass
+class _Unloaded:
+    """Marker for a post body that has not been fetched."""
+    
+    def __repr__(self) -> str:
+        return "<not loaded>"
+    
+    def __reduce__(self) -> str:
+        # Unpickle to the module singleton
+        return "UNLOADED"
+
+
+UNLOADED = _Unloaded()
+
+
+class _DeferredBody:
+    """
+    Data descriptor for ``PostEntry.body``.
+    
+    An unloaded body reads as None, unless the entry came from a listing
+    with lazy loading enabled: then the first read fetches it through the
+    entry's loader.
+    """
+    
+    def __get__(self, entry, owner=None):
+        if entry is None:
+            return None
+        value = entry.__dict__.get("_body")
+        if value is UNLOADED:
+            loader = entry.__dict__.get("_body_loader")
+            if loader is None:
+                return None
+            loader.load(entry)
+            value = entry.__dict__["_body"]
+        return value
+    
+    def __set__(self, entry, value):
+        entry.__dict__["_body"] = value
+
+
+@dataclass(repr=False, eq=False)
 class PostEntry:
-    """Blog post entry."""
+    """
+    Blog post entry.
+    
+    Entries from post listings carry no body (``is_body_loaded`` is False);
+    with lazy loading the body is fetched on first access to ``body``.
+    """
     id: int
     title: str
     url: str
@@ -26,6 +71,49 @@ class PostEntry:
         if self.url.startswith("http"):
             return self.url
         return f"https:{self.url}"
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
+    @property
+    def modified_at(self) -> Optional[datetime]:
+        """``modify_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.modify_time)
+    
+    @property
+    def is_body_loaded(self) -> bool:
+        """Whether the body was fetched (it may still be empty)."""
+        return self.__dict__.get("_body") is not UNLOADED
+    
+    def _values(self) -> tuple:
+        # Field values without triggering a body load
+        return tuple(self.__dict__.get("_body") if f.name == "body" else getattr(self, f.name) for f in fields(self))
+    
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f.name}={value!r}" for f, value in zip(fields(self), self._values()))
+        return f"PostEntry({values})"
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+    
+    def __copy__(self) -> "PostEntry":
+        # Shallow copies (e.g. from the model cache) keep the loader, so their body still loads
+        duplicate = self.__class__.__new__(self.__class__)
+        duplicate.__dict__.update(self.__dict__)
+        return duplicate
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickles drop the loader: its client and session cannot travel with the entry
+        state = dict(self.__dict__)
+        state.pop("_body_loader", None)
+        return state
+
+
+PostEntry.body = _DeferredBody()
 
 
 @dataclass
@@ -43,6 +131,11 @@ class UserInfo:
     followers_count: int
     is_vip: bool
     joined: str
+    
+    @property
+    def joined_at(self) -> Optional[datetime]:
+        """``joined`` parsed (on access) into a datetime."""
+        return parse_datetime(self.joined)
 
 
 @dataclass
@@ -55,6 +148,11 @@ class IngEntry:
     create_time: str
     comment_count: int
     lucky_count: int
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
 
 
 @dataclass
@@ -65,6 +163,11 @@ class IngCommentEntry:
     user_alias: str
     user_display_name: str
     create_time: str
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
 
 
 @dataclass
@@ -79,6 +182,11 @@ class NewsEntry:
     digg_count: int
     create_time: str
     
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
     @property
     def full_url(self) -> str:
         """Get full URL with protocol."""
@@ -95,9 +203,162 @@ class FavEntry:
     url: str
     create_time: str
     
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
     @property
     def full_url(self) -> str:
         """Get full URL with protocol."""
         if self.url.startswith("http"):
             return self.url
         return f"https:{self.url}"
+
+
+class PostRecord(NamedTuple):
+    """Compact, immutable post list entry (no body or tags)."""
+    id: int
+    title: str
+    url: str
+    create_time: str
+    modify_time: str
+    is_draft: bool
+    is_pinned: bool
+    is_published: bool
+    comment_count: Optional[int] = None
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
+    @property
+    def modified_at(self) -> Optional[datetime]:
+        """``modify_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.modify_time)
+    
+    @property
+    def full_url(self) -> str:
+        """Get full URL with protocol."""
+        return _full_url(self.url)
+
+
+class IngRecord(NamedTuple):
+    """Compact, immutable ing entry."""
+    id: int
+    content: str
+    user_alias: str
+    user_display_name: str
+    create_time: str
+    comment_count: int
+    lucky_count: int
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+
+
+class NewsRecord(NamedTuple):
+    """Compact, immutable news entry."""
+    id: int
+    title: str
+    summary: str
+    url: str
+    view_count: int
+    comment_count: int
+    digg_count: int
+    create_time: str
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
+    @property
+    def full_url(self) -> str:
+        """Get full URL with protocol."""
+        return _full_url(self.url)
+
+
+class FavRecord(NamedTuple):
+    """Compact, immutable favorite entry."""
+    id: int
+    title: str
+    url: str
+    create_time: str
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """``create_time`` parsed (on access) into a datetime."""
+        return parse_datetime(self.create_time)
+    
+    @property
+    def full_url(self) -> str:
+        """Get full URL with protocol."""
+        return _full_url(self.url)
+
+
+def _full_url(url: str) -> str:
+    if url.startswith("http"):
+        return url
+    return f"https:{url}"
+
+
+# Field mappings: BLOG_BACKEND payloads use camelCase keys, OPENAPI payloads PascalCase
+_POST_KEYS = {"create_time": "datePublished", "modify_time": "dateUpdated", "comment_count": "feedBackCount", "body": "postBody"}
+_POST_OPTIONAL = {"comment_count": None, "body": None, "tags": None}
+
+_decode_post = compile_decoder(PostEntry, schema(PostEntry, camel_case, _POST_KEYS, _POST_OPTIONAL))
+_decode_listed_post = compile_decoder(
+    PostEntry, schema(PostEntry, camel_case, _POST_KEYS, _POST_OPTIONAL, constants={"body": UNLOADED, "tags": None})
+)
+
+
+def parse_post(data: Dict[str, Any], with_body: bool = True) -> PostEntry:
+    """Build a PostEntry from a BLOG_BACKEND post payload."""
+    return _decode_post(data) if with_body else _decode_listed_post(data)
+
+
+parse_user = compile_decoder(
+    UserInfo,
+    schema(UserInfo, pascal_case, {"space_user_id": "SpaceUserID", "followers_count": "FollowerCount"}),
+    "Build a UserInfo from an OPENAPI user payload.",
+)
+parse_ing = compile_decoder(
+    IngEntry,
+    schema(IngEntry, pascal_case, {"create_time": "DateAdded"}, {"lucky_count": 0}),
+    "Build an IngEntry from an OPENAPI status payload.",
+)
+parse_news = compile_decoder(
+    NewsEntry,
+    schema(NewsEntry, pascal_case, {"create_time": "DateAdded"}),
+    "Build a NewsEntry from an OPENAPI news item payload.",
+)
+parse_fav = compile_decoder(
+    FavEntry,
+    schema(FavEntry, pascal_case, {"create_time": "DateAdded"}),
+    "Build a FavEntry from an OPENAPI wz payload.",
+)
+
+parse_post_record = compile_decoder(
+    PostRecord,
+    schema(PostRecord, camel_case, _POST_KEYS, {"comment_count": None}),
+    "Build a PostRecord from a BLOG_BACKEND post list payload.",
+)
+parse_ing_record = compile_decoder(
+    IngRecord,
+    schema(IngRecord, pascal_case, {"create_time": "DateAdded"}, {"lucky_count": 0}),
+    "Build an IngRecord from an OPENAPI status payload.",
+)
+parse_news_record = compile_decoder(
+    NewsRecord,
+    schema(NewsRecord, pascal_case, {"create_time": "DateAdded"}),
+    "Build a NewsRecord from an OPENAPI news item payload.",
+)
+parse_fav_record = compile_decoder(
+    FavRecord,
+    schema(FavRecord, pascal_case, {"create_time": "DateAdded"}),
+    "Build a FavRecord from an OPENAPI wz payload.",
+)
@@ -0,0 +1,176 @@
+"""Pagination helpers for list endpoints."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+from .concurrency import submit_in_context
+
+T = TypeVar("T")
+
+
+def plan_pages(skip: int, take: int, max_page_size: int) -> Tuple[int, int, int]:
+    """
+    Map a ``skip/take`` window onto server pages.
+    
+    Picks the smallest page size that covers the whole window with a single
+    page; if no size up to ``max_page_size`` does, falls back to pages of
+    ``min(take, max_page_size)`` items.
+    
+    Args:
+        skip: Number of items to skip
+        take: Number of items to return
+        max_page_size: Largest page size the server accepts
+    
+    Returns:
+        ``(page_size, first_page, last_page)`` with 1-based page numbers
+    """
+    skip = max(skip, 0)
+    take = max(take, 1)
+    last_index = skip + take - 1
+    
+    for size in range(take, min(last_index + 1, max_page_size) + 1):
+        if skip // size == last_index // size:
+            page = skip // size + 1
+            return size, page, page
+    
+    size = min(take, max_page_size)
+    return size, skip // size + 1, last_index // size + 1
+
+
+class PageWindow:
+    """
+    Collects a ``skip/take`` window from the pages chosen by :func:`plan_pages`.
+    
+    The caller fetches ``pages`` in order and passes each to :meth:`add`,
+    stopping as soon as it returns False.
+    """
+    
+    def __init__(self, skip: int, take: int, max_page_size: int):
+        self.page_size, first_page, last_page = plan_pages(skip, take, max_page_size)
+        self.pages = range(first_page, last_page + 1)
+        self.take = take
+        self.items: List = []
+        self.total = 0
+        self._offset = skip - (first_page - 1) * self.page_size
+    
+    def add(self, page: int, items: List, total: int) -> bool:
+        """Add a fetched page; returns whether further pages are needed."""
+        self.items.extend(items[self._offset:])
+        self._offset = 0
+        self.total = total
+        # A short page or one reaching the total is the last
+        return len(items) >= self.page_size and page * self.page_size < total
+    
+    def result(self) -> Tuple[List, int]:
+        """The window's items and the total count reported by the server."""
+        return self.items[:self.take], self.total
+
+
+def fit_page_size(page_size: int, limit: Optional[int]) -> int:
+    """Shrink the page size when ``limit`` is smaller, to avoid over-fetching."""
+    if limit is not None and 0 < limit < page_size:
+        return limit
+    return page_size
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List[T]],
+    page_size: int,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """
+    Lazily iterate items page by page.
+    
+    While the caller consumes one page the next one is fetched in a
+    background thread. Iteration stops on a short page or after ``limit``
+    items.
+    
+    Args:
+        fetch_page: Callable returning the items of a 1-based page
+        page_size: Number of items requested per page
+        limit: Maximum number of items to yield (None for no limit)
+        prefetch: Fetch the next page while the current one is consumed
+    """
+    if limit is not None and limit <= 0:
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Optional[Future] = None
+    count = 0
+    page = 1
+    try:
+        items = fetch_page(page)
+        while True:
+            has_more = len(items) >= page_size
+            if limit is not None and count + len(items) >= limit:
+                has_more = False
+            if has_more and executor is not None:
+                pending = submit_in_context(executor, fetch_page, page + 1)
+            
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            
+            if not has_more:
+                return
+            page += 1
+            if pending is not None:
+                items, pending = pending.result(), None
+            else:
+                items = fetch_page(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[List[T]]],
+    page_size: int,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Async counterpart of :func:`iter_pages`.
+    
+    The next page is fetched in a task on the running event loop while the
+    caller consumes the current one.
+    """
+    # Imported here so that sync-only (CLI) use does not pay for asyncio
+    import asyncio
+    
+    if limit is not None and limit <= 0:
+        return
+    
+    pending: Optional[asyncio.Task] = None
+    count = 0
+    page = 1
+    try:
+        items = await fetch_page(page)
+        while True:
+            has_more = len(items) >= page_size
+            if limit is not None and count + len(items) >= limit:
+                has_more = False
+            if has_more and prefetch:
+                pending = asyncio.ensure_future(fetch_page(page + 1))
+            
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            
+            if not has_more:
+                return
+            page += 1
+            if pending is not None:
+                items, pending = await pending, None
+            else:
+                items = await fetch_page(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,200 @@
+"""Polling for new ings (闪存) with since-id deduplication and an adaptive interval."""
+
+import inspect
+import threading
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, List, Optional, Set, Union
+
+from .models import IngEntry
+
+if TYPE_CHECKING:
+    import asyncio
+    from .tracing import Tracer
+    from .client import IngAPI
+    from .async_client import AsyncIngAPI
+
+
+class _IngPollerBase:
+    """State shared by the sync and async pollers: the since id and the interval."""
+    
+    # Weight of the latest poll in the smoothed post rate
+    SMOOTHING = 0.3
+    
+    def __init__(
+        self,
+        ings: Union["IngAPI", "AsyncIngAPI"],
+        ing_type: int = 1,
+        since_id: Optional[int] = None,
+        page_size: int = 30,
+        max_pages: int = 5,
+        min_interval: float = 2.0,
+        max_interval: float = 120.0,
+        target: Optional[float] = None,
+        backfill: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        tracer: Optional["Tracer"] = None,
+    ):
+        self.ings = ings
+        self.tracer = tracer
+        self.ing_type = ing_type
+        self.since_id = since_id
+        self.page_size = page_size
+        self.max_pages = max(max_pages, 1)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target = target if target is not None else page_size / 2
+        self.backfill = backfill
+        self.clock = clock
+        self.interval = min_interval
+        # Smoothed number of new ings per second, None before the second poll
+        self.rate: Optional[float] = None
+        self.polls = 0
+        self.requests = 0
+        # Polls that hit max_pages before reaching a known id (entries may have been missed)
+        self.overflows = 0
+        self._last_poll: Optional[float] = None
+    
+    def _span(self):
+        """Span around one poll; a no-op without a tracer."""
+        return self.tracer.span("ing.poll") if self.tracer is not None else nullcontext()
+    
+    def _scan(self, entries: List[IngEntry], seen: Set[int], fresh: List[IngEntry]) -> bool:
+        """Collect the unseen entries of one page; True when no further page is needed."""
+        self.requests += 1
+        if self.since_id is None:
+            # First poll: remember where the feed is, hand out only the backfill
+            fresh.extend(entries[:self.backfill])
+            seen.update(entry.id for entry in entries)
+            return True
+        known = False
+        for entry in entries:
+            if entry.id <= self.since_id:
+                known = True
+            elif entry.id not in seen:
+                # Pages shift while new ings arrive, so page 2 may repeat page 1
+                seen.add(entry.id)
+                fresh.append(entry)
+        return known or len(entries) < self.page_size
+    
+    def _finish(self, fresh: List[IngEntry], seen: Set[int], complete: bool) -> List[IngEntry]:
+        """Advance the since id and the interval; new entries oldest first."""
+        now = self.clock()
+        first = self.since_id is None
+        if seen:
+            self.since_id = max(seen) if first else max(self.since_id, max(seen))
+        if not complete:
+            self.overflows += 1
+        
+        if self._last_poll is not None and not first:
+            elapsed = max(now - self._last_poll, 1e-3)
+            observed = len(fresh) / elapsed
+            self.rate = observed if self.rate is None else self.SMOOTHING * observed + (1 - self.SMOOTHING) * self.rate
+        self._last_poll = now
+        self.polls += 1
+        
+        if not complete:
+            self.interval = self.min_interval
+        elif self.rate:
+            # Aim for ``target`` new ings per poll
+            self.interval = min(max(self.target / self.rate, self.min_interval), self.max_interval)
+        elif self.rate is not None:
+            self.interval = self.max_interval
+        return sorted(fresh, key=lambda entry: entry.id)
+
+
+class IngPoller(_IngPollerBase):
+    """
+    Yields ings published since the last poll.
+    
+    Each poll reads the feed from the newest entry until it reaches an id
+    already seen (``since_id``), so a quiet feed costs one small request
+    and a burst is followed over up to ``max_pages`` pages. The first poll
+    only records the newest id (plus ``backfill`` recent entries). Between
+    polls the poller waits about ``target`` new ings' worth of time at the
+    observed post rate, within ``[min_interval, max_interval]``.
+    
+    Args:
+        ings: IngAPI of the client
+        ing_type: Feed to poll (1: all ings)
+        since_id: Only yield ings with a greater id (None: start at the newest)
+        page_size: Entries per request
+        max_pages: Requests per poll at most
+        min_interval: Shortest wait between polls (seconds)
+        max_interval: Longest wait between polls (seconds)
+        target: New ings wanted per poll (default: half a page)
+        backfill: Recent entries yielded by the first poll when ``since_id`` is None
+        clock: Monotonic time source
+        tracer: Tracer recording an ``ing.poll`` span per poll (``IngAPI.poller`` passes the client's)
+    """
+    
+    def poll(self) -> List[IngEntry]:
+        """Fetch the ings published since the previous poll, oldest first."""
+        seen: Set[int] = set()
+        fresh: List[IngEntry] = []
+        complete = False
+        with self._span():
+            for page in range(1, self.max_pages + 1):
+                entries = self.ings.get_page(page, self.page_size, self.ing_type)
+                if self._scan(entries, seen, fresh):
+                    complete = True
+                    break
+            return self._finish(fresh, seen, complete)
+    
+    def watch(self, stop: Optional[threading.Event] = None) -> Iterator[IngEntry]:
+        """Poll until ``stop`` is set (or forever), yielding new ings as they appear."""
+        while True:
+            yield from self.poll()
+            if stop is None:
+                time.sleep(self.interval)
+            elif stop.wait(self.interval):
+                return
+    
+    __iter__ = watch
+    
+    def run(self, callback: Callable[[IngEntry], Any], stop: Optional[threading.Event] = None):
+        """Call ``callback`` with every new ing until ``stop`` is set."""
+        for entry in self.watch(stop):
+            callback(entry)
+
+
+class AsyncIngPoller(_IngPollerBase):
+    """Async counterpart of :class:`IngPoller`; ``ings`` is an AsyncIngAPI."""
+    
+    async def poll(self) -> List[IngEntry]:
+        """Fetch the ings published since the previous poll, oldest first."""
+        seen: Set[int] = set()
+        fresh: List[IngEntry] = []
+        complete = False
+        with self._span():
+            for page in range(1, self.max_pages + 1):
+                entries = await self.ings.get_page(page, self.page_size, self.ing_type)
+                if self._scan(entries, seen, fresh):
+                    complete = True
+                    break
+            return self._finish(fresh, seen, complete)
+    
+    async def watch(self, stop: Optional["asyncio.Event"] = None) -> AsyncIterator[IngEntry]:
+        """Poll until ``stop`` is set (or forever), yielding new ings as they appear."""
+        import asyncio
+        
+        while True:
+            for entry in await self.poll():
+                yield entry
+            if stop is None:
+                await asyncio.sleep(self.interval)
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+    
+    __aiter__ = watch
+    
+    async def run(self, callback: Callable[[IngEntry], Any], stop: Optional["asyncio.Event"] = None):
+        """Call ``callback`` (a function or coroutine function) with every new ing until ``stop`` is set."""
+        async for entry in self.watch(stop):
+            result = callback(entry)
+            if inspect.isawaitable(result):
+                await result
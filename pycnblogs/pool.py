@@ -0,0 +1,124 @@
+"""Connection pool sizing, TCP keep-alive and process-wide shared sessions."""
+
+import atexit
+import hashlib
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings of the sync client.
+    
+    ``maxsize`` should be at least the number of threads using the client
+    at once (the ``concurrency`` of ``get_many``/``bulk``); otherwise extra
+    connections are opened and thrown away after each request, logging
+    "connection pool is full". With ``block=True`` callers wait for a free
+    connection instead.
+    
+    Args:
+        connections: Number of hosts whose pools are kept
+        maxsize: Idle connections kept per host
+        block: Never open more than ``maxsize`` connections per host
+        keepalive: Send TCP keep-alive probes on idle connections
+        keepalive_idle: Idle seconds before the first probe
+        keepalive_interval: Seconds between probes
+        keepalive_count: Unanswered probes before the connection is dropped
+    """
+    connections: int = 10
+    maxsize: int = 32
+    block: bool = False
+    keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 15
+    keepalive_count: int = 4
+    
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        """Options set on new sockets: urllib3's defaults plus keep-alive."""
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keepalive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # TCP_KEEPIDLE is called TCP_KEEPALIVE on macOS; skip what the platform lacks
+        idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+        for option, value in (
+            (idle, self.keepalive_idle),
+            (getattr(socket, "TCP_KEEPINTVL", None), self.keepalive_interval),
+            (getattr(socket, "TCP_KEEPCNT", None), self.keepalive_count),
+        ):
+            if option is not None:
+                options.append((socket.IPPROTO_TCP, option, value))
+        return options
+
+
+class PoolAdapter(HTTPAdapter):
+    """Transport adapter sized and configured by a :class:`PoolConfig`."""
+    
+    def __init__(self, config: PoolConfig = PoolConfig()):
+        # HTTPAdapter.__init__ sets its own ``config`` attribute
+        self.pool_config = config
+        super().__init__(pool_connections=config.connections, pool_maxsize=config.maxsize, pool_block=config.block)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.pool_config.socket_options()
+        super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault("socket_options", self.pool_config.socket_options())
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def build_session(config: PoolConfig = PoolConfig()) -> requests.Session:
+    """A session whose HTTP and HTTPS connections use ``config``."""
+    session = requests.Session()
+    adapter = PoolAdapter(config)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class SessionRegistry:
+    """
+    Sessions shared by every client of the process with the same PAT and pool settings.
+    
+    Short-lived clients created with ``share_session=True`` reuse the warm
+    connections (and TLS sessions) of earlier ones instead of opening new
+    ones. PATs are only kept as hashes. Shared sessions stay open until
+    :meth:`close` (called at interpreter exit).
+    """
+    
+    def __init__(self):
+        self._sessions: Dict[Tuple[str, PoolConfig], requests.Session] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, pat: str, config: PoolConfig = PoolConfig()) -> requests.Session:
+        """The shared session for ``pat`` and ``config``, created on first use."""
+        key = (hashlib.sha256(pat.encode()).hexdigest(), config)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = build_session(config)
+            return session
+    
+    def close(self):
+        """Close and forget all shared sessions."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Registry used by clients created with share_session=True
+SESSIONS = SessionRegistry()
+atexit.register(SESSIONS.close)
@@ -0,0 +1,237 @@
+"""Queued ing (闪存) publishing with local duplicate detection and per-item reporting."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .concurrency import map_bounded, to_result
+from .result import Err, Ok, Result
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .client import IngAPI
+
+PUBLISHED = "published"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+
+def content_key(content: str) -> str:
+    """Hash identifying an ing's content (surrounding whitespace ignored)."""
+    return hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
+
+
+@dataclass
+class PublishItem:
+    """
+    Outcome of one queued ing.
+    
+    ``status`` is ``"published"``, ``"duplicate"`` (already published within
+    the dedupe window, earlier in the same batch, or according to the
+    server) or ``"failed"``. An item published after a retry may be the ing
+    stored by an earlier attempt that failed with a 5xx, see
+    :class:`IngPublishQueue`.
+    """
+    index: int
+    content: str
+    is_private: bool
+    status: str = FAILED
+    result: Result = field(default_factory=lambda: Err("Not published"))
+    attempts: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the ing is on the server (published now or before)."""
+        return self.status != FAILED
+
+
+@dataclass
+class PublishReport:
+    """Per-item results of a flush, in the order the ings were queued."""
+    items: List[PublishItem] = field(default_factory=list)
+    elapsed: float = 0.0
+    
+    @property
+    def published(self) -> List[PublishItem]:
+        """Items sent and accepted in this flush."""
+        return [item for item in self.items if item.status == PUBLISHED]
+    
+    @property
+    def duplicates(self) -> List[PublishItem]:
+        """Items not published because the same content already was."""
+        return [item for item in self.items if item.status == DUPLICATE]
+    
+    @property
+    def failed(self) -> List[PublishItem]:
+        """Items that could not be published."""
+        return [item for item in self.items if item.status == FAILED]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary suitable for logging or JSON output."""
+        return {
+            "total": len(self.items),
+            "published": len(self.published),
+            "duplicates": len(self.duplicates),
+            "failed": len(self.failed),
+            "elapsed": self.elapsed,
+            "items": [
+                {
+                    "index": item.index,
+                    "status": item.status,
+                    "attempts": item.attempts,
+                    "error": None if item.ok else item.result.get_message(),
+                    "status_code": None if item.ok else item.result.status_code,
+                    "elapsed": item.elapsed,
+                }
+                for item in self.items
+            ],
+        }
+
+
+class IngPublishQueue:
+    """
+    Publishes bursts of ings with bounded concurrency and no duplicate requests.
+    
+    Content published (or queued) within the last ``dedupe_window`` seconds
+    is recognised by its hash and reported as a duplicate without a request,
+    instead of costing a round trip that the server rejects with "相同闪存已发布".
+    The same content queued twice in one batch is sent once.
+    
+    A failed publish is retried with ``retry``, but only on the statuses
+    the HTTP client does not already retry for POST requests:
+    ``retry_statuses`` outside ``safe_statuses`` (the 5xx codes by
+    default). 429 and connection failures are retried by the client's own
+    policy, so retrying them here as well would multiply its attempts; other
+    network errors are not retried because the ing may have been posted. A
+    rate limiter configured on the client applies to every attempt.
+    
+    A 5xx does not prove that the server discarded the ing. When a retry is
+    rejected as a duplicate, the item is reported as ``"published"``: the
+    ing on the server is then the one created by the earlier attempt.
+    
+    Args:
+        ings: IngAPI of the client
+        concurrency: Maximum publish requests in flight (1 keeps the queue order on the server)
+        dedupe_window: Seconds during which published content is remembered
+        retry: Retry policy for failed publishes, None to try once
+        clock: Monotonic time source
+        sleep: Function used to wait between attempts
+    """
+    
+    def __init__(
+        self,
+        ings: "IngAPI",
+        concurrency: int = 4,
+        dedupe_window: float = 3600.0,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.ings = ings
+        self.concurrency = concurrency
+        self.dedupe_window = dedupe_window
+        self.retry = retry
+        self.clock = clock
+        self.sleep = sleep
+        self._pending: List[PublishItem] = []
+        self._count = 0
+        # content hash -> when it was published (or reserved by an item in flight)
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def put(self, content: str, is_private: bool = False) -> PublishItem:
+        """Queue an ing; it is sent by the next :meth:`flush`."""
+        with self._lock:
+            item = PublishItem(self._count, content, is_private)
+            self._count += 1
+            self._pending.append(item)
+        return item
+    
+    def is_recent(self, content: str) -> bool:
+        """Whether ``content`` was published (or is being published) within the window."""
+        with self._lock:
+            self._expire()
+            return content_key(content) in self._recent
+    
+    def flush(self) -> PublishReport:
+        """Publish every queued ing and report the outcome of each."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._expire()
+            to_send = []
+            for item in batch:
+                key = content_key(item.content)
+                if key in self._recent:
+                    item.status, item.result = DUPLICATE, Ok(None)
+                else:
+                    # Reserve the content so later items in this batch are coalesced
+                    self._recent[key] = self.clock()
+                    to_send.append(item)
+        
+        start = time.perf_counter()
+        for _, result in map_bounded(self._publish, to_send, self.concurrency, ordered=False):
+            # _publish never raises, so the result is always Ok
+            result.unwrap()
+        return PublishReport(items=batch, elapsed=time.perf_counter() - start)
+    
+    def publish_many(self, contents: Iterable[Union[str, Tuple[str, bool]]]) -> PublishReport:
+        """Queue ``contents`` (strings or ``(content, is_private)`` pairs) and flush."""
+        for content in contents:
+            if isinstance(content, str):
+                self.put(content)
+            else:
+                self.put(*content)
+        return self.flush()
+    
+    def _publish(self, item: PublishItem):
+        start = time.perf_counter()
+        duplicate = self.ings.DUPLICATE_MESSAGE
+        while True:
+            item.attempts += 1
+            result = to_result(self._send, item)
+            if result.is_ok():
+                item.status = PUBLISHED
+                break
+            if duplicate in str(result.error):
+                # After a 5xx the duplicate is most likely the ing stored by that attempt
+                item.status, result = (PUBLISHED if item.attempts > 1 else DUPLICATE), Ok(None)
+                break
+            if not self._should_retry(result, item.attempts):
+                break
+            self.sleep(self.retry.get_backoff(item.attempts))
+        item.result = result
+        item.elapsed = time.perf_counter() - start
+        
+        key = content_key(item.content)
+        with self._lock:
+            if item.ok:
+                self._recent[key] = self.clock()
+                self._recent.move_to_end(key)
+            else:
+                # Let a later flush try this content again
+                self._recent.pop(key, None)
+    
+    def _send(self, item: PublishItem) -> Result:
+        return self.ings.publish(item.content, item.is_private, ignore_duplicate=False)
+    
+    def _should_retry(self, result: Err, attempt: int) -> bool:
+        if self.retry is None or attempt >= self.retry.max_attempts:
+            return False
+        # Safe statuses (429) were already retried by the HTTP client; no status code
+        # means a network error the client either retried or could not resend safely
+        return result.status_code in self.retry.retry_statuses - self.retry.safe_statuses
+    
+    def _expire(self):
+        limit = self.clock() - self.dedupe_window
+        while self._recent:
+            key, when = next(iter(self._recent.items()))
+            if when >= limit:
+                break
+            del self._recent[key]
@@ -0,0 +1,124 @@
+"""Client-side rate limiting with token buckets."""
+
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from .constants import BLOG_BACKEND, OPENAPI
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers that find the bucket empty wait for their turn instead of being
+    rejected, so a burst is smoothed into the steady rate.
+    
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (defaults to ``rate``, at least 1)
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` from the bucket, going into debt if needed.
+        
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until ``tokens`` are available.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Per endpoint family rate limits.
+    
+    Buckets are keyed by URL prefix, e.g. :data:`~pycnblogs.constants.BLOG_BACKEND`
+    and :data:`~pycnblogs.constants.OPENAPI`; a request uses the bucket with
+    the longest matching prefix, or ``default`` when none matches. Pass the
+    same instance to several clients to share one budget across them.
+    
+    Args:
+        limits: Mapping of URL prefix to a TokenBucket or a rate (requests per second)
+        default: Bucket or rate for URLs matching no prefix (None for unlimited)
+    """
+    
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Union[TokenBucket, float]]] = None,
+        default: Union[TokenBucket, float, None] = None,
+    ):
+        self.buckets: Dict[str, TokenBucket] = {
+            prefix: _as_bucket(limit) for prefix, limit in (limits or {}).items()
+        }
+        self.default = _as_bucket(default) if default is not None else None
+        # Longest prefix first so the most specific bucket wins
+        self._prefixes = sorted(self.buckets, key=len, reverse=True)
+    
+    @classmethod
+    def per_family(
+        cls,
+        blog_backend: float,
+        openapi: float,
+        blog_backend_url: str = BLOG_BACKEND,
+        openapi_url: str = OPENAPI,
+    ) -> "RateLimiter":
+        """
+        Limiter with one bucket for BLOG_BACKEND and one for OPENAPI.
+        
+        Pass the client's ``blog_backend``/``openapi`` base URLs as
+        ``blog_backend_url``/``openapi_url`` when they are not the defaults.
+        """
+        return cls({blog_backend_url.rstrip("/"): blog_backend, openapi_url.rstrip("/"): openapi})
+    
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        """Bucket governing ``url``, if any."""
+        for prefix in self._prefixes:
+            if url.startswith(prefix):
+                return self.buckets[prefix]
+        return self.default
+    
+    def reserve(self, url: str) -> float:
+        """Reserve one request for ``url``; returns the seconds to wait."""
+        bucket = self.bucket_for(url)
+        return bucket.reserve() if bucket is not None else 0.0
+    
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url`` is allowed; returns the seconds waited."""
+        bucket = self.bucket_for(url)
+        return bucket.acquire() if bucket is not None else 0.0
+
+
+def _as_bucket(limit: Union[TokenBucket, float]) -> TokenBucket:
+    if isinstance(limit, TokenBucket):
+        return limit
+    return TokenBucket(float(limit))
@@ -0,0 +1,133 @@
+"""Retry policy with exponential backoff for HTTP requests."""
+
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy for transient failures.
+    
+    Idempotent methods are retried on ``retry_statuses`` and on network
+    errors. Other methods (``POST``) are only retried when the server
+    certainly did not process the request: ``safe_statuses`` (429 by
+    default) or a failure to connect.
+    
+    Args:
+        max_attempts: Total attempts including the first one
+        backoff_factor: Base delay in seconds, doubled on every attempt
+        max_backoff: Upper bound for the computed backoff
+        jitter: Fraction (0-1) of the backoff randomly shaved off to spread retries
+        respect_retry_after: Honour the ``Retry-After`` response header
+        max_retry_after: Upper bound for delays taken from ``Retry-After``
+        retry_statuses: Status codes retried for idempotent methods
+        safe_statuses: Status codes retried for any method
+        idempotent_methods: Methods considered safe to resend
+    """
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.5
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    safe_statuses: FrozenSet[int] = frozenset({429})
+    idempotent_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    
+    def is_idempotent(self, method: str) -> bool:
+        """Whether ``method`` may be resent blindly."""
+        return method.upper() in self.idempotent_methods
+    
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        """Whether ``status_code`` is a transient failure for ``method``."""
+        if status_code in self.safe_statuses:
+            return True
+        return status_code in self.retry_statuses and self.is_idempotent(method)
+    
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """Whether a response with ``status_code`` on ``attempt`` should be retried."""
+        return attempt < self.max_attempts and self.is_retryable_status(method, status_code)
+    
+    def should_retry_error(self, method: str, attempt: int, connect_failed: bool) -> bool:
+        """
+        Whether a network error on ``attempt`` should be retried.
+        
+        Args:
+            method: HTTP method
+            attempt: 1-based attempt number that failed
+            connect_failed: True if the connection was never established
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return connect_failed or self.is_idempotent(method)
+    
+    def get_backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Delay in seconds before the attempt following ``attempt``.
+        
+        A valid ``Retry-After`` header takes precedence over the computed
+        exponential backoff.
+        """
+        if retry_after and self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_retry_after)
+        
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    # email (and socket) are slow to import and HTTP dates are rare
+    from email.utils import parsedate_to_datetime
+    
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryStats:
+    """Thread-safe retry counters of an HTTP client."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+        self.by_reason: Counter = Counter()
+    
+    def record_retry(self, reason: str):
+        """Record one retry caused by ``reason`` (status code or error name)."""
+        with self._lock:
+            self.retries += 1
+            self.by_reason[reason] += 1
+    
+    def record_exhausted(self):
+        """Record a request that still failed after its last attempt."""
+        with self._lock:
+            self.exhausted += 1
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Snapshot of the counters."""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "by_reason": dict(self.by_reason),
+            }
@@ -0,0 +1,186 @@
+"""Incremental decoding of JSON arrays from a chunked response body."""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from .exceptions import ResponseTooLargeError
+
+# Size of the chunks read from a streamed response body
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_INCOMPLETE = object()
+
+
+class JSONArrayParser:
+    """
+    Push parser yielding the elements of a JSON array as its bytes arrive.
+    
+    The array is either the whole document (``key=None``, e.g. the
+    ``statuses`` and ``newsitems`` endpoints) or the value of ``key`` in a
+    top-level object (e.g. ``postList``). Other top-level members of the
+    object are collected into :attr:`extra`. Only one element is held in
+    memory at a time, besides the undecoded tail of the input.
+    
+    Args:
+        key: Member of the top-level object holding the array, or None
+    """
+    
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self.extra: Dict[str, Any] = {}
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._text = ""
+        self._pos = 0
+        self._state = "start"
+        self._name: Optional[str] = None
+        # Skip re-parsing an incomplete value until the buffer has grown enough
+        self._retry_at = 0
+    
+    def feed(self, data: bytes) -> List[Any]:
+        """Add a chunk of the body; returns the elements it completed."""
+        self._text = self._text[self._pos:] + self._decode(data)
+        self._pos = 0
+        if len(self._text) < self._retry_at:
+            return []
+        return self._parse(final=False)
+    
+    def close(self) -> List[Any]:
+        """Signal the end of the body; returns the remaining elements."""
+        self._text = self._text[self._pos:] + self._decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != "end":
+            raise self._error("Unexpected end of JSON data")
+        return items
+    
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        text = self._text
+        while self._state != "end":
+            self._pos = _WHITESPACE.match(text, self._pos).end()
+            if self._pos >= len(text):
+                break
+            char = text[self._pos]
+            state = self._state
+            
+            if state == "start":
+                self._consume("[" if self.key is None else "{")
+                self._state = "first_item" if self.key is None else "first_name"
+            elif state in ("first_name", "first_item") and char in "}]":
+                self._consume("}" if state == "first_name" else "]")
+                self._state = "end" if state == "first_name" else self._after_array()
+            elif state in ("first_name", "name"):
+                name = self._value(final)
+                if name is _INCOMPLETE:
+                    break
+                if not isinstance(name, str):
+                    raise self._error("Expecting property name")
+                self._name = name
+                self._state = "colon"
+            elif state == "colon":
+                self._consume(":")
+                self._state = "value"
+            elif state == "value" and self._name == self.key and char == "[":
+                self._consume("[")
+                self._state = "first_item"
+            elif state == "value":
+                value = self._value(final)
+                if value is _INCOMPLETE:
+                    break
+                self.extra[self._name] = value
+                self._state = "after_value"
+            elif state == "after_value":
+                self._consume("," if char == "," else "}")
+                self._state = "name" if char == "," else "end"
+            elif state in ("first_item", "item"):
+                value = self._value(final)
+                if value is _INCOMPLETE:
+                    break
+                items.append(value)
+                self._state = "after_item"
+            elif state == "after_item":
+                self._consume("," if char == "," else "]")
+                self._state = "item" if char == "," else self._after_array()
+        return items
+    
+    def _after_array(self) -> str:
+        return "end" if self.key is None else "after_value"
+    
+    def _consume(self, expected: str):
+        if self._text[self._pos] != expected:
+            raise self._error(f"Expecting {expected!r}")
+        self._pos += 1
+    
+    def _value(self, final: bool) -> Any:
+        try:
+            value, end = _DECODER.raw_decode(self._text, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._retry_at = 2 * (len(self._text) - self._pos)
+            return _INCOMPLETE
+        # A number ending at the end of the buffer may continue in the next chunk
+        if end == len(self._text) and not final:
+            self._retry_at = 2 * (len(self._text) - self._pos)
+            return _INCOMPLETE
+        self._pos = end
+        self._retry_at = 0
+        return value
+    
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._text, self._pos)
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    key: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Decode array elements from an iterable of byte chunks.
+    
+    ``extra`` receives the other top-level members once the body is consumed.
+    """
+    parser = JSONArrayParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+    if extra is not None:
+        extra.update(parser.extra)
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes],
+    key: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """Async version of :func:`iter_json_array`."""
+    parser = JSONArrayParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+    if extra is not None:
+        extra.update(parser.extra)
+
+
+def select_items(data: Any, key: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """Non-streaming counterpart: pick the array out of an already decoded body."""
+    if key is None:
+        return data if isinstance(data, list) else []
+    if not isinstance(data, dict):
+        return []
+    if extra is not None:
+        extra.update((name, value) for name, value in data.items() if name != key)
+    return data.get(key) or []
+
+
+def check_size(size: int, limit: Optional[int], status_code: Optional[int] = None):
+    """Raise ResponseTooLargeError when ``size`` exceeds ``limit``."""
+    if limit is not None and size > limit:
+        raise ResponseTooLargeError(size, limit, status_code)
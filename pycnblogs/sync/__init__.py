@@ -0,0 +1,18 @@
+"""Local mirroring of blog posts and pushing of local Markdown files."""
+
+from .store import MirrorStore
+from .mirror import PostMirror, MirrorReport
+from .manifest import Manifest, ManifestEntry
+from .push import MarkdownPusher, MarkdownPost, PushChange, PushReport
+
+__all__ = [
+    "MirrorStore",
+    "PostMirror",
+    "MirrorReport",
+    "Manifest",
+    "ManifestEntry",
+    "MarkdownPusher",
+    "MarkdownPost",
+    "PushChange",
+    "PushReport",
+]
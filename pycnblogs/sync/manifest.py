@@ -0,0 +1,53 @@
+"""Manifest mapping local Markdown files to posts."""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+MANIFEST_NAME = ".cnblogs.json"
+
+
+@dataclass
+class ManifestEntry:
+    """Last known remote state of one local file."""
+    post_id: int
+    hash: str
+    publish: bool = False
+    modify_time: Optional[str] = None
+
+
+class Manifest:
+    """
+    JSON manifest stored next to the Markdown files.
+    
+    Keys are POSIX paths relative to the synced directory.
+    
+    Args:
+        path: Manifest file path
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: Dict[str, ManifestEntry] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries = {
+                name: ManifestEntry(**entry) for name, entry in data.get("posts", {}).items()
+            }
+    
+    def get(self, name: str) -> Optional[ManifestEntry]:
+        return self.entries.get(name)
+    
+    def set(self, name: str, entry: ManifestEntry):
+        self.entries[name] = entry
+    
+    def save(self):
+        """Write the manifest atomically."""
+        data = {
+            "version": 1,
+            "posts": {name: asdict(entry) for name, entry in sorted(self.entries.items())},
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        tmp.replace(self.path)
@@ -0,0 +1,92 @@
+"""Incremental post mirror: fetch bodies only for posts that changed."""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List
+
+from ..result import Err
+from .store import MirrorStore
+
+if TYPE_CHECKING:
+    from ..client import PostAPI
+
+
+@dataclass
+class MirrorReport:
+    """Outcome of one mirror run."""
+    listed: int = 0
+    added: List[int] = field(default_factory=list)
+    updated: List[int] = field(default_factory=list)
+    unchanged: int = 0
+    removed: List[int] = field(default_factory=list)
+    failed: Dict[int, Err] = field(default_factory=dict)
+    elapsed: float = 0.0
+    
+    @property
+    def fetched(self) -> int:
+        """Number of post bodies downloaded."""
+        return len(self.added) + len(self.updated)
+
+
+class PostMirror:
+    """
+    Keep a :class:`MirrorStore` in sync with the blog.
+    
+    Each run walks the post list (metadata only, a handful of requests),
+    compares every ``modify_time`` with the stored one and downloads bodies
+    only for new or modified posts, so a run costs O(changed posts).
+    
+    Args:
+        posts: PostAPI of an open client
+        store: Local mirror store
+        concurrency: Maximum concurrent body downloads
+    """
+    
+    def __init__(self, posts: "PostAPI", store: MirrorStore, concurrency: int = 8):
+        self.posts = posts
+        self.store = store
+        self.concurrency = concurrency
+    
+    def run(self, prune: bool = True) -> MirrorReport:
+        """
+        Synchronise the mirror once.
+        
+        Args:
+            prune: Remove posts from the mirror that no longer exist on the blog
+        """
+        start = time.perf_counter()
+        report = MirrorReport()
+        known = self.store.get_versions()
+        seen = set()
+        changed = []
+        unchanged = []
+        
+        for post in self.posts.iter_all():
+            report.listed += 1
+            seen.add(post.id)
+            if known.get(post.id) == post.modify_time:
+                unchanged.append(post)
+            else:
+                changed.append(post.id)
+        
+        self.store.update_metadata(unchanged)
+        report.unchanged = len(unchanged)
+        
+        # The model cache may still hold the previous version
+        if self.posts.model_cache is not None:
+            for post_id in changed:
+                self.posts.model_cache.invalidate("post", post_id)
+        
+        for post_id, result in self.posts.get_many(changed, self.concurrency, ordered=False):
+            if result.is_err():
+                report.failed[post_id] = result
+                continue
+            self.store.upsert(result.unwrap())
+            (report.updated if post_id in known else report.added).append(post_id)
+        
+        if prune:
+            report.removed = sorted(set(known) - seen)
+            self.store.delete(report.removed)
+        
+        report.elapsed = time.perf_counter() - start
+        return report
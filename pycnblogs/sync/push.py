@@ -0,0 +1,250 @@
+"""Push a directory of Markdown files to the blog, uploading only what changed."""
+
+import difflib
+import hashlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from ..bulk import BulkReport, PostOperation
+from .manifest import MANIFEST_NAME, Manifest, ManifestEntry
+from .store import MirrorStore
+
+if TYPE_CHECKING:
+    from ..client import PostAPI
+
+
+@dataclass
+class MarkdownPost:
+    """A post read from a local Markdown file."""
+    name: str
+    title: str
+    body: str
+    publish: Optional[bool] = None
+    
+    @property
+    def hash(self) -> str:
+        return content_hash(self.title, self.body)
+
+
+@dataclass
+class PushChange:
+    """Planned action for one file: ``create``, ``update``, ``unchanged`` or ``conflict``."""
+    post: MarkdownPost
+    action: str
+    post_id: Optional[int] = None
+    diff: Optional[str] = None
+
+
+@dataclass
+class PushReport:
+    """Plan of a push and, unless it was a dry run, the upload results."""
+    changes: List[PushChange] = field(default_factory=list)
+    bulk: Optional[BulkReport] = None
+    dry_run: bool = False
+    elapsed: float = 0.0
+    
+    def by_action(self, action: str) -> List[PushChange]:
+        """Changes with the given action."""
+        return [change for change in self.changes if change.action == action]
+
+
+def content_hash(title: str, body: str) -> str:
+    """Hash identifying a post's title and body."""
+    digest = hashlib.sha256()
+    digest.update(title.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def read_markdown(path: Path, name: str) -> MarkdownPost:
+    """
+    Read a Markdown file.
+    
+    The title comes from a ``title:`` key in a ``---`` front matter block,
+    then from a leading ``# `` heading (removed from the body), then from
+    the file name. Front matter may also set ``publish: true|false``.
+    """
+    text = path.read_text(encoding="utf-8").replace("\r\n", "\n")
+    meta: Dict[str, str] = {}
+    if text.startswith("---\n"):
+        end = text.find("\n---\n", 4)
+        if end != -1:
+            for line in text[4:end].splitlines():
+                key, sep, value = line.partition(":")
+                if sep:
+                    meta[key.strip().lower()] = value.strip().strip("\"'")
+            text = text[end + 5:]
+    
+    title = meta.get("title")
+    body = text.lstrip("\n")
+    if not title and body.startswith("# "):
+        heading, _, body = body.partition("\n")
+        title = heading[2:].strip()
+        body = body.lstrip("\n")
+    if not title:
+        title = path.stem
+    
+    publish = None
+    if "publish" in meta:
+        publish = meta["publish"].lower() in ("true", "yes", "1")
+    return MarkdownPost(name=name, title=title, body=body, publish=publish)
+
+
+class MarkdownPusher:
+    """
+    Upload a directory of Markdown files as posts.
+    
+    A manifest (``.cnblogs.json`` in the directory) maps files to post ids
+    and records the content hash of the last upload, so only files whose
+    title or body changed are sent, each with a single request.
+    
+    Args:
+        posts: PostAPI of an open client
+        directory: Directory holding ``*.md`` files (searched recursively)
+        manifest_path: Manifest location (default: ``<directory>/.cnblogs.json``)
+        store: Optional mirror store used to diff against the last known remote body
+        default_publish: Publish state for new posts without a ``publish`` front matter key
+    """
+    
+    def __init__(
+        self,
+        posts: "PostAPI",
+        directory: Union[str, Path],
+        manifest_path: Union[str, Path, None] = None,
+        store: Optional[MirrorStore] = None,
+        default_publish: bool = False,
+    ):
+        self.posts = posts
+        self.directory = Path(directory)
+        self.manifest = Manifest(manifest_path or self.directory / MANIFEST_NAME)
+        self.store = store
+        self.default_publish = default_publish
+    
+    def scan(self) -> List[MarkdownPost]:
+        """Read every Markdown file in the directory."""
+        return [
+            read_markdown(path, path.relative_to(self.directory).as_posix())
+            for path in sorted(self.directory.rglob("*.md"))
+        ]
+    
+    def plan(self, check_remote: bool = False, with_diff: bool = False) -> List[PushChange]:
+        """
+        Decide what to upload, without sending anything.
+        
+        Args:
+            check_remote: List remote posts and flag files whose post was
+                edited on the blog since the last push as ``conflict``
+            with_diff: Attach a unified diff against the last known remote body
+        """
+        remote = self._remote_versions() if check_remote else {}
+        changes = []
+        for post in self.scan():
+            entry = self.manifest.get(post.name)
+            if entry is None:
+                changes.append(PushChange(post, "create", diff=self._diff(None, post) if with_diff else None))
+                continue
+            if entry.post_id in remote and entry.modify_time and remote[entry.post_id] != entry.modify_time:
+                action = "conflict"
+            elif entry.hash == post.hash and (post.publish is None or post.publish == entry.publish):
+                action = "unchanged"
+            else:
+                action = "update"
+            diff = self._diff(entry.post_id, post) if with_diff and action != "unchanged" else None
+            changes.append(PushChange(post, action, entry.post_id, diff))
+        return changes
+    
+    def push(
+        self,
+        dry_run: bool = False,
+        concurrency: int = 8,
+        check_remote: bool = False,
+        force: bool = False,
+    ) -> PushReport:
+        """
+        Upload new and changed files and update the manifest.
+        
+        After uploading, the post list is read (up to the last uploaded post)
+        to record the uploaded posts' modify times, which later pushes with
+        ``check_remote`` compare against.
+        
+        Args:
+            dry_run: Only plan (with diffs); send nothing and keep the manifest
+            concurrency: Maximum concurrent uploads
+            check_remote: Detect posts edited on the blog since the last push
+                (costs a few list requests before the upload)
+            force: Upload conflicting files anyway
+        """
+        start = time.perf_counter()
+        changes = self.plan(check_remote=check_remote, with_diff=dry_run)
+        report = PushReport(changes=changes, dry_run=dry_run)
+        if dry_run:
+            report.elapsed = time.perf_counter() - start
+            return report
+        
+        actions = ("create", "update", "conflict") if force else ("create", "update")
+        pending: List[Tuple[PushChange, bool]] = []
+        operations = []
+        for change in changes:
+            if change.action not in actions:
+                continue
+            entry = self.manifest.get(change.post.name)
+            publish = change.post.publish
+            if publish is None:
+                publish = entry.publish if entry is not None else self.default_publish
+            if change.post_id is None:
+                operations.append(PostOperation.create(change.post.title, change.post.body, publish))
+            else:
+                operations.append(PostOperation.update(
+                    change.post_id, title=change.post.title, body=change.post.body, publish=publish,
+                ))
+            pending.append((change, publish))
+        
+        report.bulk = self.posts.bulk(operations, concurrency=concurrency)
+        uploaded: Dict[int, ManifestEntry] = {}
+        for (change, publish), item in zip(pending, report.bulk.items):
+            if not item.ok:
+                continue
+            post_id = change.post_id if change.post_id is not None else item.result.unwrap()
+            entry = ManifestEntry(post_id=post_id, hash=change.post.hash, publish=publish)
+            self.manifest.set(change.post.name, entry)
+            uploaded[post_id] = entry
+        # Save first: should listing fail, the uploads are still recorded and not re-created
+        self.manifest.save()
+        if uploaded:
+            self._record_remote_versions(uploaded)
+            self.manifest.save()
+        
+        report.elapsed = time.perf_counter() - start
+        return report
+    
+    def _remote_versions(self) -> Dict[int, str]:
+        return {post.id: post.modify_time for post in self.posts.iter_all()}
+    
+    def _record_remote_versions(self, uploaded: Dict[int, ManifestEntry]):
+        # Only the posts uploaded in this run: other entries keep the version
+        # they were last pushed at, so their remote edits still show as conflicts
+        pending = dict(uploaded)
+        for post in self.posts.iter_all():
+            entry = pending.pop(post.id, None)
+            if entry is None:
+                continue
+            entry.modify_time = post.modify_time
+            if not pending:
+                break
+    
+    def _diff(self, post_id: Optional[int], post: MarkdownPost) -> str:
+        old = ""
+        if post_id is not None and self.store is not None:
+            stored = self.store.get(post_id)
+            if stored is not None:
+                old = f"# {stored.title}\n\n{stored.body or ''}"
+        new = f"# {post.title}\n\n{post.body}"
+        return "".join(difflib.unified_diff(
+            old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=f"remote/{post_id}" if post_id is not None else "/dev/null",
+            tofile=post.name,
+        ))
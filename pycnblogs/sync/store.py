@@ -0,0 +1,126 @@
+"""SQLite store holding a local mirror of blog posts."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from ..models import PostEntry
+
+_COLUMNS = (
+    "id", "title", "url", "create_time", "modify_time", "is_draft",
+    "is_pinned", "is_published", "comment_count", "body", "tags",
+)
+
+
+class MirrorStore:
+    """
+    Local copy of posts (metadata and body) in a SQLite database.
+    
+    Args:
+        path: Database file path (``":memory:"`` for a throwaway store)
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts ("
+                " id INTEGER PRIMARY KEY,"
+                " title TEXT NOT NULL,"
+                " url TEXT NOT NULL,"
+                " create_time TEXT,"
+                " modify_time TEXT,"
+                " is_draft INTEGER,"
+                " is_pinned INTEGER,"
+                " is_published INTEGER,"
+                " comment_count INTEGER,"
+                " body TEXT,"
+                " tags TEXT,"
+                " synced_at REAL NOT NULL)"
+            )
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+    
+    def get_versions(self) -> Dict[int, str]:
+        """Map of post id to the ``modify_time`` stored for it."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT id, modify_time FROM posts"))
+    
+    def get(self, post_id: int) -> Optional[PostEntry]:
+        """Stored post, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM posts WHERE id = ?", (post_id,)
+            ).fetchone()
+        return _row_to_post(row) if row is not None else None
+    
+    def iter_posts(self) -> Iterator[PostEntry]:
+        """Iterate over all stored posts ordered by id."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM posts ORDER BY id"
+            ).fetchall()
+        for row in rows:
+            yield _row_to_post(row)
+    
+    def upsert(self, post: PostEntry):
+        """Store a fully fetched post, body included."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO posts ({', '.join(_COLUMNS)}, synced_at)"
+                f" VALUES ({', '.join('?' * len(_COLUMNS))}, ?)",
+                (
+                    post.id, post.title, post.url, post.create_time, post.modify_time,
+                    post.is_draft, post.is_pinned, post.is_published, post.comment_count,
+                    post.body, json.dumps(post.tags, ensure_ascii=False) if post.tags is not None else None,
+                    time.time(),
+                ),
+            )
+    
+    def update_metadata(self, posts: Iterable[PostEntry]):
+        """
+        Refresh list metadata (pin/publish state, comment count) of stored
+        posts without touching their body or ``modify_time``.
+        """
+        rows = [
+            (p.title, p.url, p.is_draft, p.is_pinned, p.is_published, p.comment_count, time.time(), p.id)
+            for p in posts
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE posts SET title = ?, url = ?, is_draft = ?, is_pinned = ?,"
+                " is_published = ?, comment_count = ?, synced_at = ? WHERE id = ?",
+                rows,
+            )
+    
+    def delete(self, post_ids: Iterable[int]):
+        """Remove posts from the mirror."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM posts WHERE id = ?", [(i,) for i in post_ids])
+
+
+def _row_to_post(row) -> PostEntry:
+    values = dict(zip(_COLUMNS, row))
+    for key in ("is_draft", "is_pinned", "is_published"):
+        values[key] = bool(values[key])
+    if values["tags"] is not None:
+        values["tags"] = json.loads(values["tags"])
+    return PostEntry(**values)
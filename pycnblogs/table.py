@@ -0,0 +1,139 @@
+"""Columnar containers for large list results."""
+
+import sys
+from array import array
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from .models import PostRecord, IngRecord, NewsRecord, FavRecord
+
+R = TypeVar("R")
+
+
+class ModelTable(Generic[R]):
+    """
+    Column-oriented storage of list entries.
+    
+    Each field is kept in one column: integers and flags in compact
+    :mod:`array` buffers, repetitive strings interned so equal values share
+    one object. Rows are materialized as records only when accessed.
+    
+    Accepts model dataclasses, records, or any object with the table's
+    field names as attributes.
+    """
+    
+    record_type: Type[R]
+    # (field, kind): kind is an array typecode ("q" integers, "b" flags) for
+    # non-null numbers, "intern" for repetitive strings (aliases, timestamps),
+    # "str" for free text and "object" for nullable values
+    columns_spec: Tuple[Tuple[str, str], ...] = ()
+    
+    def __init__(self, entries: Optional[Iterable[Any]] = None):
+        self._columns: Dict[str, Union[array, List[Any]]] = {
+            name: array(kind) if kind in ("q", "b") else [] for name, kind in self.columns_spec
+        }
+        self._length = 0
+        if entries is not None:
+            self.extend(entries)
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[Any]) -> "ModelTable[R]":
+        """Build a table from entries or records."""
+        return cls(entries)
+    
+    def append(self, entry: Any):
+        """Add one entry."""
+        for name, kind in self.columns_spec:
+            value = getattr(entry, name)
+            if kind == "intern" and value is not None:
+                value = sys.intern(value)
+            self._columns[name].append(value)
+        self._length += 1
+    
+    def extend(self, entries: Iterable[Any]):
+        """Add entries."""
+        for entry in entries:
+            self.append(entry)
+    
+    def column(self, name: str) -> Sequence[Any]:
+        """The values of one field, in row order (arrays for numeric columns)."""
+        return self._columns[name]
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index: int) -> R:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("table index out of range")
+        return self.record_type(*(self._value(name, kind, index) for name, kind in self.columns_spec))
+    
+    def __iter__(self) -> Iterator[R]:
+        columns = [
+            (map(bool, self._columns[name]) if kind == "b" else self._columns[name])
+            for name, kind in self.columns_spec
+        ]
+        return map(self.record_type._make, zip(*columns))
+    
+    def _value(self, name: str, kind: str, index: int) -> Any:
+        value = self._columns[name][index]
+        return bool(value) if kind == "b" else value
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self._length})"
+
+
+class PostTable(ModelTable[PostRecord]):
+    """Columnar post list (titles and metadata, no bodies)."""
+    record_type = PostRecord
+    columns_spec = (
+        ("id", "q"),
+        ("title", "str"),
+        ("url", "str"),
+        ("create_time", "intern"),
+        ("modify_time", "intern"),
+        ("is_draft", "b"),
+        ("is_pinned", "b"),
+        ("is_published", "b"),
+        ("comment_count", "object"),
+    )
+
+
+class IngTable(ModelTable[IngRecord]):
+    """Columnar ing list."""
+    record_type = IngRecord
+    columns_spec = (
+        ("id", "q"),
+        ("content", "str"),
+        ("user_alias", "intern"),
+        ("user_display_name", "intern"),
+        ("create_time", "intern"),
+        ("comment_count", "q"),
+        ("lucky_count", "q"),
+    )
+
+
+class NewsTable(ModelTable[NewsRecord]):
+    """Columnar news list."""
+    record_type = NewsRecord
+    columns_spec = (
+        ("id", "q"),
+        ("title", "str"),
+        ("summary", "str"),
+        ("url", "str"),
+        ("view_count", "q"),
+        ("comment_count", "q"),
+        ("digg_count", "q"),
+        ("create_time", "intern"),
+    )
+
+
+class FavTable(ModelTable[FavRecord]):
+    """Columnar favorite list."""
+    record_type = FavRecord
+    columns_spec = (
+        ("id", "q"),
+        ("title", "str"),
+        ("url", "str"),
+        ("create_time", "intern"),
+    )
@@ -0,0 +1,236 @@
+"""Optional tracing: one span per API call with child spans per HTTP request."""
+
+import functools
+import inspect
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("pycnblogs_current_span", default=None)
+
+
+def current_span() -> Optional["Span"]:
+    """The span active in the current context, if any."""
+    return _current_span.get()
+
+
+class Span:
+    """
+    A timed operation with attributes, recorded in memory by :class:`Tracer`.
+    
+    Call :meth:`end` when done, or create it with :meth:`Tracer.span`.
+    """
+    
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: Optional[BaseException] = None
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self._started = time.perf_counter()
+    
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+    
+    def record_exception(self, error: BaseException):
+        self.error = error
+    
+    def end(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._started
+            self.tracer._on_end(self)
+    
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, duration={self.duration}, attributes={self.attributes})"
+
+
+class Tracer:
+    """
+    In-memory tracer keeping the most recent finished spans.
+    
+    Pass it (or an :class:`OpenTelemetryTracer`) as the client's ``tracer``.
+    Spans started while another span is active become its children, across
+    the worker threads and asyncio tasks the client spawns.
+    
+    Args:
+        max_spans: Number of finished spans to keep
+    """
+    
+    def __init__(self, max_spans: int = 10000):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+    
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a child of the current span without making it current."""
+        return Span(self, name, current_span(), attributes)
+    
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """Start a span and make it current for the duration of the block."""
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+    
+    def _on_end(self, span: Span):
+        self.spans.append(span)
+    
+    def children(self, span: Span) -> List[Span]:
+        """Finished spans whose parent is ``span``."""
+        return [other for other in self.spans if other.parent is span]
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Tracer exporting spans through OpenTelemetry (requires ``opentelemetry-api``).
+    
+    Args:
+        tracer: OpenTelemetry tracer (default: ``trace.get_tracer("pycnblogs")``)
+    """
+    
+    def __init__(self, tracer: Any = None):
+        super().__init__(max_spans=0)
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("OpenTelemetryTracer requires opentelemetry-api: pip install opentelemetry-api") from None
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("pycnblogs")
+    
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        parent = current_span()
+        context = None
+        if isinstance(parent, _OpenTelemetrySpan):
+            context = self._trace.set_span_in_context(parent.otel_span)
+        otel_span = self._tracer.start_span(name, context=context, attributes=_otel_attributes(attributes))
+        return _OpenTelemetrySpan(self, name, parent, attributes, otel_span)
+
+
+class _OpenTelemetrySpan(Span):
+    def __init__(self, tracer: OpenTelemetryTracer, name: str, parent: Optional[Span], attributes: Optional[Dict[str, Any]], otel_span: Any):
+        super().__init__(tracer, name, parent, attributes)
+        self.otel_span = otel_span
+    
+    def set_attribute(self, key: str, value: Any):
+        super().set_attribute(key, value)
+        if value is not None:
+            self.otel_span.set_attribute(key, value)
+    
+    def record_exception(self, error: BaseException):
+        super().record_exception(error)
+        from opentelemetry.trace import Status, StatusCode
+        self.otel_span.record_exception(error)
+        self.otel_span.set_status(Status(StatusCode.ERROR, str(error)))
+    
+    def end(self):
+        if self.duration is None:
+            self.otel_span.end()
+        super().end()
+
+
+def _otel_attributes(attributes: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not attributes:
+        return None
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def traced(name: str, iterates: bool = False) -> Callable:
+    """
+    Wrap an API method in a span named ``name``.
+    
+    The tracer is read from ``self.client.tracer``; without one the method
+    is called directly. ``iterates=True`` is for methods returning a
+    (sync or async) iterator: the span then lasts until the iterator is
+    exhausted or closed, and is current only while it produces an item.
+    """
+    
+    def decorate(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                tracer = getattr(self.client, "tracer", None)
+                if tracer is None:
+                    return await method(self, *args, **kwargs)
+                with tracer.span(name):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self.client, "tracer", None)
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            if iterates:
+                span = tracer.start_span(name)
+                token = _current_span.set(span)
+                try:
+                    iterator = method(self, *args, **kwargs)
+                finally:
+                    _current_span.reset(token)
+                if hasattr(iterator, "__anext__"):
+                    return _traced_aiter(span, iterator)
+                return _traced_iter(span, iterator)
+            with tracer.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    
+    return decorate
+
+
+def _traced_iter(span: Span, iterator: Iterator[Any]) -> Iterator[Any]:
+    count = 0
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            count += 1
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            span.record_exception(e)
+        raise
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        span.set_attribute("items", count)
+        span.end()
+
+
+async def _traced_aiter(span: Span, iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    count = 0
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            count += 1
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            span.record_exception(e)
+        raise
+    finally:
+        close = getattr(iterator, "aclose", None)
+        if close is not None:
+            await close()
+        span.set_attribute("items", count)
+        span.end()
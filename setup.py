@@ -28,4 +28,11 @@ setup(
     install_requires=[
         "requests>=2.28.0",
     ],
+    extras_require={
+        "async": ["httpx[http2]>=0.26.0"],
+        "fast": ["orjson>=3.6"],
+    },
+    entry_points={
+        "console_scripts": ["pycnblogs=pycnblogs.cli:main"],
+    },
 )
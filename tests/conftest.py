@@ -0,0 +1,29 @@
+"""Fixtures shared by the test modules."""
+
+import pytest
+
+from benchmarks.mock_server import MockCnblogsServer
+
+from .helpers import ScriptedServer
+
+
+@pytest.fixture
+def server():
+    """Mock Cnblogs server with 30 posts."""
+    with MockCnblogsServer(posts=30, body_size=100) as server:
+        yield server
+
+
+@pytest.fixture
+def serve():
+    """Start ScriptedServers answering with the given status codes."""
+    servers = []
+    
+    def start(*statuses):
+        server = ScriptedServer(statuses)
+        servers.append(server)
+        return server
+    
+    yield start
+    for server in servers:
+        server.close()
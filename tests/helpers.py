@@ -0,0 +1,216 @@
+"""Shared test doubles: an in-memory blog and a scripted HTTP server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from pycnblogs.exceptions import APIError
+from pycnblogs.result import Err
+from pycnblogs.retry import RetryPolicy
+from pycnblogs.streaming import select_items
+
+FAST = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=0)
+
+USER = {
+    "UserId": "u-1", "SpaceUserID": 1, "BlogId": 1, "DisplayName": "Test", "Face": "", "Avatar": "",
+    "Seniority": "1年", "BlogApp": "test", "FollowingCount": 0, "FollowerCount": 0, "IsVip": False,
+    "Joined": "2024-01-01T08:00:00",
+}
+NEWS = {
+    "Id": 1, "Title": "News", "Summary": "", "Url": "https://news.cnblogs.com/n/1/", "ViewCount": 0,
+    "CommentCount": 0, "DiggCount": 0, "DateAdded": "2024-01-01T08:00:00",
+}
+
+
+class FakeBlog:
+    """
+    In-memory blog standing in for HTTPClient.
+    
+    Serves the post list, single posts, post writes and deletes, the user,
+    news and ing endpoints. Posts are numbered from 1; each write bumps the
+    post's version, which shows in its ``dateUpdated``. Use :meth:`adapter`
+    to serve the same blog to a CnblogsClient through its requests session.
+    
+    Args:
+        count: Number of posts
+        ings: Number of ings in the ing feed
+        pat: PAT reported by the stand-in client
+    """
+    
+    tracer = None
+    
+    def __init__(self, count: int = 0, ings: int = 0, pat: str = "test"):
+        self.posts = {i: {"title": f"title {i}", "body": f"body {i}", "version": 1} for i in range(1, count + 1)}
+        self.ings = ings
+        self.pat = pat
+        # Params of every post list request
+        self.list_calls = []
+        # Single post reads and post writes
+        self.reads = 0
+        self.writes = 0
+        # (method, path) of every request
+        self.requests = []
+    
+    def payload(self, post_id: int, with_body: bool = True) -> dict:
+        """A post as the API returns it."""
+        post = self.posts[post_id]
+        data = {
+            "id": post_id,
+            "title": post.get("title", f"title {post_id}"),
+            "url": f"//www.cnblogs.com/u/p/{post_id}",
+            "datePublished": "2024-01-01T00:00:00",
+            "dateUpdated": f"2024-01-{post['version']:02d}T00:00:00",
+            "isDraft": False,
+            "isPinned": False,
+            "isPublished": post.get("published", True),
+        }
+        if with_body:
+            data["postBody"] = post["body"]
+        return data
+    
+    def respond(self, method: str, url: str, params=None, payload=None, pat=None):
+        """Answer one request with ``(status code, JSON body)``."""
+        parts = urlsplit(url)
+        path = parts.path
+        query = dict(parse_qsl(parts.query), **(params or {}))
+        self.requests.append((method, path))
+        
+        if path.endswith("/posts/list"):
+            self.list_calls.append(dict(params or query))
+            ids = sorted(self.posts)
+            size = int(query["s"])
+            start = (int(query["p"]) - 1) * size
+            listed = [self.payload(i, with_body=False) for i in ids[start:start + size]]
+            return 200, {"postsCount": len(ids), "postList": listed}
+        if path.endswith("/posts") and method == "POST":
+            self.writes += 1
+            post_id = payload.get("id") or max(self.posts, default=0) + 1
+            version = self.posts[post_id]["version"] + 1 if post_id in self.posts else 1
+            self.posts[post_id] = {
+                "title": payload["title"],
+                "body": payload["postBody"],
+                "published": payload["isPublished"],
+                "version": version,
+            }
+            return 200, {"id": post_id}
+        if "/posts/" in path:
+            post_id = int(path.rsplit("/", 1)[1])
+            if post_id not in self.posts:
+                return 404, {"message": "Not Found"}
+            if method == "DELETE":
+                del self.posts[post_id]
+                return 200, {}
+            self.reads += 1
+            return 200, {"blogPost": self.payload(post_id)}
+        if path.endswith("/users"):
+            # The user is identified by the PAT: its blog app is the PAT itself
+            return 200, dict(USER, BlogApp=pat or self.pat)
+        if "/newsitems/" in path:
+            return 200, [NEWS]
+        if "/statuses/@" in path:
+            size = int(query["pageSize"])
+            start = (int(query["pageIndex"]) - 1) * size + 1
+            return 200, [
+                {
+                    "Id": i,
+                    "Content": f"ing {i}",
+                    "UserAlias": f"user{i % 3}",
+                    "UserDisplayName": f"User {i % 3}",
+                    "DateAdded": "2024-01-01T00:00:00",
+                    "CommentCount": i % 5,
+                    "LuckyCount": 0,
+                }
+                for i in range(start, min(start + size, self.ings + 1))
+            ]
+        return 404, {"message": "Not Found"}
+    
+    def _call(self, method, url, raise_on_error, params=None, payload=None):
+        status, body = self.respond(method, url, params, payload)
+        if status >= 400:
+            if raise_on_error:
+                raise APIError(f"API request failed: {body['message']}", status_code=status)
+            return Err(body["message"], status_code=status)
+        return body
+    
+    def get(self, url, raise_on_error=True):
+        return self._call("GET", url, raise_on_error)
+    
+    def get_with_params(self, url, params, raise_on_error=True):
+        return self._call("GET", url, raise_on_error, params=params)
+    
+    def get_items(self, url, params=None, key=None, extra=None):
+        return select_items(self.get_with_params(url, params), key, extra)
+    
+    def post(self, url, json, raise_on_error=False):
+        return self._call("POST", url, raise_on_error, payload=json)
+    
+    def delete(self, url, raise_on_error=False):
+        return self._call("DELETE", url, raise_on_error)
+    
+    def adapter(self) -> "BlogAdapter":
+        """Transport adapter serving this blog, to mount on a client's session."""
+        return BlogAdapter(self)
+
+
+class BlogAdapter(BaseAdapter):
+    """requests transport adapter answering from a FakeBlog."""
+    
+    def __init__(self, blog: FakeBlog):
+        super().__init__()
+        self.blog = blog
+    
+    def send(self, request, **kwargs):
+        payload = json.loads(request.body) if request.body else None
+        pat = request.headers["Authorization"].split()[-1]
+        status, body = self.blog.respond(request.method, request.url, payload=payload, pat=pat)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        pass
+
+
+class ScriptedServer:
+    """Local HTTP server answering with a scripted list of status codes."""
+    
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.hits = 0
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                status = server.statuses[min(server.hits, len(server.statuses) - 1)]
+                server.hits += 1
+                body = json.dumps({"status": status}).encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            do_GET = do_POST = _reply
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,222 @@
+"""Offline tests for the async client, served by an httpx.MockTransport."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pycnblogs import AsyncCnblogsClient
+from pycnblogs.async_http_client import AsyncHTTPClient
+from pycnblogs.cache import MemoryCache
+from pycnblogs.exceptions import APIError
+from pycnblogs.result import Err
+
+from .helpers import FAST
+
+BLOG = "https://blog.test/api"
+OPENAPI = "https://open.test/api"
+
+
+def make_post(post_id, body="正文"):
+    return {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "url": f"//www.cnblogs.com/test/p/{post_id}",
+        "datePublished": "2024-01-01T08:00:00",
+        "dateUpdated": "2024-01-01T08:00:00",
+        "isDraft": False,
+        "isPinned": False,
+        "isPublished": True,
+        "feedBackCount": 0,
+        "postBody": body,
+        "tags": [],
+    }
+
+
+def make_ing(ing_id):
+    return {
+        "Id": ing_id,
+        "Content": f"闪存 {ing_id}",
+        "UserAlias": "test",
+        "UserDisplayName": "Test",
+        "DateAdded": "2024-01-01T08:00:00",
+        "CommentCount": 0,
+        "LuckyCount": 0,
+    }
+
+
+class FakeAPI:
+    """Request handler of a MockTransport emulating the post and ing endpoints."""
+    
+    def __init__(self, posts=5):
+        self.posts = {post_id: make_post(post_id) for post_id in range(1, posts + 1)}
+        self.requests = []
+        # Status codes answered before the real response, consumed one per request
+        self.failures = []
+        self.ings = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.failures:
+            return httpx.Response(self.failures.pop(0), json={"message": "Service Unavailable"})
+        path, query = request.url.path, request.url.params
+        if request.method == "GET" and path == "/api/posts/list":
+            page, size = int(query["p"]), int(query["s"])
+            ids = sorted(self.posts, reverse=True)[(page - 1) * size:page * size]
+            listed = [{k: v for k, v in self.posts[i].items() if k != "postBody"} for i in ids]
+            return httpx.Response(200, json={"postList": listed, "postsCount": len(self.posts)})
+        if path.startswith("/api/posts/"):
+            post_id = int(path.rsplit("/", 1)[1])
+            if post_id not in self.posts:
+                return httpx.Response(404, json={"message": "Not Found"})
+            if request.method == "DELETE":
+                del self.posts[post_id]
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json={"blogPost": self.posts[post_id]})
+        if request.method == "POST" and path == "/api/posts":
+            payload = json.loads(request.content)
+            post_id = payload.get("id") or max(self.posts, default=0) + 1
+            self.posts[post_id] = dict(make_post(post_id), title=payload["title"], postBody=payload["postBody"])
+            return httpx.Response(200, json={"id": post_id})
+        if request.method == "POST" and path == "/api/statuses":
+            content = json.loads(request.content)["content"]
+            if content in self.ings:
+                return httpx.Response(400, text="相同闪存已发布")
+            self.ings.append(content)
+            return httpx.Response(200, json={})
+        if path == "/api/statuses/@1":
+            page, size = int(query["pageIndex"]), int(query["pageSize"])
+            return httpx.Response(200, json=[make_ing(i) for i in range(100 - (page - 1) * size, 100 - page * size, -1)])
+        return httpx.Response(404, json={"message": "Not Found"})
+
+
+class ConditionalAPI:
+    """Serves one JSON document with an ETag and answers 304 to a matching If-None-Match."""
+    
+    def __init__(self):
+        self.statuses = []
+        self.conditional = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        etag = request.headers.get("If-None-Match")
+        self.conditional.append(etag)
+        status = 304 if etag == '"v1"' else 200
+        self.statuses.append(status)
+        if status == 304:
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"value": 1}, headers={"ETag": '"v1"'})
+
+
+def http_client(handler, **options):
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncHTTPClient("test-pat", session=session, **options)
+
+
+def api_client(handler, **options):
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncCnblogsClient("test-pat", session=session, blog_backend=BLOG, openapi=OPENAPI, **options)
+
+
+def test_retries_transient_statuses():
+    """Idempotent requests are retried on 503 and the retries are counted."""
+    api = FakeAPI()
+    api.failures = [503, 503]
+    
+    async def main():
+        async with http_client(api, retry=FAST) as client:
+            data = await client.get(f"{BLOG}/posts/1")
+            return data, client.retry_stats.to_dict()
+    
+    data, stats = asyncio.run(main())
+    assert data["blogPost"]["id"] == 1
+    assert len(api.requests) == 3
+    assert stats == {"retries": 2, "exhausted": 0, "by_reason": {"503": 2}}
+
+
+def test_gives_up_after_max_attempts():
+    """The last retryable failure is returned once the attempts are used up."""
+    api = FakeAPI()
+    api.failures = [503, 503, 503]
+    
+    async def main():
+        async with http_client(api, retry=FAST) as client:
+            with pytest.raises(APIError):
+                await client.get(f"{BLOG}/posts/1")
+            return client.retry_stats.exhausted
+    
+    assert asyncio.run(main()) == 1
+    assert len(api.requests) == 3
+
+
+def test_conditional_requests_reuse_cached_body():
+    """A cached ETag is sent back and a 304 answers with the cached body."""
+    api = ConditionalAPI()
+    cache = MemoryCache()
+    
+    async def main():
+        async with http_client(api, cache=cache) as client:
+            return [await client.get(f"{OPENAPI}/users") for _ in range(2)]
+    
+    assert asyncio.run(main()) == [{"value": 1}, {"value": 1}]
+    assert api.conditional == [None, '"v1"']
+    assert api.statuses == [200, 304]
+
+
+def test_streaming_get_items():
+    """stream_json decodes the array incrementally, including arrays under a key."""
+    api = FakeAPI(posts=3)
+    
+    async def main():
+        async with http_client(api, stream_json=True) as client:
+            extra = {}
+            posts = [item async for item in client.get_items(f"{BLOG}/posts/list", {"p": 1, "s": 10}, key="postList", extra=extra)]
+            ings = [item async for item in client.get_items(f"{OPENAPI}/statuses/@1?pageIndex=1&pageSize=2")]
+            with pytest.raises(APIError):
+                [item async for item in client.get_items(f"{OPENAPI}/missing")]
+            return posts, extra, ings
+    
+    posts, extra, ings = asyncio.run(main())
+    assert [post["id"] for post in posts] == [3, 2, 1]
+    assert extra == {"postsCount": 3}
+    assert [ing["Id"] for ing in ings] == [100, 99]
+
+
+def test_post_api():
+    """The async post API lists, reads, creates, updates and deletes posts."""
+    api = FakeAPI(posts=12)
+    
+    async def main():
+        async with api_client(api) as client:
+            posts, total = await client.post.get_list(skip=2, take=3)
+            assert [post.id for post in posts] == [10, 9, 8] and total == 12
+            assert (await client.post.get_one(5)).body == "正文"
+            
+            post_id = await client.post.create("新文章", "内容")
+            assert post_id == 13 and api.posts[13]["postBody"] == "内容"
+            assert await client.post.update(post_id, title="改名") == post_id
+            assert api.posts[13]["title"] == "改名" and api.posts[13]["postBody"] == "内容"
+            
+            assert (await client.post.delete(post_id)).is_ok()
+            assert isinstance(await client.post.delete(post_id), Err)
+            return [post_id async for post_id, _ in client.post.get_many([1, 2, 3])]
+    
+    assert asyncio.run(main()) == [1, 2, 3]
+
+
+def test_ing_api():
+    """The async ing API publishes (ignoring duplicates on request) and pages the feed."""
+    api = FakeAPI()
+    
+    async def main():
+        async with api_client(api, stream_json=True) as client:
+            assert (await client.ing.publish("hello")).is_ok()
+            assert (await client.ing.publish("hello")).is_ok()
+            duplicate = await client.ing.publish("hello", ignore_duplicate=False)
+            assert duplicate.status_code == 400 and client.ing.DUPLICATE_MESSAGE in duplicate.error
+            
+            assert [ing.id for ing in await client.ing.get_list(skip=0, take=3)] == [100, 99, 98]
+            return [ing.id async for ing in client.ing.iter_all(limit=5, page_size=2)]
+    
+    assert asyncio.run(main()) == [100, 99, 98, 97, 96]
+    assert api.ings == ["hello"]
@@ -2,13 +2,13 @@
 
 import asyncio
 import pytest
-from pycnblogs import CnblogsClient, AuthenticationError
+from pycnblogs import AsyncCnblogsClient
 
 
 @pytest.mark.asyncio
 async def test_user_info():
     """Test getting user information."""
-    async with CnblogsClient() as client:
+    async with AsyncCnblogsClient() as client:
         user_info = await client.user.get_info()
         assert user_info.display_name
         assert user_info.blog_app
@@ -18,7 +18,7 @@ async def test_user_info():
 @pytest.mark.asyncio
 async def test_list_posts():
     """Test listing posts."""
-    async with CnblogsClient() as client:
+    async with AsyncCnblogsClient() as client:
         posts, total = await client.post.get_list(skip=0, take=5)
         assert isinstance(posts, list)
         assert isinstance(total, int)
@@ -28,7 +28,7 @@ async def test_list_posts():
 @pytest.mark.asyncio
 async def test_list_ings():
     """Test listing ings."""
-    async with CnblogsClient() as client:
+    async with AsyncCnblogsClient() as client:
         ings = await client.ing.get_list(skip=0, take=5)
         assert isinstance(ings, list)
         print(f"Found {len(ings)} ings")
@@ -37,7 +37,7 @@ async def test_list_ings():
 @pytest.mark.asyncio
 async def test_list_news():
     """Test listing news."""
-    async with CnblogsClient() as client:
+    async with AsyncCnblogsClient() as client:
         news_list = await client.news.get_list(skip=0, take=5)
         assert isinstance(news_list, list)
         print(f"Found {len(news_list)} news items")
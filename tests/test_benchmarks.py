@@ -0,0 +1,38 @@
+"""Offline tests for the benchmark mock server and runner."""
+
+import argparse
+
+from benchmarks.run import SCENARIOS, format_results, run
+from pycnblogs import CnblogsClient
+
+
+def test_mock_server_serves_the_client(server):
+    """The client reaches the mock through its base URL options."""
+    with CnblogsClient(pat="test", **server.client_options) as client:
+        posts, total = client.post.get_list(skip=0, take=20)
+        assert total == 30 and len(posts) == 20
+        assert len(client.post.get_one(posts[0].id).body) == 100
+        assert client.user.get_info().blog_app == "bench"
+        assert len(client.ing.get_list(take=5)) == 5
+        assert client.post.delete(posts[0].id).is_ok()
+        assert client.post.get_count() == 29
+    
+    requests = server.stats()["requests"]
+    assert requests["GET /blog/posts/list"] == 2
+    assert requests["GET /blog/posts/{id}"] == 1
+
+
+def test_scenarios_report_requests(server):
+    """Every scenario runs and counts its requests."""
+    args = argparse.Namespace(
+        posts=30, fetch=10, body_size=100, concurrency=4, repeat=1,
+        backoff=None, stream_json=False, memory=True,
+    )
+    results = run(list(SCENARIOS), server.url, args)
+    
+    by_name = {result.scenario: result for result in results}
+    assert by_name["list"].items == 30
+    assert by_name["bulk_fetch"].requests == 10
+    assert by_name["update"].server_requests == {"POST /blog/posts": 10}
+    assert all(result.peak_memory for result in results)
+    assert "bulk_fetch" in format_results(results)
@@ -0,0 +1,136 @@
+"""Offline tests for run_operations and PostAPI.bulk."""
+
+import threading
+import time
+
+import pytest
+
+from pycnblogs import CnblogsClient, PostOperation
+from pycnblogs.bulk import run_operations
+from pycnblogs.exceptions import APIError
+from pycnblogs.result import Err, Ok
+
+DELAY = 0.05
+
+
+class FakePosts:
+    """Stand-in for PostAPI recording the calls per post and failing on the title "bad"."""
+    
+    def __init__(self):
+        self.calls = []
+        self.active = {}
+        self.overlaps = 0
+        self._lock = threading.Lock()
+    
+    def _run(self, post_id, what, fail=False):
+        with self._lock:
+            self.calls.append((post_id, what))
+            self.active[post_id] = self.active.get(post_id, 0) + 1
+            if self.active[post_id] > 1:
+                self.overlaps += 1
+        time.sleep(DELAY)
+        with self._lock:
+            self.active[post_id] -= 1
+        if fail:
+            raise APIError("Bad Request", status_code=400)
+    
+    def create(self, title, body, publish=False):
+        self._run(None, title)
+        return 100
+    
+    def update(self, post_id, title=None, body=None, publish=None, base=None):
+        self._run(post_id, title, fail=title == "bad")
+        return post_id
+    
+    def delete(self, post_id):
+        self._run(post_id, "delete")
+        return Ok(None)
+
+
+def test_operations_on_one_post_run_in_order():
+    """Operations sharing a post id never overlap and keep their input order."""
+    posts = FakePosts()
+    operations = [
+        PostOperation.update(1, title="a"),
+        PostOperation.update(2, title="x"),
+        PostOperation.update(1, title="b"),
+        PostOperation.create("new", "body"),
+        PostOperation.delete(1),
+    ]
+    report = run_operations(posts, operations, concurrency=4)
+    assert [item.index for item in report.items] == [0, 1, 2, 3, 4]
+    assert [item.result.unwrap() for item in report.items] == [1, 2, 1, 100, None]
+    assert [what for post_id, what in posts.calls if post_id == 1] == ["a", "b", "delete"]
+    assert posts.overlaps == 0
+
+
+def test_failure_skips_later_operations_on_the_same_post():
+    """After a failure the rest of that post's operations are skipped; other posts still run."""
+    posts = FakePosts()
+    operations = [
+        PostOperation.update(1, title="bad"),
+        PostOperation.update(2, title="x"),
+        PostOperation.update(1, title="b"),
+        PostOperation.delete(2),
+    ]
+    report = run_operations(posts, operations)
+    first, other, skipped, deleted = report.items
+    assert first.result.status_code == 400
+    assert isinstance(skipped.result, Err) and "Skipped" in skipped.result.error
+    assert other.ok and deleted.ok
+    assert (1, "b") not in posts.calls and (2, "delete") in posts.calls
+    assert [item.index for item in report.failed] == [0, 2]
+
+
+def test_failure_does_not_skip_when_disabled():
+    """skip_after_failure=False keeps running the post's later operations."""
+    posts = FakePosts()
+    operations = [PostOperation.update(1, title="bad"), PostOperation.update(1, title="b")]
+    report = run_operations(posts, operations, skip_after_failure=False)
+    assert [item.ok for item in report.items] == [False, True]
+    assert [what for _, what in posts.calls] == ["bad", "b"]
+
+
+def test_timings():
+    """Each item records its own duration; independent posts run in parallel."""
+    posts = FakePosts()
+    operations = [PostOperation.update(post_id, title="x") for post_id in range(1, 5)]
+    operations += [PostOperation.update(1, title="bad"), PostOperation.update(1, title="skipped")]
+    report = run_operations(posts, operations, concurrency=4)
+    run = report.items[:5]
+    assert all(item.elapsed >= DELAY for item in run)
+    assert report.items[5].elapsed == 0.0
+    # Post 1 needs two calls in a row, the others run alongside it
+    assert 2 * DELAY <= report.elapsed < 5 * DELAY
+    summary = report.to_dict()
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (6, 4, 2)
+    assert summary["items"][4]["status_code"] == 400
+
+
+def test_invalid_operations_are_rejected():
+    """Unknown actions and updates without an id fail before anything runs."""
+    posts = FakePosts()
+    with pytest.raises(ValueError):
+        run_operations(posts, [PostOperation("rename", post_id=1)])
+    with pytest.raises(ValueError):
+        run_operations(posts, [PostOperation("update")])
+    assert posts.calls == []
+
+
+def test_post_api_bulk(server):
+    """PostAPI.bulk runs creates, updates and deletes against the API."""
+    with CnblogsClient(pat="test", **server.client_options) as client:
+        report = client.post.bulk([
+            PostOperation.create("新文章", "正文", publish=True),
+            PostOperation.update(1, title="改名"),
+            PostOperation.delete(2),
+            PostOperation.update(2, title="已删除"),
+            PostOperation.delete(999),
+        ])
+        assert [item.ok for item in report.items] == [True, True, True, False, False]
+        assert client.post.get_one(report.items[0].result.unwrap()).title == "新文章"
+        assert client.post.get_one(1).title == "改名"
+        # The update runs after the delete of the same post, so it finds nothing
+        assert report.items[3].result.status_code == 404
+        assert report.items[4].result.status_code == 404
+    assert "DELETE /blog/posts/{id}" in server.stats()["requests"]
@@ -0,0 +1,120 @@
+"""Offline tests for the conditional GET cache."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pycnblogs.cache import MemoryCache, SQLiteCache, CachedResponse, ModelCache
+from pycnblogs.client import PostAPI
+from pycnblogs.exceptions import APIError
+from pycnblogs.http_client import HTTPClient
+
+from .helpers import FakeBlog
+
+
+@pytest.fixture
+def etag_server():
+    """Server that answers 304 when If-None-Match matches its ETag (always, with ``stale``)."""
+    state = {"hits": 0, "not_modified": 0, "version": 1, "stale": False}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            etag = f'"v{state["version"]}"'
+            if state["stale"] or self.headers.get("If-None-Match") == etag:
+                state["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            body = json.dumps({"version": state["version"]}).encode()
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{httpd.server_address[1]}/api/users"
+    yield state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_not_modified_served_from_cache(etag_server, tmp_path, backend):
+    """Unchanged resources come back as 304 and are served from the cache."""
+    cache = MemoryCache() if backend == "memory" else SQLiteCache(tmp_path / "cache.db")
+    with HTTPClient("pat", cache=cache) as client:
+        assert client.get(etag_server["url"]) == {"version": 1}
+        assert client.get(etag_server["url"]) == {"version": 1}
+        assert etag_server["not_modified"] == 1
+        
+        etag_server["version"] = 2
+        assert client.get(etag_server["url"]) == {"version": 2}
+    assert etag_server["hits"] == 3
+
+
+def test_not_modified_without_cached_entry(etag_server):
+    """A 304 with nothing cached to reuse is an error, not an empty response."""
+    etag_server["stale"] = True
+    with HTTPClient("pat", cache=MemoryCache()) as client:
+        with pytest.raises(APIError) as excinfo:
+            client.get(etag_server["url"])
+        assert excinfo.value.status_code == 304
+        assert client.get(etag_server["url"], raise_on_error=False).status_code == 304
+
+
+def test_sqlite_cache_evicts_oldest(tmp_path):
+    """Writes below maxsize keep everything; past it the oldest entries go."""
+    cache = SQLiteCache(tmp_path / "cache.db", maxsize=2)
+    cache.set("a", CachedResponse(b"1", stored_at=1.0))
+    cache.set("b", CachedResponse(b"2", stored_at=2.0))
+    assert cache.get("a").body == b"1"
+    cache.set("c", CachedResponse(b"3", stored_at=3.0))
+    assert cache.get("a") is None
+    assert [cache.get(key).body for key in ("b", "c")] == [b"2", b"3"]
+    cache.close()
+
+
+def test_memory_cache_lru_eviction():
+    """The least recently used entry is evicted first."""
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", CachedResponse(b"1"))
+    cache.set("b", CachedResponse(b"2"))
+    cache.get("a")
+    cache.set("c", CachedResponse(b"3"))
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"1"
+    assert len(cache) == 2
+
+
+def test_model_cache_hits_and_invalidation():
+    """get_one hits memory until an update touches the id."""
+    blog = FakeBlog(1)
+    posts = PostAPI(blog, ModelCache())
+    for _ in range(5):
+        assert posts.get_one(1).title == "title 1"
+    assert blog.reads == 1
+    
+    posts.update(1, title="new", body="b", publish=True)
+    assert posts.get_one(1).title == "new"
+    assert blog.reads == 2
+
+
+def test_model_cache_returns_copies_and_expires():
+    """Cached values are copies, and entries expire after their TTL."""
+    cache = ModelCache(ttls={"post": 0.05})
+    post = PostAPI(FakeBlog(7)).get_one(7)
+    cache.set("post", 7, post)
+    cache.get("post", 7).title = "changed"
+    assert cache.get("post", 7).title == post.title
+    time.sleep(0.06)
+    assert cache.get("post", 7) is None
@@ -0,0 +1,122 @@
+"""Offline tests for the command-line tool and its daemon."""
+
+import json
+import socket
+import threading
+
+import pytest
+
+from pycnblogs import cli, daemon
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Isolated ~/.cnbrc and daemon socket."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("PYCNBLOGS_SOCKET", str(tmp_path / "d.sock"))
+    return tmp_path
+
+
+def run(server, capsys, *argv):
+    base = ["--blog-backend", server.client_options["blog_backend"], "--openapi", server.client_options["openapi"]]
+    code = cli.main(base + list(argv))
+    captured = capsys.readouterr()
+    return code, captured.out, captured.err
+
+
+def test_post_and_ing_commands(server, home, capsys):
+    """Commands run in-process when no daemon is running."""
+    assert cli.main(["login", "test-pat"]) == 0
+    assert (home / ".cnbrc").read_text() == "test-pat"
+    capsys.readouterr()
+    
+    code, out, _ = run(server, capsys, "post", "list", "--take", "3")
+    assert code == 0 and out.splitlines()[-1] == "共 30 篇"
+    (home / "body.md").write_text("# 正文", encoding="utf-8")
+    code, out, _ = run(server, capsys, "post", "create", "--title", "新文章", "--file", str(home / "body.md"))
+    post_id = int(out)
+    code, out, _ = run(server, capsys, "--json", "post", "show", str(post_id))
+    assert json.loads(out)["body"] == "# 正文"
+    code, _, err = run(server, capsys, "post", "update", str(post_id))
+    assert code == 1 and "Nothing to update" in err
+    assert run(server, capsys, "ing", "publish", "hello")[0] == 0
+    code, out, _ = run(server, capsys, "--json", "news", "--take", "2")
+    assert len(json.loads(out)) == 2
+    assert server.stats()["requests"]["POST /openapi/statuses"] == 1
+
+
+def start_daemon(server):
+    instance = daemon.Daemon(pat="test-pat", **server.client_options)
+    thread = threading.Thread(target=instance.serve_forever)
+    thread.start()
+    for _ in range(100):
+        if daemon.ping():
+            break
+        threading.Event().wait(0.02)
+    return instance, thread
+
+
+def test_commands_go_through_the_daemon(server, home, capsys):
+    """A running daemon executes commands with its own warm client."""
+    instance, thread = start_daemon(server)
+    try:
+        first = run(server, capsys, "post", "list")
+        assert first[0] == 0 and run(server, capsys, "post", "list") == first
+        assert instance.served == 2
+        # Other base URLs are not served by this daemon: run in-process instead
+        assert cli.main(["--blog-backend", "http://127.0.0.1:9/blog", "--no-daemon", "daemon", "status"]) == 0
+    finally:
+        assert daemon.stop()
+        thread.join(5)
+    assert not thread.is_alive() and daemon.ping() is None
+    assert not (home / "d.sock").exists()
+
+
+def test_failing_daemon_command_is_not_rerun(server, home, capsys, monkeypatch):
+    """An unexpected error in the daemon is reported, not retried in-process."""
+    calls = []
+    
+    def broken(client, args, out):
+        calls.append(args.command)
+        raise RuntimeError("boom")
+    
+    monkeypatch.setitem(cli.COMMANDS, "post list", broken)
+    instance, thread = start_daemon(server)
+    try:
+        code, _, err = run(server, capsys, "post", "list")
+        assert code == 1 and "RuntimeError: boom" in err
+        assert calls == ["post list"]
+        # The daemon keeps serving after the error
+        assert run(server, capsys, "news", "--take", "1")[0] == 0
+    finally:
+        assert daemon.stop()
+        thread.join(5)
+
+
+def test_missing_reply_is_not_rerun(server, home, capsys, monkeypatch):
+    """A daemon that takes the request and hangs up is an error, not a reason to run locally."""
+    calls = []
+    monkeypatch.setitem(cli.COMMANDS, "post list", lambda client, args, out: calls.append(args.command))
+    (home / ".cnbrc").write_text("test-pat")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(home / "d.sock"))
+    listener.listen(1)
+    
+    def hang_up():
+        connection, _ = listener.accept()
+        connection.makefile("rb").readline()
+        connection.close()
+    
+    thread = threading.Thread(target=hang_up)
+    thread.start()
+    try:
+        code, _, err = run(server, capsys, "post", "list")
+    finally:
+        thread.join(5)
+        listener.close()
+    assert code == 1 and "without replying" in err
+    assert calls == []
+    
+    # A stale socket file (nothing listening) still falls back to running locally
+    code, _, _ = run(server, capsys, "post", "list")
+    assert code == 0 and calls == ["post list"]
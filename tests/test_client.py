@@ -0,0 +1,46 @@
+"""Offline tests entering the sync client over a fake transport."""
+
+from pycnblogs import CnblogsClient
+from pycnblogs.cache import ModelCache
+
+from .helpers import FakeBlog
+
+
+def test_enter_client_with_model_cache():
+    """The sync client can be entered with a model cache and serves every API."""
+    blog = FakeBlog(ings=1)
+    with CnblogsClient(pat="test", model_cache=ModelCache()) as client:
+        client._http_client.session.mount("https://", blog.adapter())
+        assert client.user.get_info().blog_app == "test"
+        assert client.user.get_info().display_name == "Test"
+        assert [news.id for news in client.news.get_list(take=1)] == [1]
+        assert [ing.content for ing in client.ing.get_list(take=1)] == ["ing 1"]
+    assert blog.requests.count(("GET", "/api/users")) == 1
+
+
+def test_user_cache_is_keyed_by_pat():
+    """Clients of different users sharing a model cache each get their own user."""
+    blog = FakeBlog()
+    cache = ModelCache()
+    for pat in ("alice", "bob", "alice"):
+        with CnblogsClient(pat=pat, model_cache=cache) as client:
+            client._http_client.session.mount("https://", blog.adapter())
+            assert client.user.get_info().blog_app == pat
+    assert blog.requests.count(("GET", "/api/users")) == 2
+
+
+def test_post_cache_is_keyed_by_pat():
+    """Clients of different users sharing a model cache never get each other's posts."""
+    cache = ModelCache()
+    blogs = {"alice": FakeBlog(3), "bob": FakeBlog(3)}
+    blogs["bob"].posts[1]["title"] = "bob's post"
+    for pat in ("alice", "bob", "alice"):
+        with CnblogsClient(pat=pat, model_cache=cache) as client:
+            client._http_client.session.mount("https://", blogs[pat].adapter())
+            title = blogs[pat].posts[1]["title"]
+            assert client.post.get_one(1).title == title
+            posts, _ = client.post.get_list(0, 3)
+            assert posts[0].title == title
+    # The second alice client is served from the cache
+    assert [len(blog.list_calls) for blog in blogs.values()] == [1, 1]
+    assert [blog.reads for blog in blogs.values()] == [1, 1]
@@ -0,0 +1,168 @@
+"""Offline tests for the bounded-parallelism helpers and PostAPI.get_many."""
+
+import asyncio
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pycnblogs import CnblogsClient, concurrency
+from pycnblogs.concurrency import amap_bounded, map_bounded, to_result
+from pycnblogs.exceptions import APIError, AuthenticationError
+from pycnblogs.result import Err
+
+
+class InFlight:
+    """Fake fetch that sleeps ``delays[item]`` seconds and records how many calls overlap."""
+    
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+    
+    def _enter(self, item):
+        with self._lock:
+            self.calls.append(item)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+    
+    def __call__(self, item):
+        self._enter(item)
+        try:
+            time.sleep(self.delays.get(item, 0.01))
+        finally:
+            with self._lock:
+                self.active -= 1
+        if item in self.fail:
+            raise APIError("Not Found", status_code=404)
+        return item * 10
+    
+    async def fetch(self, item):
+        self._enter(item)
+        try:
+            await asyncio.sleep(self.delays.get(item, 0.01))
+        finally:
+            self.active -= 1
+        if item in self.fail:
+            raise APIError("Not Found", status_code=404)
+        return item * 10
+
+
+def test_to_result_wraps_values_and_errors():
+    """Values become Ok, Results pass through and exceptions become Err."""
+    assert to_result(lambda x: x + 1, 1).unwrap() == 2
+    err = Err("bad", status_code=400)
+    assert to_result(lambda x: err, 1) is err
+    
+    def raises(error):
+        raise error
+    
+    assert to_result(raises, APIError("gone", status_code=404)).status_code == 404
+    assert to_result(raises, AuthenticationError("no")).status_code == 401
+    failed = to_result(raises, ValueError("broken"))
+    assert isinstance(failed, Err) and failed.status_code is None and "ValueError: broken" in failed.error
+
+
+def test_map_bounded_keeps_input_order():
+    """ordered=True yields in input order even when later items finish first."""
+    fetch = InFlight(delays={1: 0.08, 2: 0.04, 3: 0.0})
+    results = list(map_bounded(fetch, [1, 2, 3], concurrency=3))
+    assert [(item, result.unwrap()) for item, result in results] == [(1, 10), (2, 20), (3, 30)]
+
+
+def test_map_bounded_unordered_yields_in_completion_order():
+    """ordered=False yields each result as soon as it completes."""
+    fetch = InFlight(delays={1: 0.15, 2: 0.08, 3: 0.0})
+    assert [item for item, _ in map_bounded(fetch, [1, 2, 3], concurrency=3, ordered=False)] == [3, 2, 1]
+
+
+def test_map_bounded_isolates_failures():
+    """A failing item becomes an Err and the others still complete."""
+    fetch = InFlight(fail={2})
+    results = dict(map_bounded(fetch, [1, 2, 3, 4], concurrency=2))
+    assert results[2].status_code == 404
+    assert {item: result.unwrap() for item, result in results.items() if item != 2} == {1: 10, 3: 30, 4: 40}
+    assert sorted(fetch.calls) == [1, 2, 3, 4]
+
+
+def test_map_bounded_limits_calls_in_flight():
+    """No more than ``concurrency`` calls run at once, in either mode."""
+    for ordered in (True, False):
+        fetch = InFlight()
+        assert len(list(map_bounded(fetch, range(20), concurrency=4, ordered=ordered))) == 20
+        assert fetch.peak == 4
+
+
+class Abort(BaseException):
+    """Escapes to_result like KeyboardInterrupt would."""
+
+
+def test_map_bounded_stops_when_consumer_raises(monkeypatch):
+    """An exception in the consumer stops submitting items and cancels queued calls."""
+    for ordered in (True, False):
+        # One shared worker, so submitted calls queue up behind the running one
+        worker = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(concurrency, "submit_in_context", lambda executor, fn, *args: worker.submit(fn, *args))
+        fetch = InFlight()
+        with pytest.raises(RuntimeError):
+            for _ in map_bounded(fetch, itertools.count(), concurrency=4, ordered=ordered):
+                raise RuntimeError("consumer failed")
+        worker.shutdown(wait=True)
+        # The finished call and at most the one running when the consumer failed
+        assert len(fetch.calls) <= 2
+
+
+def test_map_bounded_stops_when_call_escapes():
+    """A BaseException from a call propagates and nothing further is started."""
+    def fetch(item):
+        if item == 2:
+            raise Abort()
+        time.sleep(0.01)
+        return item
+    
+    started = []
+    with pytest.raises(Abort):
+        list(map_bounded(lambda item: (started.append(item), fetch(item))[1], itertools.count(), concurrency=2))
+    assert max(started) <= 3
+
+
+def test_amap_bounded():
+    """The async variant keeps order, isolates failures and bounds concurrency."""
+    async def collect(fetch, items, **options):
+        return [(item, result) async for item, result in amap_bounded(fetch.fetch, items, **options)]
+    
+    fetch = InFlight(delays={1: 0.08, 2: 0.04, 3: 0.0}, fail={2})
+    ordered = asyncio.run(collect(fetch, [1, 2, 3], concurrency=3))
+    assert [item for item, _ in ordered] == [1, 2, 3]
+    assert ordered[0][1].unwrap() == 10 and ordered[1][1].status_code == 404
+    
+    fetch = InFlight(delays={1: 0.15, 2: 0.08, 3: 0.0})
+    unordered = asyncio.run(collect(fetch, [1, 2, 3], concurrency=3, ordered=False))
+    assert [item for item, _ in unordered] == [3, 2, 1]
+    
+    fetch = InFlight()
+    assert len(asyncio.run(collect(fetch, range(20), concurrency=4))) == 20
+    assert fetch.peak == 4
+
+
+def test_get_many(server, monkeypatch):
+    """get_many fetches every id, reports missing posts as Err and bounds the requests in flight."""
+    with CnblogsClient(pat="test", **server.client_options) as client:
+        results = list(client.post.get_many([3, 1, 999, 2]))
+        assert [post_id for post_id, _ in results] == [3, 1, 999, 2]
+        assert [result.unwrap().id for post_id, result in results if post_id != 999] == [3, 1, 2]
+        assert results[2][1].status_code == 404
+        
+        unordered = dict(client.post.get_many(range(1, 11), ordered=False))
+        assert sorted(unordered) == list(range(1, 11)) and all(r.is_ok() for r in unordered.values())
+        
+        fetch = InFlight()
+        get_one = client.post.get_one
+        monkeypatch.setattr(client.post, "get_one", lambda post_id: (fetch(post_id), get_one(post_id))[1])
+        assert len(list(client.post.get_many(range(1, 21), concurrency=3))) == 20
+        assert fetch.peak == 3
@@ -0,0 +1,61 @@
+"""Offline tests for schema-driven decoding."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pycnblogs.decoding import _select_backend, loads, parse_datetime
+from pycnblogs.models import (
+    UNLOADED, IngRecord, parse_ing, parse_ing_record, parse_post, parse_post_record, parse_user,
+)
+
+POST = {
+    "id": 7, "title": "t", "url": "//x/p/7", "datePublished": "2024-03-01T10:20:30.5",
+    "dateUpdated": "2024-03-02T00:00:00+08:00", "isDraft": False, "isPinned": True,
+    "isPublished": True, "postBody": "body", "tags": ["a"],
+}
+ING = {"Id": 1, "Content": "c", "UserAlias": "u", "UserDisplayName": "U", "DateAdded": "2024-01-01T08:00:00", "CommentCount": 2}
+
+
+def test_post_mapping_and_listing_constants():
+    """camelCase keys map to fields; listed posts get an unloaded body."""
+    post = parse_post(POST)
+    assert (post.id, post.is_pinned, post.body, post.tags, post.comment_count) == (7, True, "body", ["a"], None)
+    listed = parse_post(POST, with_body=False)
+    assert not listed.is_body_loaded and listed.tags is None and listed.__dict__["_body"] is UNLOADED
+    assert parse_post_record(POST).modify_time == POST["dateUpdated"]
+
+
+def test_openapi_mapping_with_defaults_and_renames():
+    """PascalCase keys map to fields; optional keys fall back to defaults."""
+    assert parse_ing(ING).lucky_count == 0
+    assert parse_ing_record(ING) == IngRecord(1, "c", "u", "U", "2024-01-01T08:00:00", 2, 0)
+    user = parse_user({
+        "UserId": "x", "SpaceUserID": 1, "BlogId": 2, "DisplayName": "d", "Face": "", "Avatar": "",
+        "Seniority": "1年", "BlogApp": "app", "FollowingCount": 3, "FollowerCount": 4, "IsVip": False,
+        "Joined": "2020-01-01T00:00:00",
+    })
+    assert (user.space_user_id, user.followers_count) == (1, 4)
+    with pytest.raises(KeyError):
+        parse_ing({"Id": 1})
+
+
+def test_timestamps_parse_lazily():
+    """Raw strings are kept; datetimes are parsed on access."""
+    post = parse_post(POST)
+    assert post.create_time == "2024-03-01T10:20:30.5"
+    assert post.created_at == datetime(2024, 3, 1, 10, 20, 30, 500000)
+    assert post.modified_at.utcoffset() == timedelta(hours=8)
+    assert parse_ing_record(ING).created_at == datetime(2024, 1, 1, 8)
+    assert parse_datetime("2024-01-01T00:00:00Z") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert parse_datetime("") is None and parse_datetime("not a date") is None
+
+
+def test_json_backends_agree():
+    """Every available backend decodes the same document."""
+    document = b'{"a": [1, 2.5, "\\u95ea\\u5b58", null, true]}'
+    expected = {"a": [1, 2.5, "闪存", None, True]}
+    assert loads(document) == expected
+    assert _select_backend("json")[1](document) == expected
+    with pytest.raises(ValueError):
+        _select_backend("simdjson")
@@ -0,0 +1,50 @@
+"""Tests for lazy package attributes and deferred transport imports."""
+
+import ast
+import subprocess
+import sys
+
+import pytest
+
+import pycnblogs
+from benchmarks.import_time import BUDGETED, HEAVY_MODULES, probe
+
+
+def test_lazy_attributes_resolve():
+    """Every exported name resolves on access and is listed by dir()."""
+    for name in pycnblogs.__all__:
+        assert getattr(pycnblogs, name) is not None
+        assert name in dir(pycnblogs)
+    from pycnblogs.client import CnblogsClient
+    assert pycnblogs.CnblogsClient is CnblogsClient
+    with pytest.raises(AttributeError):
+        pycnblogs.NoSuchThing
+
+
+def test_client_without_requests_does_not_load_transport():
+    """Creating a client and saving a PAT import neither requests nor httpx."""
+    _, modules = probe("import pycnblogs; pycnblogs.CnblogsClient(pat='x'); pycnblogs.AsyncCnblogsClient(pat='x')")
+    assert modules == []
+    _, modules = probe("import pycnblogs; pycnblogs.CnblogsClient(pat='x').__enter__()")
+    assert "requests" in modules and set(modules) <= set(HEAVY_MODULES)
+
+
+def test_star_import():
+    """``from pycnblogs import *`` still binds every exported name."""
+    namespace = {}
+    exec("from pycnblogs import *", namespace)
+    assert set(pycnblogs.__all__) <= set(namespace)
+
+
+def test_client_module_does_not_load_helpers():
+    """Reaching CnblogsClient loads neither the models nor the cache, paging or bulk helpers."""
+    _, modules = probe(BUDGETED)
+    assert modules == []
+    script = "import pycnblogs, sys; pycnblogs.CnblogsClient.login; print(sorted(m for m in sys.modules if m.startswith('pycnblogs.')))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    loaded = set(ast.literal_eval(output))
+    assert loaded.isdisjoint({
+        "pycnblogs.models", "pycnblogs.decoding", "pycnblogs.cache", "pycnblogs.concurrency", "pycnblogs.paging",
+        "pycnblogs.bulk", "pycnblogs.lazy", "pycnblogs.poller", "pycnblogs.publisher", "pycnblogs.metrics",
+    })
+
@@ -0,0 +1,66 @@
+"""Offline tests for deferred post bodies."""
+
+import copy
+import pickle
+
+import pytest
+
+from pycnblogs.cache import ModelCache
+from pycnblogs.client import PostAPI
+from pycnblogs.exceptions import APIError
+
+from .helpers import FakeBlog
+
+
+def test_list_entries_load_bodies_in_batches():
+    """Bodies are fetched on first access, a batch of the listing at a time."""
+    blog = FakeBlog(count=40)
+    posts, _ = PostAPI(blog).get_list(0, 40)
+    assert blog.reads == 0
+    assert not posts[0].is_body_loaded
+    assert "not loaded" in repr(posts[0])
+    
+    assert posts[0].body == "body 1"
+    assert blog.reads == 16
+    assert posts[15].is_body_loaded and not posts[16].is_body_loaded
+    
+    assert [post.body for post in posts] == [f"body {i}" for i in range(1, 41)]
+    assert blog.reads == 40
+
+
+def test_unloaded_without_loader():
+    """With lazy loading off, unloaded bodies read as None and can be loaded explicitly."""
+    blog = FakeBlog(count=5)
+    api = PostAPI(blog, lazy_body=False)
+    posts, _ = api.get_list(0, 5)
+    assert posts[0].body is None and not posts[0].is_body_loaded
+    assert blog.reads == 0
+    
+    assert api.load_bodies(posts[:2]) == {}
+    assert posts[1].body == "body 2" and posts[2].body is None
+    
+    copy = pickle.loads(pickle.dumps(posts[3]))
+    assert copy == posts[3] and not copy.is_body_loaded
+
+
+def test_load_failure_raises():
+    """A body that cannot be fetched raises on access and stays unloaded."""
+    blog = FakeBlog(count=3)
+    posts, _ = PostAPI(blog).get_list(0, 3)
+    del blog.posts[1]
+    with pytest.raises(APIError):
+        posts[0].body
+    assert not posts[0].is_body_loaded
+    assert posts[1].body == "body 2"
+
+
+def test_cached_list_entries_load_bodies():
+    """Listed posts served (as copies) from the model cache still load their bodies."""
+    blog = FakeBlog(count=3)
+    api = PostAPI(blog, ModelCache())
+    api.get_list(0, 3)
+    cached, _ = api.get_list(0, 3)
+    assert len(blog.list_calls) == 1
+    assert not cached[0].is_body_loaded
+    assert cached[0].body == "body 1"
+    assert copy.copy(cached[1]).body == "body 2"
@@ -0,0 +1,69 @@
+"""Offline tests for request hooks and metrics."""
+
+import requests
+import pytest
+
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.metrics import Metrics, RequestHooks, endpoint_template
+from pycnblogs.retry import RetryPolicy
+
+from .helpers import FAST, ScriptedServer
+
+
+@pytest.fixture
+def server():
+    server = ScriptedServer([503, 200])
+    yield server
+    server.close()
+
+
+def test_endpoint_template():
+    """Resource ids collapse into placeholders; the query string is dropped."""
+    assert endpoint_template("https://i.cnblogs.com/api/posts/123?x=1") == "i.cnblogs.com/api/posts/{id}"
+    assert endpoint_template("https://api.cnblogs.com/api/statuses/42/comments") == "api.cnblogs.com/api/statuses/{id}/comments"
+
+
+def test_hooks_see_every_attempt(server):
+    """Hooks fire per attempt, retries included."""
+    events = []
+    hooks = RequestHooks()
+    hooks.add("before_request", lambda info: events.append(("before", info.attempt)))
+    hooks.add("after_response", lambda info: events.append(("after", info.status_code)))
+    with HTTPClient("pat", retry=FAST, hooks=hooks) as client:
+        client.get(server.url)
+    assert events == [("before", 1), ("after", 503), ("before", 2), ("after", 200)]
+    with pytest.raises(ValueError):
+        hooks.add("on_success", print)
+
+
+def test_metrics_counters_and_export(server):
+    """Metrics count responses, retries and errors and export them."""
+    metrics = Metrics()
+    with HTTPClient("pat", retry=FAST, hooks=metrics) as client:
+        client.get(server.url + "/7")
+    with HTTPClient("pat", retry=RetryPolicy(max_attempts=1), hooks=metrics) as client:
+        with pytest.raises(requests.ConnectionError):
+            client.get("http://127.0.0.1:9/api")
+    
+    endpoint = server.url.split("//", 1)[1] + "/{id}"
+    stats = metrics.to_dict()["endpoints"][f"GET {endpoint}"]
+    assert stats["requests"] == {"503": 1, "200": 1}
+    assert stats["retries"] == 1
+    assert stats["latency"]["count"] == 2
+    assert metrics.to_dict()["in_flight"] == 0
+    assert list(metrics.to_dict()["endpoints"]["GET 127.0.0.1:9/api"]["errors"]) == ["ConnectionError"]
+    
+    text = metrics.to_prometheus()
+    assert f'pycnblogs_requests_total{{method="GET",endpoint="{endpoint}",status="200"}} 1' in text
+    assert f'pycnblogs_request_duration_seconds_count{{method="GET",endpoint="{endpoint}"}} 2' in text
+    assert "# TYPE pycnblogs_request_duration_seconds histogram" in text
+
+
+def test_metrics_in_flight_after_other_errors():
+    """Exceptions other than connection errors still end the attempt."""
+    metrics = Metrics()
+    with HTTPClient("pat", retry=FAST, hooks=metrics) as client:
+        with pytest.raises(requests.exceptions.InvalidURL):
+            client.get("http:///api")
+    assert metrics.in_flight == 0
+    assert list(metrics.to_dict()["endpoints"]["GET /api"]["errors"]) == ["InvalidURL"]
@@ -0,0 +1,70 @@
+"""Offline tests for post list pagination."""
+
+from pycnblogs.client import PostAPI
+from pycnblogs.paging import plan_pages
+
+from .helpers import FakeBlog
+
+
+def test_plan_pages_single_page():
+    """A window that fits in one page needs one request."""
+    size, first, last = plan_pages(0, 10, 100)
+    assert (size, first, last) == (10, 1, 1)
+
+    size, first, last = plan_pages(99, 2, 100)
+    assert first == last
+    assert (first - 1) * size <= 99 and 100 < first * size
+
+
+def test_plan_pages_large_take():
+    """Windows larger than the page size limit span several pages."""
+    size, first, last = plan_pages(0, 250, 100)
+    assert (size, first, last) == (100, 1, 3)
+
+
+def test_get_list_request_count():
+    """Listing 200 posts costs a couple of requests, not 201."""
+    backend = FakeBlog(500)
+    posts, total = PostAPI(backend).get_list(skip=0, take=200)
+    assert total == 500
+    assert [p.id for p in posts] == list(range(1, 201))
+    assert len(backend.list_calls) == 2
+
+
+def test_get_list_window_slicing():
+    """Skip/take windows are sliced locally from the fetched pages."""
+    backend = FakeBlog(50)
+    posts, total = PostAPI(backend).get_list(skip=7, take=5)
+    assert [p.id for p in posts] == [8, 9, 10, 11, 12]
+    assert total == 50
+    assert len(backend.list_calls) == 1
+
+
+def test_get_list_past_end():
+    """Windows past the end stop after the first page."""
+    backend = FakeBlog(3)
+    posts, total = PostAPI(backend).get_list(skip=0, take=250)
+    assert [p.id for p in posts] == [1, 2, 3]
+    assert total == 3
+    assert len(backend.list_calls) == 1
+
+
+def test_iter_all_streams_pages():
+    """iter_all pages lazily and stops on the short last page."""
+    backend = FakeBlog(230)
+    ids = [p.id for p in PostAPI(backend).iter_all(page_size=100)]
+    assert ids == list(range(1, 231))
+    assert [c["p"] for c in backend.list_calls] == [1, 2, 3]
+
+
+def test_iter_all_limit():
+    """iter_all honours limit without fetching further pages."""
+    backend = FakeBlog(500)
+    ids = [p.id for p in PostAPI(backend).iter_all(limit=120, page_size=100)]
+    assert ids == list(range(1, 121))
+    assert len(backend.list_calls) == 2
+
+    backend = FakeBlog(500)
+    ids = [p.id for p in PostAPI(backend).iter_all(limit=5)]
+    assert ids == list(range(1, 6))
+    assert backend.list_calls == [{"t": 1, "p": 1, "s": 5}]
@@ -0,0 +1,124 @@
+"""Offline tests for the ing poller."""
+
+import asyncio
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+from pycnblogs.async_client import AsyncIngAPI
+from pycnblogs.client import IngAPI
+from pycnblogs.tracing import Tracer
+
+
+class FakeFeed:
+    """Stand-in for HTTPClient serving an ing feed, newest first."""
+    
+    def __init__(self, count: int = 0):
+        self.ids = []
+        self.pages = []
+        self.tracer = None
+        self.publish(count)
+    
+    def publish(self, count: int):
+        start = self.ids[0] + 1 if self.ids else 1
+        self.ids[:0] = reversed(range(start, start + count))
+    
+    def get_items(self, url):
+        query = parse_qs(urlsplit(url).query)
+        page, size = int(query["pageIndex"][0]), int(query["pageSize"][0])
+        self.pages.append(page)
+        return [
+            {"Id": i, "Content": f"ing {i}", "UserAlias": "u", "UserDisplayName": "U",
+             "DateAdded": "2024-01-01T00:00:00", "CommentCount": 0}
+            for i in self.ids[(page - 1) * size:page * size]
+        ]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_poll_fetches_until_a_known_id():
+    """Only unseen ings are returned, reading no further than needed."""
+    feed = FakeFeed(50)
+    poller = IngAPI(feed).poller(page_size=10, backfill=3)
+    assert [ing.id for ing in poller.poll()] == [48, 49, 50]
+    assert poller.since_id == 50 and feed.pages == [1]
+    
+    feed.pages.clear()
+    assert poller.poll() == [] and feed.pages == [1]
+    feed.publish(25)
+    assert [ing.id for ing in poller.poll()] == list(range(51, 76))
+    assert feed.pages == [1, 1, 2, 3]
+    
+    feed.publish(100)
+    assert len(poller.poll()) == 50 and poller.overflows == 1
+    assert poller.since_id == 175
+
+
+def test_poll_span_wraps_page_requests():
+    """With the client's tracer each poll is a span whose children are the page reads."""
+    feed = FakeFeed(30)
+    feed.tracer = Tracer()
+    poller = IngAPI(feed).poller(page_size=10, since_id=5)
+    assert not hasattr(poller, "client") and poller.tracer is feed.tracer
+    poller.poll()
+    poll = next(span for span in feed.tracer.spans if span.name == "ing.poll")
+    assert [span.name for span in feed.tracer.children(poll)] == ["ing.get_page"] * 3
+
+
+def test_interval_follows_the_post_rate():
+    """Busy feeds are polled more often, quiet ones back off to max_interval."""
+    feed = FakeFeed(10)
+    clock = Clock()
+    poller = IngAPI(feed).poller(page_size=20, min_interval=1, max_interval=60, clock=clock)
+    poller.poll()
+    clock.now += 10
+    feed.publish(20)
+    poller.poll()
+    # 2 ings/s, target 10 per poll
+    assert poller.interval == 5
+    for _ in range(10):
+        clock.now += poller.interval
+        poller.poll()
+    assert poller.interval == 60
+
+
+def test_callback_and_async_generator():
+    """run() delivers each new ing once; the async poller yields the same."""
+    feed = FakeFeed(5)
+    stop = threading.Event()
+    received = []
+    
+    def callback(ing):
+        received.append(ing.id)
+        if ing.id == 4:
+            feed.publish(2)
+        if ing.id == 7:
+            stop.set()
+    
+    poller = IngAPI(feed).poller(since_id=3, min_interval=0.01)
+    poller.run(callback, stop)
+    assert received == [4, 5, 6, 7] and feed.pages == [1, 1]
+    
+    class AsyncFeed(FakeFeed):
+        async def get_items(self, url):
+            for item in FakeFeed.get_items(self, url):
+                yield item
+    
+    async def collect():
+        poller = AsyncIngAPI(AsyncFeed(5)).poller(since_id=2)
+        return [ing.id async for ing in _take(poller.watch(), 3)]
+    
+    assert asyncio.run(collect()) == [3, 4, 5]
+
+
+async def _take(iterator, count):
+    async for item in iterator:
+        yield item
+        count -= 1
+        if not count:
+            return
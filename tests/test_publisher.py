@@ -0,0 +1,98 @@
+"""Offline tests for the ing publish queue."""
+
+import threading
+
+from pycnblogs.client import IngAPI
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.result import Err
+from pycnblogs.retry import RetryPolicy
+
+from .helpers import FAST
+
+
+class FakeStatuses:
+    """Stand-in for HTTPClient answering ``POST /statuses`` from a script."""
+    
+    def __init__(self, script=None):
+        self.script = dict(script or {})
+        self.sent = []
+        self.tracer = None
+        self._lock = threading.Lock()
+    
+    def post(self, url, payload, raise_on_error=False):
+        with self._lock:
+            self.sent.append(payload["content"])
+            responses = self.script.get(payload["content"])
+            return responses.pop(0) if responses else {}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_duplicates_are_coalesced_locally():
+    """Repeated content is sent once per dedupe window."""
+    backend = FakeStatuses()
+    clock = Clock()
+    queue = IngAPI(backend).publish_queue(dedupe_window=60, clock=clock)
+    report = queue.publish_many(["a", "b", "a", (" b ", True)])
+    assert sorted(backend.sent) == ["a", "b"]
+    assert [item.status for item in report.items] == ["published", "published", "duplicate", "duplicate"]
+    assert report.to_dict()["duplicates"] == 2
+    
+    queue.put("a")
+    assert queue.flush().duplicates and len(backend.sent) == 2
+    clock.now = 61
+    assert not queue.is_recent("a")
+    assert queue.publish_many(["a"]).published and backend.sent[-1] == "a"
+
+
+def test_server_duplicates_and_retries():
+    """Server duplicates are not failures; 5xx is retried, other errors are not."""
+    backend = FakeStatuses({
+        "dup": [Err('{"Message": "相同闪存已发布"}', status_code=400)],
+        "flaky": [Err("Service Unavailable", status_code=503), Err("Bad Gateway", status_code=502)],
+        "bad": [Err("Bad Request", status_code=400)],
+        "offline": [Err("ReadTimeout: timed out")],
+    })
+    delays = []
+    queue = IngAPI(backend).publish_queue(retry=RetryPolicy(max_attempts=3, jitter=0), sleep=delays.append)
+    dup, flaky, bad, offline = queue.publish_many(["dup", "flaky", "bad", "offline"]).items
+    assert (dup.status, dup.attempts) == ("duplicate", 1)
+    assert (flaky.status, flaky.attempts) == ("published", 3) and delays == [0.5, 1.0]
+    assert (bad.status, bad.attempts, bad.result.status_code) == ("failed", 1, 400)
+    # The request may have reached the server, so it is not sent again
+    assert (offline.status, offline.attempts) == ("failed", 1)
+    # Failed content is not remembered, so it can be queued again
+    assert not queue.is_recent("bad") and queue.is_recent("flaky")
+
+
+def test_duplicate_after_server_error_counts_as_published():
+    """A retry rejected as a duplicate means the failed attempt stored the ing."""
+    backend = FakeStatuses({"x": [Err("Bad Gateway", status_code=502), Err("相同闪存已发布", status_code=400)]})
+    queue = IngAPI(backend).publish_queue(retry=FAST, sleep=lambda _: None)
+    item, = queue.publish_many(["x"]).items
+    assert (item.status, item.attempts) == ("published", 2)
+    assert backend.sent == ["x", "x"]
+
+
+def test_rate_limits_are_retried_by_the_client_only(serve):
+    """429 is left to the HTTP client's retries, so the queue does not multiply them."""
+    server = serve(429)
+    with HTTPClient("pat", retry=FAST) as client:
+        queue = IngAPI(client, base_url=server.url).publish_queue(retry=FAST, sleep=lambda _: None)
+        item, = queue.publish_many(["x"]).items
+    assert (item.status, item.attempts, item.result.status_code) == ("failed", 1, 429)
+    assert server.hits == FAST.max_attempts
+    
+    # The client does not resend a POST after a 5xx; the queue does
+    server = serve(503, 200)
+    with HTTPClient("pat", retry=FAST) as client:
+        queue = IngAPI(client, base_url=server.url).publish_queue(retry=FAST, sleep=lambda _: None)
+        item, = queue.publish_many(["x"]).items
+    assert (item.status, item.attempts) == ("published", 2)
+    assert server.hits == 2
@@ -0,0 +1,36 @@
+"""Offline tests for the client-side rate limiter."""
+
+import threading
+import time
+
+from pycnblogs.constants import BLOG_BACKEND, OPENAPI
+from pycnblogs.ratelimit import RateLimiter, TokenBucket
+
+
+def test_bucket_burst_then_wait():
+    """A full bucket serves a burst, then callers wait for refills."""
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+
+def test_bucket_shared_across_threads():
+    """Concurrent callers are queued to the configured rate."""
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.18
+
+
+def test_limiter_routes_by_family():
+    """Each endpoint family draws from its own bucket."""
+    limiter = RateLimiter.per_family(blog_backend=5, openapi=10)
+    assert limiter.bucket_for(f"{BLOG_BACKEND}/posts/1") is limiter.buckets[BLOG_BACKEND]
+    assert limiter.bucket_for(f"{OPENAPI}/statuses") is limiter.buckets[OPENAPI]
+    assert limiter.bucket_for("https://example.com/") is None
+    assert limiter.reserve("https://example.com/") == 0.0
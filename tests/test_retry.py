@@ -0,0 +1,60 @@
+"""Offline tests for the HTTPClient retry policy."""
+
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.result import Err
+from pycnblogs.retry import RetryPolicy, parse_retry_after
+
+from .helpers import FAST
+
+
+def test_get_retries_server_errors(serve):
+    """Idempotent requests are retried until they succeed."""
+    server = serve(503, 502, 200)
+    with HTTPClient("pat", retry=FAST) as client:
+        assert client.get(server.url) == {"status": 200}
+        assert client.retry_stats.retries == 2
+    assert server.hits == 3
+
+
+def test_get_gives_up_after_max_attempts(serve):
+    """The last failing response is returned once attempts run out."""
+    server = serve(500)
+    with HTTPClient("pat", retry=FAST) as client:
+        result = client.get(server.url, raise_on_error=False)
+        assert isinstance(result, Err) and result.status_code == 500
+        assert client.retry_stats.exhausted == 1
+    assert server.hits == 3
+
+
+def test_post_not_retried_on_server_error(serve):
+    """POST is not resent blindly after a 5xx."""
+    server = serve(503, 200)
+    with HTTPClient("pat", retry=FAST) as client:
+        result = client.post(server.url, {"title": "x"})
+        assert isinstance(result, Err) and result.status_code == 503
+    assert server.hits == 1
+
+
+def test_post_retried_on_429(serve):
+    """429 means the request was not processed, so POST is retried."""
+    server = serve(429, 200)
+    with HTTPClient("pat", retry=FAST) as client:
+        assert client.post(server.url, {"title": "x"}) == {"status": 200}
+        assert client.retry_stats.to_dict()["by_reason"] == {"429": 1}
+
+
+def test_retry_disabled(serve):
+    """retry=None sends every request exactly once."""
+    server = serve(503, 200)
+    with HTTPClient("pat", retry=None) as client:
+        assert isinstance(client.get(server.url, raise_on_error=False), Err)
+    assert server.hits == 1
+
+
+def test_backoff():
+    """Backoff grows exponentially, and Retry-After takes precedence."""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=0)
+    assert [policy.get_backoff(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    assert policy.get_backoff(1, retry_after="7") == 7
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
@@ -0,0 +1,91 @@
+"""Offline tests for streaming JSON decoding and response size limits."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pycnblogs.exceptions import ResponseTooLargeError
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.streaming import iter_json_array
+
+PAGE = {
+    "postsCount": 3,
+    "postList": [
+        {
+            "id": i,
+            "title": f"标题 {i}",
+            "url": f"//www.cnblogs.com/u/p/{i}",
+            "datePublished": "2024-01-01T00:00:00",
+            "dateUpdated": "2024-01-01T00:00:00",
+            "isDraft": False,
+            "isPinned": False,
+            "isPublished": True,
+        }
+        for i in range(1, 4)
+    ],
+}
+
+
+@pytest.fixture
+def chunked_server():
+    """Server sending PAGE with chunked transfer encoding, 7 bytes per chunk."""
+    body = json.dumps(PAGE, ensure_ascii=False).encode()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(body), 7):
+                chunk = body[i:i + 7]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        
+        def log_message(self, *args):
+            pass
+    
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/posts/list"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_iter_json_array_across_chunk_boundaries():
+    """Elements and sibling members decode the same whatever the chunking."""
+    raw = json.dumps({"head": 1, "postList": PAGE["postList"], "postsCount": 3.5e1}).encode()
+    for size in (1, 2, 5, len(raw)):
+        extra = {}
+        chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+        assert list(iter_json_array(chunks, "postList", extra)) == PAGE["postList"]
+        assert extra == {"head": 1, "postsCount": 35.0}
+    assert list(iter_json_array([b"[1, 2", b"2, 3]"])) == [1, 22, 3]
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b"[1, 2"]))
+
+
+def test_streamed_post_list(chunked_server):
+    """stream_json decodes the post list incrementally with the same result."""
+    for stream_json in (False, True):
+        extra = {}
+        with HTTPClient("pat", stream_json=stream_json) as client:
+            items = list(client.get_items(chunked_server, key="postList", extra=extra))
+        assert items == PAGE["postList"]
+        assert extra == {"postsCount": 3}
+
+
+def test_max_response_size(chunked_server):
+    """Bodies over the limit raise, whether streamed or read whole."""
+    for stream_json in (False, True):
+        with HTTPClient("pat", max_response_size=64, stream_json=stream_json) as client:
+            with pytest.raises(ResponseTooLargeError):
+                list(client.get_items(chunked_server, key="postList"))
+            with pytest.raises(ResponseTooLargeError):
+                client.get(chunked_server)
+    with HTTPClient("pat", max_response_size=1 << 20, stream_json=True) as client:
+        assert client.get(chunked_server) == PAGE
@@ -0,0 +1,106 @@
+"""Offline tests for the post mirror and the Markdown pusher."""
+
+from pycnblogs.client import PostAPI
+from pycnblogs.sync import MarkdownPusher, MirrorStore, PostMirror
+
+from .helpers import FakeBlog
+
+
+def test_mirror_fetches_only_changed_posts():
+    """The second run downloads bodies only for modified and new posts."""
+    blog = FakeBlog(count=250)
+    store = MirrorStore(":memory:")
+    mirror = PostMirror(PostAPI(blog), store)
+    
+    report = mirror.run()
+    assert len(report.added) == 250 and blog.reads == 250
+    assert len(store) == 250
+    
+    blog.reads = 0
+    blog.posts[7].update(version=2, body="edited")
+    blog.posts[251] = {"version": 1, "body": "new"}
+    del blog.posts[3]
+    
+    report = mirror.run()
+    assert report.updated == [7]
+    assert report.added == [251]
+    assert report.removed == [3]
+    assert report.unchanged == 248
+    assert blog.reads == 2
+    assert store.get(7).body == "edited"
+    assert store.get(3) is None
+
+
+def test_push_uploads_only_changed_files(tmp_path):
+    """Unchanged files are skipped; updates send one request each and no reads."""
+    blog = FakeBlog(count=0)
+    (tmp_path / "a.md").write_text("# First\n\nhello", encoding="utf-8")
+    (tmp_path / "b.md").write_text("---\ntitle: Second\npublish: true\n---\nworld", encoding="utf-8")
+    pusher = MarkdownPusher(PostAPI(blog), tmp_path)
+    
+    report = pusher.push()
+    assert len(report.by_action("create")) == 2 and not report.bulk.failed
+    assert blog.posts[1]["body"] == "hello"
+    
+    blog.writes = blog.reads = 0
+    (tmp_path / "b.md").write_text("---\ntitle: Second\npublish: true\n---\nedited", encoding="utf-8")
+    pusher = MarkdownPusher(PostAPI(blog), tmp_path)
+    
+    dry = pusher.push(dry_run=True)
+    assert [c.post.name for c in dry.by_action("update")] == ["b.md"]
+    assert "+edited" in dry.by_action("update")[0].diff
+    assert blog.writes == 0
+    
+    report = pusher.push()
+    assert len(report.by_action("unchanged")) == 1
+    assert blog.writes == 1 and blog.reads == 0
+    assert blog.posts[2]["body"] == "edited"
+
+
+def test_push_detects_remote_edits(tmp_path):
+    """With check_remote, posts edited on the blog since the last push are not overwritten."""
+    blog = FakeBlog(count=0)
+    (tmp_path / "a.md").write_text("# First\n\nhello", encoding="utf-8")
+    MarkdownPusher(PostAPI(blog), tmp_path).push(check_remote=True)
+    
+    blog.posts[1].update(version=5, body="edited online")
+    (tmp_path / "a.md").write_text("# First\n\nlocal edit", encoding="utf-8")
+    report = MarkdownPusher(PostAPI(blog), tmp_path).push(check_remote=True)
+    assert len(report.by_action("conflict")) == 1
+    assert blog.posts[1]["body"] == "edited online"
+
+
+def test_push_keeps_conflicts_when_other_files_upload(tmp_path):
+    """A post edited on the blog stays in conflict after other files were pushed."""
+    blog = FakeBlog()
+    (tmp_path / "a.md").write_text("# A\n\nfirst a", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n\nfirst b", encoding="utf-8")
+    MarkdownPusher(PostAPI(blog), tmp_path).push(check_remote=True)
+    
+    blog.posts[1].update(version=5, body="edited on web")
+    (tmp_path / "a.md").write_text("# A\n\nlocal a", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n\nlocal b", encoding="utf-8")
+    pusher = MarkdownPusher(PostAPI(blog), tmp_path)
+    report = pusher.push(check_remote=True)
+    assert [c.post.name for c in report.by_action("conflict")] == ["a.md"]
+    assert [item.ok for item in report.bulk.items] == [True]
+    assert blog.posts[2]["body"] == "local b"
+    
+    assert [c.action for c in pusher.plan(check_remote=True)] == ["conflict", "unchanged"]
+    pusher.push(check_remote=True)
+    assert blog.posts[1]["body"] == "edited on web"
+
+
+def test_push_records_versions_without_check_remote(tmp_path):
+    """Posts pushed without check_remote still get a version to detect later edits against."""
+    blog = FakeBlog()
+    (tmp_path / "a.md").write_text("# A\n\nfirst a", encoding="utf-8")
+    pusher = MarkdownPusher(PostAPI(blog), tmp_path)
+    pusher.push()
+    assert pusher.manifest.get("a.md").modify_time == blog.payload(1)["dateUpdated"]
+    
+    blog.posts[1].update(version=5, body="edited on web")
+    (tmp_path / "a.md").write_text("# A\n\nlocal a", encoding="utf-8")
+    report = MarkdownPusher(PostAPI(blog), tmp_path).push(check_remote=True)
+    assert len(report.by_action("conflict")) == 1
+    assert blog.posts[1]["body"] == "edited on web"
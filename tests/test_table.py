@@ -0,0 +1,35 @@
+"""Offline tests for compact records and columnar tables."""
+
+from pycnblogs.client import IngAPI, PostAPI
+from pycnblogs.models import IngEntry, IngRecord, PostRecord
+from pycnblogs.table import IngTable, PostTable
+
+from .helpers import FakeBlog
+
+
+def test_iter_all_compact_records():
+    """compact=True yields records carrying the same values as the entries."""
+    posts = PostAPI(FakeBlog(120))
+    records = list(posts.iter_all(compact=True))
+    entries = list(posts.iter_all())
+    assert len(records) == 120 and isinstance(records[0], PostRecord)
+    assert [r.title for r in records] == [e.title for e in entries]
+    assert records[5].full_url == entries[5].full_url
+    
+    ings = list(IngAPI(FakeBlog(ings=70)).iter_all(compact=True))
+    assert len(ings) == 70 and isinstance(ings[0], IngRecord)
+
+
+def test_table_round_trip():
+    """Tables store columns and rebuild equal records, from records or entries."""
+    table = PostTable(PostAPI(FakeBlog(30)).iter_all(compact=True))
+    assert len(table) == 30
+    assert list(table.column("id")) == list(range(1, 31))
+    assert table[-1].id == 30 and table[0].is_published is True
+    assert list(table)[7] == table[7]
+    
+    entry = IngEntry(1, "hi", "alice", "Alice", "2024-01-01T00:00:00", 2, 0)
+    ings = IngTable([entry, IngRecord(*[2, "yo", "alice", "Alice", "2024-01-02T00:00:00", 0, 1])])
+    assert ings[0] == IngRecord(1, "hi", "alice", "Alice", "2024-01-01T00:00:00", 2, 0)
+    assert ings.column("user_alias")[0] is ings.column("user_alias")[1]
+    assert sum(ings.column("comment_count")) == 2
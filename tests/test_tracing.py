@@ -0,0 +1,86 @@
+"""Offline tests for tracing spans."""
+
+import pytest
+
+from pycnblogs.concurrency import map_bounded
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.tracing import Tracer, current_span, traced
+
+from .helpers import FAST, ScriptedServer
+
+
+class FakeAPI:
+    """Minimal API object: traced methods find the tracer on ``self.client``."""
+    
+    def __init__(self, client, url):
+        self.client = client
+        self.url = url
+    
+    @traced("fake.get")
+    def get(self):
+        return self.client.get(self.url)
+    
+    @traced("fake.get_many", iterates=True)
+    def get_many(self, count):
+        return map_bounded(lambda _: self.client.get(self.url), range(count), 2)
+
+
+@pytest.fixture
+def server():
+    server = ScriptedServer([503, 200])
+    yield server
+    server.close()
+
+
+def test_api_span_with_http_child(server):
+    """One span per call; its HTTP child carries status, bytes and retries."""
+    tracer = Tracer()
+    with HTTPClient("pat", retry=FAST, tracer=tracer) as client:
+        FakeAPI(client, server.url).get()
+    
+    http_span, api_span = tracer.spans
+    assert api_span.name == "fake.get" and api_span.parent is None
+    assert tracer.children(api_span) == [http_span]
+    assert http_span.name == "HTTP GET"
+    assert http_span.attributes["http.status_code"] == 200
+    assert http_span.attributes["http.retry_count"] == 1
+    assert http_span.attributes["http.response_content_length"] > 0
+    assert current_span() is None
+
+
+def test_iterator_span_covers_worker_threads(server):
+    """Requests made from pool threads are children of the iterator's span."""
+    tracer = Tracer()
+    with HTTPClient("pat", retry=FAST, tracer=tracer) as client:
+        results = list(FakeAPI(client, server.url).get_many(3))
+    
+    assert len(results) == 3
+    api_span = tracer.spans[-1]
+    assert api_span.name == "fake.get_many"
+    assert api_span.attributes["items"] == 3
+    assert len(tracer.children(api_span)) == 3
+
+
+def test_errors_are_recorded():
+    """A failing call records the exception on its span."""
+    tracer = Tracer()
+    
+    class Broken:
+        client = type("Client", (), {"tracer": tracer})()
+        
+        @traced("broken.call")
+        def call(self):
+            raise ValueError("boom")
+    
+    with pytest.raises(ValueError):
+        Broken().call()
+    assert isinstance(tracer.spans[0].error, ValueError)
+
+
+def test_no_tracer_is_a_no_op(server):
+    """Without a tracer no span is created."""
+    with HTTPClient("pat", retry=FAST) as client:
+        api = FakeAPI(client, server.url)
+        api.get()
+        assert list(api.get_many(2))
+        assert current_span() is None
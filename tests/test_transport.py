@@ -0,0 +1,108 @@
+"""Offline tests for base URLs, transport injection and connection pools."""
+
+import logging
+import socket
+
+import requests
+from urllib3.connection import HTTPConnection
+
+from benchmarks.mock_server import MockCnblogsServer
+from pycnblogs import CnblogsClient
+from pycnblogs.http_client import HTTPClient
+from pycnblogs.pool import SESSIONS, PoolAdapter, PoolConfig, SessionRegistry
+from pycnblogs.ratelimit import RateLimiter
+
+
+class RecordingSession(requests.Session):
+    """Session remembering the keyword arguments of every request."""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.closed = False
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return super().request(method, url, **kwargs)
+    
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def test_injected_session_and_base_urls(server):
+    """Requests go through the caller's session to the configured base URLs."""
+    session = RecordingSession()
+    with CnblogsClient(pat="test", session=session, **server.client_options) as client:
+        client.user.get_info()
+        client.post.get_count()
+    
+    assert [url for _, url, _ in session.calls] == [
+        f"{server.url}/openapi/users",
+        f"{server.url}/blog/posts/list",
+    ]
+    assert not session.closed
+    session.close()
+
+
+def test_proxies_are_passed_per_request():
+    """Proxies are sent with every request."""
+    proxies = {"https": "http://127.0.0.1:3128"}
+    calls = []
+    
+    def fake_request(method, url, **kwargs):
+        calls.append(kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+    
+    with HTTPClient("pat", proxies=proxies, retry=None) as client:
+        client.session.request = fake_request
+        assert client.get("https://api.cnblogs.com/api/users") == {}
+    assert calls[0]["proxies"] == proxies
+
+
+def test_rate_limiter_for_custom_base_urls():
+    """per_family can key its buckets by non-default base URLs."""
+    limiter = RateLimiter.per_family(5, 10, blog_backend_url="http://mirror/blog/", openapi_url="http://mirror/openapi")
+    assert limiter.bucket_for("http://mirror/blog/posts/1") is limiter.buckets["http://mirror/blog"]
+    assert limiter.bucket_for("http://mirror/openapi/users") is limiter.buckets["http://mirror/openapi"]
+
+
+def test_pool_config_socket_options():
+    """Keep-alive probes are configured on top of urllib3's defaults."""
+    options = PoolConfig(keepalive_idle=30).socket_options()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+    assert PoolConfig(keepalive=False).socket_options() == HTTPConnection.default_socket_options
+
+
+def test_pool_is_sized_for_concurrency(caplog):
+    """16 concurrent fetches fit the default pool without discarding connections."""
+    with MockCnblogsServer(posts=30, latency=0.01) as server, CnblogsClient(pat="test", **server.client_options) as client:
+        adapter = client._http_client.session.get_adapter(server.url)
+        assert isinstance(adapter, PoolAdapter)
+        assert adapter.poolmanager.connection_pool_kw["socket_options"] == PoolConfig().socket_options()
+        with caplog.at_level(logging.WARNING, logger="urllib3"):
+            results = list(client.post.get_many(range(1, 31), concurrency=16))
+    assert all(result.is_ok() for _, result in results)
+    assert "Connection pool is full" not in caplog.text
+
+
+def test_shared_sessions_by_pat():
+    """Clients with the same PAT and pool settings share one session that outlives them."""
+    registry = SessionRegistry()
+    first = registry.get("pat-a")
+    assert registry.get("pat-a") is first
+    assert registry.get("pat-b") is not first
+    assert registry.get("pat-a", PoolConfig(maxsize=64)) is not first
+    registry.close()
+    assert len(registry) == 0
+    
+    with HTTPClient("pat-c", share_session=True) as a:
+        session = a.session
+    with HTTPClient("pat-c", share_session=True) as b:
+        assert b.session is session
+    assert SESSIONS.get("pat-c") is session
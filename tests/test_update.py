@@ -0,0 +1,74 @@
+"""Offline tests for PostAPI.update: which updates read the post first."""
+
+from pycnblogs.client import PostAPI
+from pycnblogs.models import parse_post
+
+from .helpers import FakeBlog
+
+
+class FailingLoader:
+    """Body loader of a listed post; update must not trigger it."""
+    
+    def load(self, entry):
+        raise AssertionError("update() loaded the body through the lazy loader")
+
+
+def listed_post(post_id):
+    """A post as returned by a lazy listing: body not loaded, loader attached."""
+    entry = parse_post(FakeBlog(post_id).payload(post_id), with_body=False)
+    entry.__dict__["_body_loader"] = FailingLoader()
+    return entry
+
+
+def test_update_without_read():
+    """Updates with full or caller-supplied state cost one request."""
+    blog = FakeBlog(1)
+    posts = PostAPI(blog)
+    posts.update(1, title="t", body="b", publish=False)
+    base = posts.get_one(1)
+    posts.update(1, publish=False, base=base)
+    assert (blog.reads, blog.writes) == (1, 2)
+
+
+def test_update_detects_conflict():
+    """A stale expected_modify_time aborts the update with 409."""
+    blog = FakeBlog(1)
+    result = PostAPI(blog).update(1, publish=True, expected_modify_time="2020-01-01")
+    assert result.status_code == 409
+    assert blog.writes == 0
+
+
+def test_update_checks_the_server_version():
+    """expected_modify_time is compared with the server copy, even when a base is given."""
+    blog = FakeBlog(1)
+    posts = PostAPI(blog)
+    base = posts.get_one(1)
+    # The post is edited on the website between the read and the update
+    blog.posts[1].update(version=2, body="edited on web")
+    
+    stale = posts.update(1, body="local", base=base, expected_modify_time=base.modify_time)
+    assert stale.status_code == 409
+    assert blog.posts[1]["body"] == "edited on web"
+    
+    fresh = posts.get_one(1)
+    assert posts.update(1, body="local", base=fresh, expected_modify_time=fresh.modify_time) == 1
+    assert blog.posts[1]["body"] == "local"
+    assert (blog.reads, blog.writes) == (4, 1)
+
+
+def test_update_reads_unloaded_body_without_lazy_load():
+    """A listed base without its body is completed with one read, not through its loader."""
+    blog = FakeBlog(1)
+    posts = PostAPI(blog)
+    base = listed_post(1)
+    assert not base.is_body_loaded
+    
+    assert posts.update(1, publish=False, base=base) == 1
+    assert (blog.reads, blog.writes) == (1, 1)
+    # A new body needs nothing from the server
+    assert posts.update(1, body="new", base=listed_post(1)) == 1
+    assert (blog.reads, blog.writes) == (1, 2)
+    # The version check reads the server copy, never through the loader
+    modify_time = blog.payload(1)["dateUpdated"]
+    assert posts.update(1, body="new", base=listed_post(1), expected_modify_time=modify_time) == 1
+    assert (blog.reads, blog.writes) == (2, 3)